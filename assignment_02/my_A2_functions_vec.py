@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Vectorized Versions of the Functions
+# in Assignment 2
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+##################################################
+#
+# The functions in my_functions_soln.py use the math module,
+# so they accept only one number for each argument.
+# The versions below use numpy, so that each argument
+# can be a number or an array, and the arrays are broadcast
+# against each other, as in the operations on numpy arrays.
+# Instead of returning None and printing warnings,
+# they return np.nan for the elements with invalid arguments.
+#
+##################################################
+"""
+
+
+
+"""
+##################################################
+##################################################
+# Note: there should be no printing or calculations
+# in this script, aside from function definitions.
+##################################################
+##################################################
+"""
+
+
+
+##################################################
+# Import Required Modules
+##################################################
+
+import numpy as np
+
+
+
+##################################################
+# Function Definitions
+##################################################
+
+# Only function definitions here - no other calculations.
+
+# Assignment 2, Exercise 1
+
+def average_vec(num1: np.ndarray, num2: np.ndarray) -> np.ndarray:
+    """Return the averages of num1 and num2.
+
+    >>> average_vec(np.array([10, 2.5, 0.0]), np.array([20, 3.0, 0.0]))
+    array([15.  ,  2.75,  0.  ])
+    >>> average_vec(np.array([[1.0], [3.0]]), np.array([1.0, 5.0]))
+    array([[1., 3.],
+           [2., 4.]])
+    >>> float(average_vec(10, 20))
+    15.0
+    """
+
+    return (np.asarray(num1, dtype = float) + np.asarray(num2, dtype = float))/2
+
+
+# Assignment 2, Exercise 2
+
+def area_of_circle_vec(radius: np.ndarray) -> np.ndarray:
+    """Return the areas of circles with given radii.
+
+    >>> area_of_circle_vec(np.array([0.0, 1.0, 2.0]))/np.pi
+    array([0., 1., 4.])
+    >>> area_of_circle_vec(np.array([1.0/np.sqrt(np.pi)])).round(12)
+    array([1.])
+    >>> area_of_circle_vec(np.array([]))
+    array([], dtype=float64)
+    """
+
+    return np.pi*np.asarray(radius, dtype = float)**2
+
+
+# Assignment 2, Exercise 3
+
+def volume_of_cylinder_vec(radius: np.ndarray,
+                           height: np.ndarray) -> np.ndarray:
+    """Return the volumes of cylinders with given heights and
+    bases with given radii.
+
+    >>> volume_of_cylinder_vec(np.array([0.0, 1.0]), np.array([9.9, 1.0]))/np.pi
+    array([0., 1.])
+    >>> volume_of_cylinder_vec(np.array([1.0/np.pi]), np.pi).round(12)
+    array([1.])
+    >>> volume_of_cylinder_vec(1.0, np.array([1.0, 2.0, 3.0]))/np.pi
+    array([1., 2., 3.])
+    """
+
+    return np.pi*np.asarray(radius, dtype = float)**2*height
+
+
+# Assignment 2, Exercise 4
+
+def utility_vec(x: np.ndarray, y: np.ndarray,
+                alpha: np.ndarray) -> np.ndarray:
+    """Calculates the values of the Cobb-Douglass utility
+    function for consumption goods x and y with exponent alpha.
+    Negative values of goods with fractional exponents
+    return np.nan.
+
+    >>> utility_vec(np.array([0.0, 1.0, 4]), np.array([4.7, 1.0, 16]), \
+                    np.array([0.5, 0.75, 0.5]))
+    array([0., 1., 8.])
+    >>> utility_vec(4.0, 16.0, np.array([0.0, 0.5, 1.0]))
+    array([16.,  8.,  4.])
+    >>> utility_vec(np.array([-1.0]), 1.0, 0.5)
+    array([nan])
+    """
+
+    x = np.asarray(x, dtype = float)
+    y = np.asarray(y, dtype = float)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        utils = x**(alpha)*y**(1 - alpha)
+
+    return utils
+
+
+# Assignment 2, Exercise 5
+
+def logit_vec(x: np.ndarray, beta_0: np.ndarray,
+              beta_1: np.ndarray) -> np.ndarray:
+    """Calculates the values of the logit link function
+    for variables x and coefficients beta_0 and beta_1.
+    The function is calculated as 1/(1 + exp(-z)) for z >= 0
+    and exp(z)/(1 + exp(z)) for z < 0, so that it does not
+    overflow for large values of z.
+
+    >>> logit_vec(np.array([13.7, 0.0]), np.array([0.0, np.log(2)]), \
+                  np.array([0.0, 2.0])).round(6)
+    array([0.5     , 0.666667])
+    >>> logit_vec(1.0, 0.0, np.log(5)).round(12)
+    np.float64(0.833333333333)
+    >>> logit_vec(np.array([-1000.0, 1000.0]), 0.0, 1.0)
+    array([0., 1.])
+    """
+
+    z = beta_0 + np.asarray(x, dtype = float)*beta_1
+    # The exponential of a negative number cannot overflow.
+    exp_neg = np.exp(-abs(z))
+    link = np.where(z >= 0, 1/(1 + exp_neg), exp_neg/(1 + exp_neg))
+
+    return link
+
+
+
+# Only function definitions above this point.
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
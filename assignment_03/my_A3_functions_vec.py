@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Vectorized Versions of the Functions
+# in Assignment 3
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+##################################################
+#
+# The functions in my_A3_functions_soln.py use the math module,
+# so they accept only one number for each argument.
+# The versions below use numpy, so that each argument
+# can be a number or an array, and the arrays are broadcast
+# against each other, as in the operations on numpy arrays.
+# The vectorized versions of the functions in Assignment 2
+# are in my_A2_functions_vec.py in the folder for Assignment 2.
+# Instead of returning None and printing warnings,
+# they return np.nan for the elements with invalid arguments.
+#
+##################################################
+"""
+
+
+
+"""
+##################################################
+##################################################
+# Note: there should be no printing or calculations
+# in this script, aside from function definitions.
+##################################################
+##################################################
+"""
+
+
+
+##################################################
+# Import Required Modules
+##################################################
+
+import numpy as np
+
+
+
+##################################################
+# Function Definitions
+##################################################
+
+# Only function definitions here - no other calculations.
+
+# Assignment 3, Exercise 2
+
+def quad_roots_real_vec(a: np.ndarray, b: np.ndarray,
+                        c: np.ndarray) -> list:
+    """Real-valued roots [root_1, root_2] of the quadratic equations
+    a*x**2 + b*x + c
+    with the coefficients in the arrays a, b and c,
+    with the same special cases as quad_roots_real():
+    both roots are -c/b when a == 0,
+    the roots are [247, sqrt(pi)/11] when a, b and c are all zero,
+    and the roots are np.nan when a == b == 0 and c != 0
+    or when the roots are complex.
+    
+    The textbook formula subtracts nearly equal numbers 
+    in one of the roots when b**2 is much larger than 4*a*c. 
+    Instead, the larger root (in absolute value) is q/a, with 
+    q = -(b + sign(b)*sqrt(b**2 - 4*a*c))/2, 
+    which adds numbers of the same sign, 
+    and the smaller root is c/q, since the product of the roots is c/a. 
+    The roots are returned in the same order as in quad_roots_real(): 
+    root_1 has + sqrt(b**2 - 4*a*c) in the textbook formula.
+
+    >>> quad_roots_real_vec(np.array([1, 1, 2]), np.array([-2, 0, 2]), \
+                            np.array([1, -1, -12]))
+    [array([1., 1., 2.]), array([ 1., -1., -3.])]
+    >>> quad_roots_real_vec(np.array([0, 0, 0, 1.0]), np.array([0, 0, 4.0, 0]), \
+                            np.array([0, 7.0, 2.0, 1.0]))[1]
+    array([ 0.16113217,         nan, -0.5       ,         nan])
+    >>> [root.tolist() for root in quad_roots_real_vec(1, [-3, 10**8], [2, 1])]
+    [[2.0, -1e-08], [1.0, -100000000.0]]
+    """
+
+    a, b, c = np.broadcast_arrays(*[np.asarray(coef, dtype = float)
+                                    for coef in [a, b, c]])
+    disc = b**2 - 4*a*c
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        num_2 = np.sqrt(disc)
+        # Take sign(0) = 1, so that q = 0 only if both roots are zero.
+        q = -(b + np.where(b >= 0, num_2, - num_2))/2
+        root_large = q/a
+        root_small = np.where(q == 0, 0.0, c/q)
+        root_1 = np.where(b >= 0, root_small, root_large)
+        root_2 = np.where(b >= 0, root_large, root_small)
+        linear_root = -c/b
+
+    # The same conditions as in quad_roots_real(),
+    # with np.select() taking the first condition that applies.
+    conditions = [(a == 0) & (b == 0) & (c == 0),
+                  (a == 0) & (b == 0),
+                  a == 0,
+                  disc < 0]
+    root_1 = np.select(conditions, [247, np.nan, linear_root, np.nan], root_1)
+    root_2 = np.select(conditions, [np.sqrt(np.pi)/11, np.nan, linear_root, np.nan],
+                       root_2)
+
+    return [root_1, root_2]
+
+
+# Assignment 3, Exercise 3
+
+def utility_positive_vec(x: np.ndarray, y: np.ndarray,
+                         alpha: np.ndarray) -> np.ndarray:
+    """Calculates the values of the Cobb-Douglass utility
+    function for consumption goods x and y with exponent alpha.
+    It restricts x and y to non-negative values and
+    alpha to the unit interval, returning np.nan otherwise.
+
+    >>> utility_positive_vec(np.array([1.0, 4]), np.array([1.0, 16]), \
+                             np.array([0.75, 0.5]))
+    array([1., 8.])
+    >>> utility_positive_vec(np.array([0.0, -1.0, 1.0]), \
+                             np.array([-4.7, 1.0, 1.0]), 0.5)
+    array([nan, nan,  1.])
+    >>> utility_positive_vec(1.0, 1.0, np.array([-0.5, 1.5]))
+    array([nan, nan])
+    """
+
+    x, y, alpha = np.broadcast_arrays(*[np.asarray(arg, dtype = float)
+                                        for arg in [x, y, alpha]])
+    valid = (x >= 0) & (y >= 0) & (alpha >= 0) & (alpha <= 1)
+
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        utils = x**(alpha)*y**(1 - alpha)
+
+    return np.where(valid, utils, np.nan)
+
+
+# Assignment 3, Exercise 4
+
+def logit_like_vec(y: np.ndarray, x: np.ndarray,
+                   beta_0: np.ndarray, beta_1: np.ndarray) -> np.ndarray:
+    """Calculates the values of the log-likelihood function
+    of the logistic regression model for each observation
+    of the binary variable y and the variable x,
+    returning np.nan where y is not 0 or 1.
+    The logarithms of the link function are calculated
+    with np.logaddexp(), so that they do not overflow.
+
+    >>> logit_like_vec(np.array([1, 0, 1]), np.array([13.7, 0.0, 1.0]), \
+                       np.array([0.0, np.log(2), 0.0]), \
+                       np.array([0.0, 2.0, np.log(5)])).round(12)
+    array([-0.69314718, -1.09861229, -0.18232156])
+    >>> logit_like_vec(np.array([0, 1]), 1000.0, 0.0, 1.0)
+    array([-1000.,    -0.])
+    >>> logit_like_vec(np.array([7, 1]), 1.0, 0.0, 0.0).round(12)
+    array([        nan, -0.69314718])
+    """
+
+    y = np.asarray(y)
+    z = beta_0 + np.asarray(x, dtype = float)*beta_1
+    # log(link) = -log(1 + exp(-z)) and log(1 - link) = -log(1 + exp(z)).
+    like = np.where(y == 1, - np.logaddexp(0, -z), - np.logaddexp(0, z))
+
+    return np.where((y == 0) | (y == 1), like, np.nan)
+
+
+
+# Only function definitions above this point.
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Timing the Solutions of Quadratic Equations
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the number of quadratic equations
+# solved per second with quad_roots_real(), in a loop,
+# and with quad_roots_real_vec(), on arrays of coefficients.
+# It also compares the accuracy of the smaller root
+# from the textbook formula and from the formula
+# in quad_roots_real_vec(), when b**2 is much larger than 4*a*c.
+#
+##################################################
+"""
+
+import time
+import contextlib
+import io
+
+import numpy as np
+
+from my_A3_functions_vec import quad_roots_real_vec
+
+# my_A3_functions_soln.py prints its tests when it is imported.
+with contextlib.redirect_stdout(io.StringIO()):
+    from my_A3_functions_soln import quad_roots_real
+
+
+def random_coefs(n):
+    """ (int) -> list
+
+    Return a list [a, b, c] of arrays of n random coefficients,
+    about half of which have real roots.
+    """
+
+    rng = np.random.default_rng(n)
+
+    return [rng.standard_normal(n) for i in range(3)]
+
+
+def roots_per_second(n, vectorized):
+    """ (int, bool) -> float
+
+    Return the number of quadratic equations solved per second
+    with quad_roots_real_vec(), if vectorized is True,
+    or quad_roots_real() in a loop, otherwise.
+    """
+
+    a, b, c = random_coefs(n)
+
+    t1 = time.perf_counter()
+    if vectorized:
+        quad_roots_real_vec(a, b, c)
+    else:
+        for i in range(n):
+            quad_roots_real(a[i], b[i], c[i])
+    t2 = time.perf_counter()
+
+    return n/(t2 - t1)
+
+
+def print_accuracy(b):
+    """ (float) -> NoneType
+
+    Print the smaller root of x**2 + b*x + 1, which is close
+    to -1/b, and the residual from substituting each root
+    into the equation, for the textbook formula and quad_roots_real_vec().
+    """
+
+    root_textbook = (- b + np.sqrt(b**2 - 4))/2
+    root_stable = quad_roots_real_vec(1.0, b, 1.0)[0]
+
+    print("{0:10.0e}\t{1:22.15e}\t{2:10.2e}\t{3:22.15e}\t{4:10.2e}".format(
+            b, root_textbook, root_textbook**2 + b*root_textbook + 1,
+            root_stable, root_stable**2 + b*root_stable + 1))
+
+
+if __name__ == '__main__':
+
+    print("Quadratic equations solved per second")
+    print('n', 'loop', 'vectorized', sep='\t\t')
+    for n in [10**3, 10**4, 10**5, 10**6, 10**7]:
+        print(n, end='\t\t')
+        if n <= 10**5:
+            print("{0:10.3e}".format(roots_per_second(n, False)), end='\t')
+        else:
+            print("{0:>10}".format('-'), end='\t')
+        print("{0:10.3e}".format(roots_per_second(n, True)))
+
+    print()
+    print("Smaller root of x**2 + b*x + 1 and its residual")
+    print('b', 'textbook', 'residual', 'stable', 'residual', sep='\t\t')
+    for b in [10.0**2, 10.0**4, 10.0**6, 10.0**8]:
+        print_accuracy(b)
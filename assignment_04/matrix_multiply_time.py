@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Timing the Matrix Multiplication Functions
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the time to multiply square matrices
+# with the loops in matrix_multiply_loops()
+# and with matrix_multiply(), which calls np.matmul()
+# for numbers and matrix_multiply_blocked() 
+# for Python objects, such as exact fractions.
+#
+##################################################
+"""
+
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from my_A4_functions_soln import matrix_multiply_loops
+from my_A4_functions_soln import matrix_multiply
+
+
+def time_multiply(multiply, mat_1, mat_2):
+    """ (function, np.array, np.array) -> number
+
+    Return the number of milliseconds it takes for 
+    multiply(mat_1, mat_2) to run.
+    """
+
+    t1 = time.perf_counter()
+    multiply(mat_1, mat_2)
+    t2 = time.perf_counter()
+
+    return (t2 - t1) * 1000.0
+
+
+def print_times(size):
+    """ (int) -> NoneType
+
+    Print the number of milliseconds it takes to multiply 
+    two random size x size matrices of floating point numbers
+    with loops and with np.matmul(), 
+    the same matrices stored as Python objects with blocked loops,
+    and, for size up to 100, matrices of exact fractions 
+    with blocked loops.
+    """
+
+    rng = np.random.default_rng(size)
+    mat_1 = rng.standard_normal((size, size))
+    mat_2 = rng.standard_normal((size, size))
+
+    print(size, end='\t')
+    loops_time = time_multiply(matrix_multiply_loops, mat_1, mat_2)
+    matmul_time = time_multiply(matrix_multiply, mat_1, mat_2)
+    blocked_time = time_multiply(matrix_multiply, 
+                                 mat_1.astype(object), mat_2.astype(object))
+    print("{0:10.1f}\t{1:8.3f}\t{2:10.1f}".format(
+            loops_time, matmul_time, blocked_time), end='\t')
+
+    if size <= 100:
+        # The same matrices as fractions with small denominators.
+        frac_1 = np.array([[Fraction(int(a*100), 100) for a in row] for row in mat_1])
+        frac_2 = np.array([[Fraction(int(a*100), 100) for a in row] for row in mat_2])
+        frac_time = time_multiply(matrix_multiply, frac_1, frac_2)
+        print("{0:10.1f}".format(frac_time))
+    else:
+        print()
+
+
+print("size\t     loops\t  matmul\t   blocked\t fractions")
+for size in [10, 50, 100, 200]:
+    print_times(size)
@@ -41,36 +41,29 @@ import doctest
 # To see the changes, click on the commit message
 # at the top pf the page in any file on the GitHub repo. 
 
-def matrix_multiply(mat_1, mat_2):
-    """Multiplies two matrices together using loops.
-    mat_1 has dimension m_1 and n_1
-    mat_2 has dimension m_2 and n_2
-    To be conformable, n_1 == m_2.
-    It returns a matrix mat_out with n_1 rows and m_2 columns.
+def matrix_conform(mat_1, mat_2):
+    """Converts mat_1 and mat_2 to two-dimensional np.arrays
+    and checks that they are conformable for multiplication.
+    It returns the list [mat_1, mat_2], 
+    or None if the matrices are not conformable.
     
     mat_1 and mat_2 can be lists or np.arrays. 
     A list like [[1],[4],[6],[3],[8]] is a 5x1 column vector.
     A list like [1,4,6,3,8] is converted to a 1x5 row vector.
     
-    Note that this version has a large header 
-    to make the function robust to variation in the form of inputs.
-    Your function does not have to accommodate every *type* of input
-    but it should work for matrics of arbitrary size.
-    
-    
-    >>> matrix_multiply(np.array([[1., 2.], [3., 4.]]), np.array([1., 1.]).reshape(2,1))
-    array([[3.],
-           [7.]])
-    >>> matrix_multiply(np.array(range(4)), np.full((4,1), 5))
-    array([[30.]])
-    >>> matrix_multiply([[1], [2]], [3, 4])
-    array([[3., 4.],
-           [6., 8.]])
+    >>> matrix_conform([1, 2], [[3], [4]])
+    [array([[1, 2]]), array([[3],
+           [4]])]
+    >>> [np.shape(mat) for mat in matrix_conform(np.zeros((2, 3)), np.zeros((3, 4)))]
+    [(2, 3), (3, 4)]
+    >>> matrix_conform(np.zeros((2, 3)), np.zeros((2, 3)))
+    Error: Matrices are not conformable.
+    m_1 =  2 n_1 =  3
+    and m_2 =  2 n_1 =  3
+    Make sure n_1 (# columns of mat_1) = m_2 (# rows of mat_2).
     
     """
     
-    # Docstring has to go above the body of the function. 
-    
     # First, change the input to np.array type, 
     # in case it is a list.
     mat_1 = np.array(mat_1)
@@ -98,6 +91,38 @@ def matrix_multiply(mat_1, mat_2):
         print('Make sure n_1 (# columns of mat_1) = m_2 (# rows of mat_2).')
         return None
     else:
+        return [mat_1, mat_2]
+
+
+def matrix_multiply_loops(mat_1, mat_2):
+    """Multiplies two matrices together using loops.
+    mat_1 has dimension m_1 and n_1
+    mat_2 has dimension m_2 and n_2
+    To be conformable, n_1 == m_2.
+    It returns a matrix mat_out with n_1 rows and m_2 columns.
+    
+    This is the original solution to Exercise 1,
+    kept to compare with matrix_multiply(). 
+    
+    >>> matrix_multiply_loops(np.array([[1., 2.], [3., 4.]]), np.array([1., 1.]).reshape(2,1))
+    array([[3.],
+           [7.]])
+    >>> matrix_multiply_loops(np.array(range(4)), np.full((4,1), 5))
+    array([[30.]])
+    >>> matrix_multiply_loops([[1], [2]], [3, 4])
+    array([[3., 4.],
+           [6., 8.]])
+    
+    """
+    
+    mats = matrix_conform(mat_1, mat_2)
+    if mats is None:
+        return None
+    else:
+        mat_1, mat_2 = mats
+        m_1, n_1 = np.shape(mat_1)
+        m_2, n_2 = np.shape(mat_2)
+        
         # Initialize the output matrix.
         mat_out = np.zeros((m_1, n_2))   
         # Then loop down the rows.
@@ -115,6 +140,119 @@ def matrix_multiply(mat_1, mat_2):
                 
         return mat_out
 
+
+def matrix_multiply_blocked(mat_1, mat_2, block_size = 64):
+    """Multiplies two conformable two-dimensional np.arrays
+    using loops over blocks of block_size rows and columns,
+    so that each block of mat_2 is reused while it is in memory.
+    
+    The elements can be any objects that can be added and multiplied,
+    such as Fraction or Decimal, 
+    and the output is an np.array of objects of the same kind, 
+    without rounding to floating point.
+    
+    >>> from fractions import Fraction
+    >>> matrix_multiply_blocked(np.array([[Fraction(1, 3), 1]]), 
+    ...                         np.array([[3], [Fraction(1, 2)]]))
+    array([[Fraction(3, 2)]], dtype=object)
+    >>> matrix_multiply_blocked(np.array([[1, 2], [3, 4]]), 
+    ...                         np.array([[1, 0], [0, 1]]), block_size = 1)
+    array([[1, 2],
+           [3, 4]], dtype=object)
+    >>> matrix_multiply_blocked(np.zeros((2, 0)), np.zeros((0, 3)))
+    array([[0, 0, 0],
+           [0, 0, 0]], dtype=object)
+    
+    """
+    
+    m_1, n_1 = np.shape(mat_1)
+    m_2, n_2 = np.shape(mat_2)
+    
+    # Lists of lists are faster to index than np.arrays of objects.
+    rows_1 = mat_1.tolist()
+    rows_2 = mat_2.tolist()
+    rows_out = [[0]*n_2 for i in range(m_1)]
+    
+    # Loop over blocks of rows of mat_1, of the inner dimension 
+    # and of columns of mat_2.
+    for i_0 in range(0, m_1, block_size):
+        for k_0 in range(0, n_1, block_size):
+            for j_0 in range(0, n_2, block_size):
+                j_1 = min(j_0 + block_size, n_2)
+                
+                # Within a block, each mat_1[i][k] multiplies 
+                # a stretch of row k of mat_2.
+                for i in range(i_0, min(i_0 + block_size, m_1)):
+                    row_out = rows_out[i]
+                    row_1 = rows_1[i]
+                    for k in range(k_0, min(k_0 + block_size, n_1)):
+                        a_ik = row_1[k]
+                        row_2 = rows_2[k]
+                        for j in range(j_0, j_1):
+                            row_out[j] = row_out[j] + a_ik*row_2[j]
+    
+    mat_out = np.empty((m_1, n_2), dtype = object)
+    for i in range(m_1):
+        for j in range(n_2):
+            mat_out[i, j] = rows_out[i][j]
+    
+    return mat_out
+
+
+def matrix_multiply(mat_1, mat_2):
+    """Multiplies two matrices together.
+    mat_1 has dimension m_1 and n_1
+    mat_2 has dimension m_2 and n_2
+    To be conformable, n_1 == m_2.
+    It returns a matrix mat_out with n_1 rows and m_2 columns.
+    
+    mat_1 and mat_2 can be lists or np.arrays. 
+    A list like [[1],[4],[6],[3],[8]] is a 5x1 column vector.
+    A list like [1,4,6,3,8] is converted to a 1x5 row vector.
+    
+    Note that this version has a large header 
+    to make the function robust to variation in the form of inputs.
+    Your function does not have to accommodate every *type* of input
+    but it should work for matrics of arbitrary size.
+    
+    Numeric matrices are multiplied with np.matmul(), 
+    which calls the optimized linear algebra library, 
+    and the result is in floating point, as with the loops.
+    Matrices of other objects, such as Fraction or Decimal, 
+    are multiplied with matrix_multiply_blocked(), 
+    which keeps the exact values.
+    
+    >>> matrix_multiply(np.array([[1., 2.], [3., 4.]]), np.array([1., 1.]).reshape(2,1))
+    array([[3.],
+           [7.]])
+    >>> matrix_multiply(np.array(range(4)), np.full((4,1), 5))
+    array([[30.]])
+    >>> matrix_multiply([[1], [2]], [3, 4])
+    array([[3., 4.],
+           [6., 8.]])
+    >>> from fractions import Fraction
+    >>> matrix_multiply([Fraction(1, 3), Fraction(2, 3)], [[3], [3]])
+    array([[Fraction(3, 1)]], dtype=object)
+    
+    """
+    
+    # Docstring has to go above the body of the function. 
+    
+    mats = matrix_conform(mat_1, mat_2)
+    if mats is None:
+        return None
+    else:
+        mat_1, mat_2 = mats
+        
+        # Boolean, integer, unsigned and floating point types
+        # are converted to floating point, as in the loops.
+        if mat_1.dtype.kind in 'biuf' and mat_2.dtype.kind in 'biuf':
+            return np.matmul(mat_1.astype(float), mat_2.astype(float))
+        elif mat_1.dtype.kind in 'biufc' and mat_2.dtype.kind in 'biufc':
+            return np.matmul(mat_1, mat_2)
+        else:
+            return matrix_multiply_blocked(mat_1, mat_2)
+
 # Indenting returns to margin after body of function.
 # Also notice the specific indenting pattern in 
 # each block of the loops above. 
@@ -170,6 +308,105 @@ def ssr_vec(y, x, beta_0, beta_1):
     return ssr
 
 
+# Evaluating the SSR for many pairs of coefficients:
+# The SSR is a quadratic function of beta_0 and beta_1, 
+# so the data enter only through a few sums, 
+# which can be calculated once. 
+
+def ssr_stats(y, x):
+    """Calculates the sufficient statistics for the 
+    sum of squared residuals of the bivariate linear regression model:
+    the list [n, y_bar, x_bar, S_yy, S_xy, S_xx]
+    of the number of observations, the means of y and x
+    and the sums of squares and cross products of the deviations
+    from the means. 
+    
+    >>> ssr_stats([2, 2, 2], [1, 1, 1])
+    [3, 2.0, 1.0, 0.0, 0.0, 0.0]
+    >>> ssr_stats([3, 0, 3], [0, 2, 2])
+    [3, 2.0, 1.3333333333333333, 6.0, -2.0, 2.666666666666667]
+    >>> ssr_stats([2, 3, 4], [1, 2, 3])
+    [3, 3.0, 2.0, 2.0, 2.0, 2.0]
+
+    """
+    
+    y = np.asarray(y, dtype = float)
+    x = np.asarray(x, dtype = float)
+    
+    n = len(y)
+    y_bar = np.mean(y)
+    x_bar = np.mean(x)
+    y_dev = y - y_bar
+    x_dev = x - x_bar
+    
+    return [n, float(y_bar), float(x_bar), float(y_dev.dot(y_dev)), 
+            float(x_dev.dot(y_dev)), float(x_dev.dot(x_dev))]
+
+
+def ssr_from_stats(stats, beta_0, beta_1):
+    """Calculates the sum of squared residuals for 
+    the bivariate linear regression model
+    from the list stats calculated by ssr_stats(). 
+    beta_0 and beta_1 can be scalars or np.arrays 
+    of the same shape (or any shapes that broadcast together)
+    and the output has that shape. 
+    Each value costs a few arithmetic operations, 
+    whatever the number of observations. 
+    
+    The expansion 
+    S_yy - 2*beta_1*S_xy + beta_1**2*S_xx + n*a**2, 
+    with a = beta_0 + beta_1*x_bar - y_bar, 
+    is the expansion of the sum of squares in terms of 
+    sum(y), sum(x*y), sum(x**2), etc., 
+    after subtracting the means, 
+    which avoids subtracting large, nearly equal numbers. 
+    
+    >>> ssr_from_stats(ssr_stats([2, 2, 2], [1, 1, 1]), [0.5], [0.5])
+    array([3.])
+    >>> ssr_from_stats(ssr_stats([3, 0, 3], [0, 2, 2]), 
+    ...                np.array([1.0, 0.0]), np.array([0.5, 0.0]))
+    array([ 9., 18.])
+    >>> ssr_from_stats(ssr_stats([2, 3, 4], [1, 2, 3]), 
+    ...                np.array([[1.0], [0.0]]), np.array([1.0, 2.0]))
+    array([[ 0., 14.],
+           [ 3.,  5.]])
+
+    """
+    
+    n, y_bar, x_bar, S_yy, S_xy, S_xx = stats
+    beta_0 = np.asarray(beta_0, dtype = float)
+    beta_1 = np.asarray(beta_1, dtype = float)
+    
+    a = beta_0 + beta_1*x_bar - y_bar
+    
+    return S_yy - 2*beta_1*S_xy + beta_1**2*S_xx + n*a**2
+
+
+def ssr_batch(y, x, beta_0, beta_1):
+    """Calculates the sum of squared residuals for 
+    the bivariate linear regression model
+    for every pair of coefficients in beta_0 and beta_1, 
+    which can be scalars or np.arrays that broadcast together. 
+    The data are summarized once with ssr_stats(), 
+    so the cost of each pair does not depend on the 
+    number of observations. 
+    For repeated calls on the same data, 
+    calculate ssr_stats(y, x) once and call ssr_from_stats(). 
+    
+    >>> ssr_batch([2, 2, 2], [1, 1, 1], [0.5, 1.0], [0.5, 1.0])
+    array([3., 0.])
+    >>> ssr_batch([3, 0, 3], [0, 2, 2], [1.0], [0.5])
+    array([9.])
+    >>> ssr_batch([2, 3, 4], [1, 2, 3], 
+    ...           *np.meshgrid([0.0, 1.0], [1.0, 2.0], indexing = 'ij'))
+    array([[ 3.,  5.],
+           [ 0., 14.]])
+
+    """
+    
+    return ssr_from_stats(ssr_stats(y, x), beta_0, beta_1)
+
+
 # Exercise 4
 
 # First, review the example from Assignment 3:
@@ -237,6 +474,73 @@ def logit_like_sum(y: list, x: list, beta_0: float, beta_1: float) -> float:
     
     return like_sum
 
+# The loop above calls math.exp() twice for every observation. 
+# With np.arrays, the likelihood can be calculated for all observations
+# and for a whole grid of coefficients at once:
+
+def logit_like_array(y, x, beta_0, beta_1, max_cells = 2**20):
+    """Calculates the value of the likelihood function
+    for the bivariate logistic regression model
+    for all observations in the lists or arrays x and y
+    and coefficients beta_0 and beta_1.
+    
+    beta_0 and beta_1 can be scalars or np.arrays 
+    that broadcast together, such as the output of np.meshgrid(), 
+    and the output is the likelihood for each pair of coefficients, 
+    with the same shape. 
+    The observations are taken in chunks, and the likelihood 
+    is added up over the chunks, so that the arrays 
+    for each chunk have at most about max_cells elements, 
+    one for each observation in the chunk and each pair of coefficients, 
+    and the memory needed stays near the size of the grid. 
+    
+    The likelihood of each observation is 
+    y*z - log(1 + exp(z)), with z = beta_0 + x*beta_1, 
+    and np.logaddexp(0, z) calculates log(1 + exp(z))
+    without overflow for large values of z. 
+    
+    >>> logit_like_array([1, 1, 1], [13.7, 12, 437], 0.0, 0.0)
+    -2.0794415416798357
+    >>> logit_like_array([1, 0], [1, 1], 0.0, math.log(2))
+    -1.5040773967762737
+    >>> logit_like_array([1, 0], [2, 3], np.array([0.0, math.log(5)]), math.log(2))
+    array([-2.42036813, -3.76236223])
+    >>> logit_like_array([1, 0], [1000, 1000], 0.0, 1.0)
+    -1000.0
+    >>> logit_like_array([1, 2], [1, 1], 0.0, 1.0)
+    Error: Observations in y must be either zero or one.
+    >>> b_0, b_1 = np.meshgrid(np.arange(-1, 1, 0.5), np.arange(0, 2, 0.5))
+    >>> bool(np.allclose(logit_like_array([1, 0, 1, 1, 0], [1, 2, 3, 4, 5], b_0, b_1), 
+    ...                  logit_like_array([1, 0, 1, 1, 0], [1, 2, 3, 4, 5], b_0, b_1, 
+    ...                                   max_cells = 32)))
+    True
+    """
+    
+    y = np.asarray(y, dtype = float)
+    x = np.asarray(x, dtype = float)
+    if not np.all((y == 0) | (y == 1)):
+        print('Error: Observations in y must be either zero or one.')
+        return None
+    
+    # Add a last dimension for the observations.
+    beta_0 = np.asarray(beta_0, dtype = float)[..., None]
+    beta_1 = np.asarray(beta_1, dtype = float)[..., None]
+    grid_shape = np.broadcast(beta_0, beta_1).shape[:-1]
+    
+    # Take as many observations at a time as fit in max_cells. 
+    chunk_size = max(1, max_cells//max(1, int(np.prod(grid_shape))))
+    like_sum = np.zeros(grid_shape)
+    for start in range(0, len(y), chunk_size):
+        y_chunk = y[start:start + chunk_size]
+        z = beta_0 + x[start:start + chunk_size]*beta_1
+        like_sum += np.sum(y_chunk*z - np.logaddexp(0, z), axis = -1)
+    
+    if np.ndim(like_sum) == 0:
+        return float(like_sum)
+    else:
+        return like_sum
+
+
 # Indenting should return to the margin after the last return statement 
 # in each function definition. 
 
@@ -224,10 +224,234 @@ def ssr(y: np.ndarray, x: np.ndarray,
 
 # Exercise 6
 
+def ssr_grid(y: np.ndarray, x: np.ndarray, 
+             beta_0_list: np.ndarray, beta_1_list: np.ndarray) -> np.ndarray:
+    """
+    Calculates the sum of squared residuals for 
+    the bivariate linear regression model
+    for every pair of values in the vector arrays 
+    beta_0_list and beta_1_list, at once. 
+    Element [i, j] is the SSR at beta_0_list[i] and beta_1_list[j].
+    
+    The squared residuals are added in the same order
+    as in ssr(), one observation at a time, 
+    so each element is exactly the value returned by ssr(). 
+    
+    >>> ssr_grid([2, 2, 2], [1, 1, 1], [0.5], [0.5]).tolist()
+    [[3.0]]
+    >>> ssr_grid([2, 3, 4], [1, 2, 3], [0.0, 1.0], [1.0]).tolist()
+    [[3.0], [0.0]]
+    >>> ssr_grid([3, 0, 3], [0, 2, 2], [1.0], [0.0, 0.5]).tolist()
+    [[9.0, 9.0]]
+    
+    """
+    
+    beta_0_col = np.array(beta_0_list, dtype = float)[:, None]
+    beta_1_row = np.array(beta_1_list, dtype = float)[None, :]
+    
+    # Accumulate over observations, rather than building 
+    # a three-dimensional array of residuals. 
+    ssr_ij = np.zeros((beta_0_col.shape[0], beta_1_row.shape[1]))
+    for y_k, x_k in zip(np.array(y), np.array(x)):
+        ssr_ij += (y_k - beta_0_col - beta_1_row*x_k)**2
+    
+    return ssr_ij
+
+
+def min_ssr_grid(y: np.ndarray, x: np.ndarray, 
+                 beta_0_list: np.ndarray, beta_1_list: np.ndarray, 
+                 min_SSR: float, tile_size: int) -> list:
+    """
+    Finds the indices [i_min, j_min, min_SSR] of the lowest SSR 
+    below min_SSR on the grid of beta_0_list and beta_1_list.
+    The grid is evaluated in tiles of rows 
+    with about tile_size elements, 
+    so that memory does not grow with the size of the grid.
+    
+    Ties are broken in favor of the first pair 
+    in the order of the loops in min_ssr(), 
+    since np.argmin() returns the first minimum 
+    and a later tile replaces it only when it is strictly lower.
+    The indices are None if no SSR is lower than min_SSR. 
+    
+    >>> min_ssr_grid([2, 3, 4], [1, 2, 3], [0.0, 1.0], [1.0, 2.0], 999999, 1)[0:2]
+    [1, 0]
+    >>> min_ssr_grid([2, 2, 2], [1, 1, 1], [0.0, 1.0], [1.0, 2.0], 999999, 4)[0:2]
+    [0, 1]
+    >>> min_ssr_grid([2, 2, 2], [1, 1, 1], [0.0], [1.0], 1.0, 4)
+    [None, None, 1.0]
+    >>> min_ssr_grid([2, 2, 2], [1, 1, 1], [0.0, 1.0], [], 999999, 4)
+    [None, None, 999999]
+    
+    """
+    
+    num_rows = max(1, tile_size//max(1, len(beta_1_list)))
+    i_min = None
+    j_min = None
+    
+    for i_start in range(0, len(beta_0_list), num_rows):
+        
+        ssr_tile = ssr_grid(y, x, beta_0_list[i_start:i_start + num_rows], 
+                            beta_1_list)
+        # Missing values are never accepted in the loops either. 
+        ssr_tile[np.isnan(ssr_tile)] = np.inf
+        if ssr_tile.size == 0:
+            break
+        
+        k_tile = np.argmin(ssr_tile)
+        i_tile, j_tile = np.unravel_index(k_tile, ssr_tile.shape)
+        
+        if ssr_tile[i_tile, j_tile] < min_SSR:
+            min_SSR = ssr_tile[i_tile, j_tile]
+            i_min = i_start + int(i_tile)
+            j_min = int(j_tile)
+    
+    return [i_min, j_min, min_SSR]
+
+
+def ssr_grad_points(y: np.ndarray, x: np.ndarray, 
+                    beta_0: np.ndarray, beta_1: np.ndarray) -> list:
+    """
+    Calculates the sum of squared residuals and its derivatives 
+    with respect to beta_0 and beta_1 
+    at each pair of values in the vector arrays beta_0 and beta_1.
+    Returns the list [SSR, d_beta_0, d_beta_1] of arrays.
+    
+    As in ssr_grid(), the SSR is exactly the value returned by ssr(). 
+    
+    >>> [v.tolist() for v in ssr_grad_points([2, 3, 4], [1, 2, 3], [1.0], [1.0])]
+    [[0.0], [0.0], [0.0]]
+    >>> [v.tolist() for v in ssr_grad_points([2, 2, 2], [1, 1, 1], [0.5], [0.5])]
+    [[3.0], [-6.0], [-6.0]]
+    >>> [v.tolist() for v in ssr_grad_points([3, 0, 3], [0, 2, 2], [1.0, 1.0], [0.5, 0.0])]
+    [[9.0, 9.0], [-2.0, -6.0], [4.0, -4.0]]
+    
+    """
+    
+    beta_0 = np.array(beta_0, dtype = float)
+    beta_1 = np.array(beta_1, dtype = float)
+    
+    ssr_k = np.zeros(beta_0.shape)
+    d_beta_0 = np.zeros(beta_0.shape)
+    d_beta_1 = np.zeros(beta_0.shape)
+    for y_k, x_k in zip(np.array(y), np.array(x)):
+        resid = y_k - beta_0 - beta_1*x_k
+        ssr_k += resid**2
+        d_beta_0 -= 2*resid
+        d_beta_1 -= 2*resid*x_k
+    
+    return [ssr_k, d_beta_0, d_beta_1]
+
+
+def min_ssr_refine(y: np.ndarray, x: np.ndarray, 
+                   beta_0_list: np.ndarray, beta_1_list: np.ndarray, 
+                   min_SSR: float, zoom: int) -> list:
+    """
+    Finds the indices [i_min, j_min, min_SSR] of the lowest SSR 
+    below min_SSR on the grid of beta_0_list and beta_1_list
+    by coarse-to-fine search.
+    
+    The grid is divided into blocks of zoom**k by zoom**k values. 
+    The SSR and its slope at the center of each block 
+    give a lower bound for the SSR on the whole block, 
+    because the SSR is a convex function of beta_0 and beta_1. 
+    Blocks with a lower bound above the lowest SSR found so far
+    cannot hold the minimum and are dropped,
+    and the remaining blocks are divided into blocks 
+    zoom times smaller, until each block is a single pair of values. 
+    The result is the same as in min_ssr_grid(), 
+    including the choice between tied values, 
+    after calculating the SSR for only a small part of the grid. 
+    
+    >>> min_ssr_refine([2, 3, 4], [1, 2, 3], np.arange(0, 2, 0.5), \
+                       np.arange(0, 2, 0.5), 999999, 2)[0:2]
+    [2, 2]
+    >>> min_ssr_refine([2, 2, 2], [1, 1, 1], np.array([0.0, 1.0]), \
+                       np.array([1.0, 2.0]), 999999, 10)[0:2]
+    [0, 1]
+    >>> min_ssr_refine([2, 2, 2], [1, 1, 1], np.array([0.0]), \
+                       np.array([1.0]), 1.0, 10)
+    [None, None, 1.0]
+    >>> min_ssr_refine([2, 2, 2], [1, 1, 1], np.arange(0, 5, 0.1), \
+                       np.array([]), 999999, 10)
+    [None, None, 999999]
+    
+    """
+    
+    num_0 = len(beta_0_list)
+    num_1 = len(beta_1_list)
+    if num_0 == 0 or num_1 == 0:
+        return [None, None, min_SSR]
+    
+    # Start with blocks that divide the grid about zoom times. 
+    spacing = 1
+    while spacing*zoom < max(num_0, num_1):
+        spacing = spacing*zoom
+    
+    # The corners of the blocks still under consideration. 
+    i_start, j_start = np.meshgrid(np.arange(0, num_0, spacing), 
+                                   np.arange(0, num_1, spacing), 
+                                   indexing = 'ij')
+    i_start = i_start.ravel()
+    j_start = j_start.ravel()
+    
+    while True:
+        
+        i_end = np.minimum(i_start + spacing, num_0) - 1
+        j_end = np.minimum(j_start + spacing, num_1) - 1
+        i_mid = np.minimum(i_start + spacing//2, i_end)
+        j_mid = np.minimum(j_start + spacing//2, j_end)
+        
+        ssr_mid, d_beta_0, d_beta_1 = ssr_grad_points(y, x, 
+                                                      beta_0_list[i_mid], 
+                                                      beta_1_list[j_mid])
+        ssr_mid[np.isnan(ssr_mid)] = np.inf
+        
+        if spacing == 1:
+            break
+        
+        # Bound the SSR on each block from below 
+        # by the tangent plane at the center. 
+        dist_0 = np.maximum(abs(beta_0_list[i_mid] - beta_0_list[i_start]), 
+                            abs(beta_0_list[i_end] - beta_0_list[i_mid]))
+        dist_1 = np.maximum(abs(beta_1_list[j_mid] - beta_1_list[j_start]), 
+                            abs(beta_1_list[j_end] - beta_1_list[j_mid]))
+        slope_term = abs(d_beta_0)*dist_0 + abs(d_beta_1)*dist_1
+        ssr_bound = ssr_mid - slope_term
+        # Allow for rounding errors in the bound. 
+        ssr_bound = ssr_bound - 10**(-9)*(ssr_mid + slope_term)
+        
+        keep = ssr_bound <= np.min(ssr_mid)
+        
+        # Divide the remaining blocks into smaller blocks. 
+        spacing_next = spacing//zoom
+        offsets = np.arange(0, spacing, spacing_next)
+        i_start = (i_start[keep][:, None, None] + offsets[None, :, None] 
+                   + 0*offsets[None, None, :]).ravel()
+        j_start = (j_start[keep][:, None, None] + 0*offsets[None, :, None] 
+                   + offsets[None, None, :]).ravel()
+        inside = (i_start < num_0) & (j_start < num_1)
+        i_start = i_start[inside]
+        j_start = j_start[inside]
+        spacing = spacing_next
+    
+    # Choose the first lowest value in the order of the loops in min_ssr(). 
+    order = np.lexsort((j_start, i_start))
+    if len(order) == 0:
+        return [None, None, min_SSR]
+    k_min = order[np.argmin(ssr_mid[order])]
+    
+    if ssr_mid[k_min] < min_SSR:
+        return [int(i_start[k_min]), int(j_start[k_min]), ssr_mid[k_min]]
+    else:
+        return [None, None, min_SSR]
+
+
 def min_ssr(y: np.ndarray, x: np.ndarray, 
         beta_0_min: float, beta_0_max: float, 
         beta_1_min: float, beta_1_max: float, 
-        step: float) -> float:
+        step: float, method: str = 'grid', 
+        tile_size: int = 2**20, zoom: int = 10) -> float:
     """
     Calculates the slope intercept coefficient 
     by grid search on the sum of squared residuals
@@ -240,8 +464,22 @@ def min_ssr(y: np.ndarray, x: np.ndarray,
     np.arange(beta_0_min, beta_0_max, step) and
     np.arange(beta_1_min, beta_1_max, step), respectively.
     
-    Note that there is no error handling
-    because that is taken care of in ssr() and np.arange(). 
+    The method determines how the grid is searched:
+        'loops' calls ssr() for every pair of candidate values.
+        'grid' evaluates the SSR on tiles of the grid 
+            with ssr_grid() and returns 
+            the same values as 'loops', much faster. 
+        'refine' searches blocks of the grid from coarse to fine
+            with min_ssr_refine(), zooming in by a factor of zoom, 
+            and returns the same values as 'loops', 
+            calculating the SSR for a small part of the grid. 
+            The zoom must be an integer of at least 2. 
+    
+    If y and x are not the same length or the method is not 
+    one of the above, it prints an error message and returns None. 
+    If either grid is empty, there is no value of SSR to compare, 
+    so it prints a message and returns None, as in the loops. 
+    Other errors are taken care of in np.arange(). 
     
     >>> min_ssr([2, 2, -2, -2], [-1, -1, 1, 1], \
                 -1.0, 1.0, -3.0, -1.0, 0.1)
@@ -254,9 +492,44 @@ def min_ssr(y: np.ndarray, x: np.ndarray,
                 [99,101,99,101,99,101], \
                  -5.0, 5.0, -1.0, 3.0, 0.1)
     [0.0, 1.0]
+    >>> min_ssr([102, 106, 88, 104, 100], \
+                [101, 103, 94, 102, 100], \
+                -105.0, -95.0, 0.0, 5.0, 0.01, method = 'refine') == \
+        min_ssr([102, 106, 88, 104, 100], \
+                [101, 103, 94, 102, 100], \
+                -105.0, -95.0, 0.0, 5.0, 0.01, method = 'grid')
+    True
+    >>> min_ssr([2, 2, -2, -2], [-1, -1, 1, 1], \
+                -1.0, 1.0, -3.0, -1.0, 0.1, method = 'loops') == \
+        min_ssr([2, 2, -2, -2], [-1, -1, 1, 1], \
+                -1.0, 1.0, -3.0, -1.0, 0.1, method = 'refine')
+    True
+    >>> min_ssr([1, 2, 3], [1, 2, 3], 0.0, 1.0, 2.0, 1.0, 0.1)
+    No value of SSR was lower than the initial value.
+    Choose different values of the parameters for beta_0 and beta_1.
+    >>> min_ssr([1, 2, 3], [1, 2, 3], 0.0, 1.0, 0.0, 2.0, 0.1, \
+                method = 'refine', zoom = 1)
+    The zoom must be an integer of at least 2.
+    >>> min_ssr([1, 2, 3, 100], [1, 2, 3], 0.0, 1.0, 0.0, 2.0, 0.1)
+    Error: y and x must be the same length.
+    >>> min_ssr([1, 2, 3], [1, 2, 3], 0.0, 1.0, 0.0, 2.0, 0.1, method = 'Grid')
+    Error: method must be 'loops', 'grid' or 'refine'.
     
     """
     
+    if len(y) != len(x):
+        print("Error: y and x must be the same length.")
+        return None
+    
+    if method not in ['loops', 'grid', 'refine']:
+        print("Error: method must be 'loops', 'grid' or 'refine'.")
+        return None
+    
+    if method == 'refine' and not (isinstance(zoom, (int, np.integer)) 
+                                   and zoom >= 2):
+        print("The zoom must be an integer of at least 2.")
+        return None
+    
     # Define grid of parameters for search.
     beta_0_list = np.arange(beta_0_min, beta_0_max, step)
     beta_1_list = np.arange(beta_1_min, beta_1_max, step)
@@ -271,27 +544,44 @@ def min_ssr(y: np.ndarray, x: np.ndarray,
     i_min = None
     j_min = None
     
-    # Loop over candidate values to find a minimum SSR.
-    for i in range(len(beta_0_list)):
-        for j in range(len(beta_1_list)):
-            # print("i = ", i)
-            # print("j = ", j)
-            
-            # Extract candidate values of parameters.
-            beta_0 = beta_0_list[i]
-            beta_1 = beta_1_list[j]
-            
-            # Calculate candidate value of SSR.
-            SSR_ij = ssr(y, x, beta_0, beta_1)
-            
-            # Replace values if SSR_ij is a new low.
-            if SSR_ij < min_SSR:
-                # print(SSR_ij)
-                # Keep this as the new lowest value.
-                min_SSR = SSR_ij
-                # Record the location of the parameter values.
-                i_min = i
-                j_min = j
+    if len(beta_0_list) == 0 or len(beta_1_list) == 0:
+        
+        # Nothing to search, so the loops below would not run. 
+        pass
+    
+    elif method == 'grid':
+        
+        i_min, j_min, min_SSR = min_ssr_grid(y, x, beta_0_list, beta_1_list, 
+                                             min_SSR, tile_size)
+    
+    elif method == 'refine':
+        
+        i_min, j_min, min_SSR = min_ssr_refine(y, x, beta_0_list, beta_1_list, 
+                                               min_SSR, zoom)
+    
+    elif method == 'loops':
+        
+        # Loop over candidate values to find a minimum SSR.
+        for i in range(len(beta_0_list)):
+            for j in range(len(beta_1_list)):
+                # print("i = ", i)
+                # print("j = ", j)
+                
+                # Extract candidate values of parameters.
+                beta_0 = beta_0_list[i]
+                beta_1 = beta_1_list[j]
+                
+                # Calculate candidate value of SSR.
+                SSR_ij = ssr(y, x, beta_0, beta_1)
+                
+                # Replace values if SSR_ij is a new low.
+                if SSR_ij < min_SSR:
+                    # print(SSR_ij)
+                    # Keep this as the new lowest value.
+                    min_SSR = SSR_ij
+                    # Record the location of the parameter values.
+                    i_min = i
+                    j_min = j
                 
     # At the end, if a lowest value was found, 
     # output those values.
@@ -304,6 +594,214 @@ def min_ssr(y: np.ndarray, x: np.ndarray,
 
 
 
+# Single-pass moments for large datasets
+
+# The functions above each make one or more passes over the data. 
+# The following functions keep a dictionary of the moments
+# (the number of observations, the means and the sums of squares
+# and cross products of deviations from the means)
+# that is updated one chunk of data at a time
+# and that can combine the moments calculated from separate chunks, 
+# using the formulas of Chan, Golub and LeVeque. 
+# The data can then be read in chunks, such as with 
+# pd.read_csv(file_name, chunksize = 100000), 
+# and only one chunk has to be held in memory. 
+
+
+def moments_init() -> dict:
+    """
+    Returns the moments of an empty dataset.
+    
+    >>> moments_init()['n']
+    0
+    >>> moments_init()['S_xy']
+    0.0
+    >>> sorted(moments_init())
+    ['S_xx', 'S_xy', 'S_yy', 'n', 'x_bar', 'y_bar']
+    
+    """
+    
+    return {'n': 0, 'x_bar': 0.0, 'y_bar': 0.0, 
+            'S_xx': 0.0, 'S_yy': 0.0, 'S_xy': 0.0}
+
+
+def moments_chunk(y: np.ndarray, x: np.ndarray) -> dict:
+    """
+    Calculates the moments of one chunk of data 
+    in two lists or vector arrays y and x.
+    
+    >>> moments_chunk([2, 2, -2, -2], [-1, -1, 1, 1])['S_xy']
+    -8.0
+    >>> moments_chunk([102, 106, 88, 104, 100], \
+                      [101, 103, 94, 102, 100])['x_bar']
+    100.0
+    >>> moments_chunk([1, 2], [3])
+    Error: y and x must be the same length.
+    
+    """
+    
+    if len(y) == len(x):
+        x = np.asarray(x, dtype = float)
+        y = np.asarray(y, dtype = float)
+        
+        n = len(x)
+        if n == 0:
+            return moments_init()
+        
+        x_bar = np.mean(x)
+        y_bar = np.mean(y)
+        x_dev = x - x_bar
+        y_dev = y - y_bar
+        
+        return {'n': n, 'x_bar': float(x_bar), 'y_bar': float(y_bar), 
+                'S_xx': float(x_dev.dot(x_dev)), 
+                'S_yy': float(y_dev.dot(y_dev)), 
+                'S_xy': float(x_dev.dot(y_dev))}
+    
+    else:
+        print("Error: y and x must be the same length.")
+        return None
+
+
+def moments_merge(moments_1: dict, moments_2: dict) -> dict:
+    """
+    Combines the moments of two separate datasets into 
+    the moments of the combined dataset. 
+    The moments can be calculated by different workers 
+    and merged in any order.
+    
+    >>> m = moments_merge(moments_chunk([2, 2], [-1, -1]), 
+    ...                   moments_chunk([-2, -2], [1, 1]))
+    >>> m == moments_chunk([2, 2, -2, -2], [-1, -1, 1, 1])
+    True
+    >>> moments_merge(moments_init(), moments_chunk([1, 3], [2, 4]))['S_xy']
+    2.0
+    >>> moments_merge(moments_chunk([1, 3], [2, 4]), moments_init())['y_bar']
+    2.0
+    
+    """
+    
+    n_1 = moments_1['n']
+    n_2 = moments_2['n']
+    n = n_1 + n_2
+    if n_1 == 0:
+        return dict(moments_2)
+    if n_2 == 0:
+        return dict(moments_1)
+    
+    # Differences in the means between the two datasets.
+    d_x = moments_2['x_bar'] - moments_1['x_bar']
+    d_y = moments_2['y_bar'] - moments_1['y_bar']
+    weight = n_1*n_2/n
+    
+    return {'n': n, 
+            'x_bar': moments_1['x_bar'] + d_x*n_2/n, 
+            'y_bar': moments_1['y_bar'] + d_y*n_2/n, 
+            'S_xx': moments_1['S_xx'] + moments_2['S_xx'] + d_x*d_x*weight, 
+            'S_yy': moments_1['S_yy'] + moments_2['S_yy'] + d_y*d_y*weight, 
+            'S_xy': moments_1['S_xy'] + moments_2['S_xy'] + d_x*d_y*weight}
+
+
+def moments_update(moments: dict, y: np.ndarray, x: np.ndarray) -> dict:
+    """
+    Updates the moments with another chunk of data 
+    in two lists or vector arrays y and x.
+    
+    >>> m = moments_update(moments_init(), [102, 106, 88], [101, 103, 94])
+    >>> m = moments_update(m, [104, 100], [102, 100])
+    >>> round(moments_ols_slope(m), 10)
+    2.0
+    >>> moments_update(moments_init(), [1, 2], [3])
+    Error: y and x must be the same length.
+    
+    """
+    
+    chunk = moments_chunk(y, x)
+    if chunk is None:
+        return None
+    else:
+        return moments_merge(moments, chunk)
+
+
+def moments_variance(moments: dict) -> float:
+    """
+    Calculates the variance of x from the moments.
+    
+    >>> moments_variance(moments_chunk([0, 0, 0, 0], [-1, -1, 1, 1]))
+    1.0
+    >>> moments_variance(moments_chunk([0]*5, [101, 103, 94, 102, 100]))
+    10.0
+    >>> moments_variance(moments_chunk([0]*6, [99,101,99,101,99,101]))
+    1.0
+    
+    """
+    
+    return moments['S_xx']/moments['n']
+
+
+def moments_covariance(moments: dict) -> float:
+    """
+    Calculates the covariance of y and x from the moments.
+    
+    >>> moments_covariance(moments_chunk([2, 2, -2, -2], [-1, -1, 1, 1]))
+    -2.0
+    >>> moments_covariance(moments_chunk([102, 106, 88, 104, 100], \
+                                         [101, 103, 94, 102, 100]))
+    20.0
+    >>> moments_covariance(moments_chunk([99,101,99,101,99,101], \
+                                         [99,101,99,101,99,101]))
+    1.0
+    
+    """
+    
+    return moments['S_xy']/moments['n']
+
+
+def moments_ols_slope(moments: dict) -> float:
+    """
+    Calculates the slope coefficient 
+    by ordinary least squares from the moments.
+    
+    >>> moments_ols_slope(moments_chunk([2, 2, -2, -2], [-1, -1, 1, 1]))
+    -2.0
+    >>> moments_ols_slope(moments_chunk([102, 106, 88, 104, 100], \
+                                        [101, 103, 94, 102, 100]))
+    2.0
+    >>> moments_ols_slope(moments_chunk([1, 2], [3, 3]))
+    Error: x must have positive variance.
+    
+    """
+    
+    if moments['S_xx'] > 0:
+        return moments['S_xy']/moments['S_xx']
+    else:
+        print("Error: x must have positive variance.")
+        return None
+
+
+def moments_ols_intercept(moments: dict) -> float:
+    """
+    Calculates the intercept coefficient 
+    by ordinary least squares from the moments.
+    
+    >>> moments_ols_intercept(moments_chunk([2, 2, -2, -2], [-1, -1, 1, 1]))
+    0.0
+    >>> moments_ols_intercept(moments_chunk([102, 106, 88, 104, 100], \
+                                            [101, 103, 94, 102, 100]))
+    -100.0
+    >>> moments_ols_intercept(moments_chunk([1, 2], [3, 3]))
+    Error: x must have positive variance.
+    
+    """
+    
+    beta_1_hat = moments_ols_slope(moments)
+    if beta_1_hat is None:
+        return None
+    else:
+        return moments['y_bar'] - beta_1_hat*moments['x_bar']
+
+
+
 # Only function definitions above this point. 
 
 
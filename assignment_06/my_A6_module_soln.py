@@ -38,7 +38,7 @@
 ##################################################
 
 # import name_of_module
-
+import numpy as np
 
 
 ##################################################
@@ -145,9 +145,12 @@ def z_squared_diff_prime(x: float, z: float) -> float:
 
 # Exercise 4
 
-def sqrt_z_newton(z, x0, tol, num_iter):
+def sqrt_z_newton(z, x0, tol, num_iter, callback = None):
     """Solves for the root of the function z_squared_diff  
     using Newton's method.
+    If callback is a function, it is called as 
+    callback(x_i, f_i, x_next - x_i) in each iteration, 
+    as described in iteration_trace.py in demo_16.
     
     >>> sqrt_z_newton(9.0, 2.0, 10**(-6), 10)
     3.0
@@ -155,6 +158,12 @@ def sqrt_z_newton(z, x0, tol, num_iter):
     5.0
     >>> sqrt_z_newton(2.0, 3.0, 10**(-6), 10)
     1.4142135623730951
+    >>> steps = []
+    >>> sqrt_z_newton(9.0, 3.0, 10**(-6), 10, \
+                      callback = lambda x, f, step: steps.append(step))
+    3.0
+    >>> steps
+    [0.0]
     """
     # Initialize at the starting values. 
     x_i = x0
@@ -165,7 +174,10 @@ def sqrt_z_newton(z, x0, tol, num_iter):
         f_prime_i = z_squared_diff_prime(x_i, z)
         
         # Determine the new candidate root. 
-        x_i = x_i - f_i/f_prime_i
+        x_next = x_i - f_i/f_prime_i
+        if callback is not None:
+            callback(x_i, f_i, x_next - x_i)
+        x_i = x_next
         
         # Terminate if the root is within tolerance.
         if (abs(f_i) < tol):
@@ -205,9 +217,14 @@ def z_squared_mid(x: float, z: float) -> float:
 
 # Exercise 6
 
-def sqrt_z_fixed_pt(z, x0, tol, num_iter):
+def sqrt_z_fixed_pt(z, x0, tol, num_iter, callback = None):
     """Solves for the root of the function z_squared_diff  
     using the fixed point method.
+    If callback is a function, it is called as 
+    callback(x_i, f_i - x_i, f_i - x_i) in each iteration, 
+    as described in iteration_trace.py in demo_16: 
+    the function with a root at the fixed point is 
+    z_squared_mid(x, z) - x, which is also the step. 
     
     >>> sqrt_z_fixed_pt(9.0, 2.0, 10**(-6), 10)
     3.0
@@ -215,6 +232,12 @@ def sqrt_z_fixed_pt(z, x0, tol, num_iter):
     5.0
     >>> sqrt_z_fixed_pt(2.0, 3.0, 10**(-6), 10)
     1.4142135623730951
+    >>> residuals = []
+    >>> round(sqrt_z_fixed_pt(4.0, 4.0, 10**(-6), 10, \
+              callback = lambda x, f, step: residuals.append(f)), 6)
+    2.0
+    >>> [round(f, 6) for f in residuals[0:2]]
+    [-1.5, -0.45]
     """
     
     # Initialize at the starting value.
@@ -223,6 +246,8 @@ def sqrt_z_fixed_pt(z, x0, tol, num_iter):
         
         # Calculate the recurrence relation. 
         f_i = z_squared_mid(x_i, z)
+        if callback is not None:
+            callback(x_i, f_i - x_i, f_i - x_i)
         
         # Terminate if it is within tolerance, 
         # otherwise, update the candidate fixed point. 
@@ -239,6 +264,377 @@ def sqrt_z_fixed_pt(z, x0, tol, num_iter):
 
 
 
+# Vectorized versions
+
+# The following functions solve for the square roots
+# of every element of an array z at once. 
+# Instead of printing error messages, they return a list [x, status], 
+# where status is an array of integers for each element of z:
+#   0: the solution converged,
+#   1: the inputs are invalid for the method, 
+#   2: the solution exceeded the allowed number of iterations. 
+# The elements of x are np.nan whenever status is not 0. 
+
+
+def sqrt_z_bisect_vec(z: np.ndarray, a_0: np.ndarray, b_0: np.ndarray, 
+                      num_iter: int, tol: float = 0.0) -> list:
+    """Solves for the roots of the function z_squared_diff 
+    using the bisection method, for each element of z.
+    The endpoints a_0 and b_0 can be scalars or arrays 
+    the same shape as z. 
+    An element stops changing once the interval 
+    is narrower than tol. If tol is positive, the elements 
+    with intervals still wider than tol after num_iter iterations 
+    have status 2. 
+    
+    >>> sqrt_z_bisect_vec(np.array([9.0, 25.0]), 2.0, 7.0, 40)[0].round(8).tolist()
+    [3.0, 5.0]
+    >>> sqrt_z_bisect_vec(np.array([2.0]), 1.0, 2.0, 10)[0].tolist()
+    [1.4150390625]
+    >>> x, status = sqrt_z_bisect_vec(np.array([9.0, 1.0, 64.0]), 2.0, 4.0, 10)
+    >>> x.tolist(), status.tolist()
+    ([3.0, nan, nan], [0, 1, 1])
+    >>> x, status = sqrt_z_bisect_vec(np.array([2.0, 1e6]), 0.0, 2e6, 5, tol = 1e-8)
+    >>> x.tolist(), status.tolist()
+    ([nan, nan], [2, 2])
+    """
+    
+    z = np.asarray(z, dtype = float)
+    a_i = np.broadcast_to(np.asarray(a_0, dtype = float), z.shape).copy()
+    b_i = np.broadcast_to(np.asarray(b_0, dtype = float), z.shape).copy()
+    
+    # Verify that the interval is nonempty and contains a root.
+    status = np.zeros(z.shape, dtype = int)
+    invalid = ((a_i > b_i) | (z_squared_diff(a_i, z) > 0) | 
+               (z_squared_diff(b_i, z) < 0))
+    status[invalid] = 1
+    
+    active = ~invalid
+    for i in range(num_iter):
+        
+        # Only update the elements that have not converged.
+        active = active & (b_i - a_i >= tol)
+        if not np.any(active):
+            break
+        
+        # Calculate the midpoint and evaluate the objective function.
+        m_i = (a_i + b_i)/2
+        f_m_i = z_squared_diff(m_i, z)
+        
+        # Based on the sign of f_m_i, 
+        # assign the midpoint to replace an endpoint. 
+        a_i = np.where(active & (f_m_i < 0), m_i, a_i)
+        b_i = np.where(active & (f_m_i >= 0), m_i, b_i)
+    
+    # With a positive tol, the intervals still wider than tol 
+    # exceeded the allowed number of iterations. 
+    if tol > 0:
+        status[active & (b_i - a_i >= tol)] = 2
+    
+    # Return any value in the interval. 
+    x = np.where(status == 0, b_i, np.nan)
+    
+    return [x, status]
+
+
+def sqrt_z_newton_vec(z: np.ndarray, x0: np.ndarray, 
+                      tol: float, num_iter: int) -> list:
+    """Solves for the roots of the function z_squared_diff  
+    using Newton's method, for each element of z.
+    The starting value x0 can be a scalar or an array 
+    the same shape as z. 
+    An element is invalid if the derivative is zero.
+    
+    >>> sqrt_z_newton_vec(np.array([9.0, 25.0, 2.0]), 3.0, 10**(-6), 20)[0].tolist()
+    [3.0, 5.0, 1.4142135623731118]
+    >>> x, status = sqrt_z_newton_vec(np.array([4.0, 4.0]), np.array([1.0, 0.0]), 10**(-6), 20)
+    >>> x.round(8).tolist(), status.tolist()
+    ([2.0, nan], [0, 1])
+    >>> sqrt_z_newton_vec(np.array([2.0, 1e12]), 1.0, 10**(-6), 10)[1].tolist()
+    [0, 2]
+    """
+    
+    z = np.asarray(z, dtype = float)
+    x_i = np.broadcast_to(np.asarray(x0, dtype = float), z.shape).copy()
+    status = np.full(z.shape, 2)
+    
+    active = np.ones(z.shape, dtype = bool)
+    for i in range(num_iter):
+        
+        # Calculate the function value and the derivative.
+        f_i = z_squared_diff(x_i[active], z[active])
+        f_prime_i = z_squared_diff_prime(x_i[active], z[active])
+        
+        # Stop at a zero derivative. 
+        zero_slope = f_prime_i == 0
+        index = np.flatnonzero(active)
+        status.flat[index[zero_slope]] = 1
+        f_prime_i[zero_slope] = 1.0
+        
+        # Determine the new candidate root. 
+        x_i.flat[index] = x_i[active] - f_i/f_prime_i
+        
+        # Terminate the elements for which the root is within tolerance.
+        status.flat[index[(abs(f_i) < tol) & ~zero_slope]] = 0
+        active = status == 2
+        if not np.any(active):
+            break
+    
+    x_i[status != 0] = np.nan
+    
+    return [x_i, status]
+
+
+def sqrt_z_fixed_pt_vec(z: np.ndarray, x0: np.ndarray, 
+                        tol: float, num_iter: int) -> list:
+    """Solves for the roots of the function z_squared_diff  
+    using the fixed point method, for each element of z.
+    The starting value x0 can be a scalar or an array 
+    the same shape as z. 
+    An element is invalid if the iterations reach zero, 
+    where z_squared_mid is not defined. 
+    
+    >>> sqrt_z_fixed_pt_vec(np.array([9.0, 25.0, 2.0]), 3.0, 10**(-6), 20)[0].tolist()
+    [3.0, 5.0, 1.4142135623731118]
+    >>> x, status = sqrt_z_fixed_pt_vec(np.array([4.0, 4.0]), np.array([1.0, 0.0]), 10**(-6), 20)
+    >>> x.round(8).tolist(), status.tolist()
+    ([2.0, nan], [0, 1])
+    >>> sqrt_z_fixed_pt_vec(np.array([2.0, 1e12]), 1.0, 10**(-6), 10)[1].tolist()
+    [0, 2]
+    """
+    
+    z = np.asarray(z, dtype = float)
+    x_i = np.broadcast_to(np.asarray(x0, dtype = float), z.shape).copy()
+    status = np.full(z.shape, 2)
+    
+    active = np.ones(z.shape, dtype = bool)
+    for i in range(num_iter):
+        
+        index = np.flatnonzero(active)
+        x_active = x_i[active]
+        
+        # Stop where the recurrence relation is not defined. 
+        zero_x = x_active == 0
+        status.flat[index[zero_x]] = 1
+        x_active[zero_x] = 1.0
+        
+        # Calculate the recurrence relation. 
+        f_i = z_squared_mid(x_active, z[active])
+        
+        # Terminate the elements within tolerance
+        # and update the other candidate fixed points. 
+        status.flat[index[(abs(f_i - x_active) < tol) & ~zero_x]] = 0
+        x_i.flat[index] = f_i
+        active = status == 2
+        if not np.any(active):
+            break
+    
+    x_i[status != 0] = np.nan
+    
+    return [x_i, status]
+
+
+
+
+# Safeguarded Newton's method
+
+def newton_bisect(f, f_prime, a_0: float, b_0: float, tol: float, 
+                  num_iter: int = 100, args: tuple = ()) -> float:
+    """Solves for the root of the function f, with derivative f_prime, 
+    in the interval [a_0, b_0], by combining 
+    Newton's method with the bisection method.
+    Newton steps are taken while they stay inside the interval
+    and shrink it quickly, and bisection steps are taken otherwise, 
+    so the root is found as fast as with Newton's method 
+    from a good starting value
+    but it is never lost, as in the bisection method. 
+    
+    The functions are called as f(x, *args) and f_prime(x, *args).
+    The iterations stop when abs(f(x)) or the last step 
+    is smaller than tol, or after num_iter iterations. 
+    
+    >>> newton_bisect(z_squared_diff, z_squared_diff_prime, 2.0, 7.0, \
+                      10**(-6), args = (25.0,))
+    5.000000000588805
+    >>> round(newton_bisect(z_squared_diff, z_squared_diff_prime, 0.0, 2.0, \
+                            10**(-10), args = (2.0,)), 10)
+    1.4142135624
+    >>> newton_bisect(z_squared_diff, z_squared_diff_prime, 4.0, 7.0, \
+                      10**(-6), args = (9.0,))
+    Error: f(a_0) and f(b_0) must have different sign.
+    """
+    
+    # First verify that the interval is nonempty. 
+    if a_0 > b_0:
+        print('Error: interval must be nonempty (a_0 <= b_0).')
+        return None
+    
+    # Also verify that the interval contains a root.
+    f_a = f(a_0, *args)
+    f_b = f(b_0, *args)
+    if f_a*f_b > 0:
+        print("Error: f(a_0) and f(b_0) must have different sign.")
+        return None
+    if f_a == 0:
+        return a_0
+    if f_b == 0:
+        return b_0
+    
+    # Label the endpoints so that f(a_i) < 0 < f(b_i), 
+    # which works for increasing or decreasing functions. 
+    if f_a < 0:
+        a_i, b_i = a_0, b_0
+    else:
+        a_i, b_i = b_0, a_0
+    
+    x_i = (a_0 + b_0)/2
+    step = b_0 - a_0
+    for i in range(num_iter):
+        
+        # Calculate the function value and the derivative.
+        f_i = f(x_i, *args)
+        f_prime_i = f_prime(x_i, *args)
+        
+        # Terminate if the root is within tolerance.
+        if abs(f_i) < tol:
+            return x_i
+        
+        # Replace the endpoint with the same sign as f_i.
+        if f_i < 0:
+            a_i = x_i
+        else:
+            b_i = x_i
+        
+        # Take the Newton step only if it stays inside the interval
+        # and it is less than half of the last step, 
+        # so that the steps shrink at least as fast as with bisection. 
+        if (f_prime_i != 0 and 
+                min(a_i, b_i) < x_i - f_i/f_prime_i < max(a_i, b_i) and 
+                abs(2*f_i) < abs(step*f_prime_i)):
+            step = - f_i/f_prime_i
+        else:
+            step = (b_i - a_i)/2 + (a_i - x_i)
+        x_i = x_i + step
+        
+        # Terminate if the step is within tolerance.
+        if abs(step) < tol:
+            return x_i
+        
+    # If it reaches the end of the loop, it has
+    # exceeded the maximum number of iterations.
+    print("Exceeded allowed number of iterations")
+    return None
+
+
+
+
+# Accelerated fixed point iterations
+
+def fixed_pt_accel(g, x0, tol: float, num_iter: int, 
+                   method: str = 'plain', args: tuple = (), 
+                   memory: int = 5) -> list:
+    """Solves for the fixed point x = g(x, *args) of the function g, 
+    such as z_squared_mid, starting at x0, which can be 
+    a number or an array for a system of equations.
+    Returns the list [x, num_evals], where num_evals 
+    is the number of evaluations of g, 
+    to compare the speed of the methods:
+        'plain' iterates x_next = g(x), as in sqrt_z_fixed_pt().
+        'aitken' extrapolates from the values x, g(x) and g(g(x))
+            with Aitken's delta-squared formula. 
+        'anderson' chooses x_next from a combination of the last 
+            memory + 1 values of g(x), with weights that minimize 
+            the combination of the differences g(x) - x. 
+    The iterations stop when every element of abs(g(x) - x) < tol, 
+    or after num_iter evaluations of g. 
+    For any other method, it prints an error message 
+    and returns [None, 0]. 
+    
+    >>> fixed_pt_accel(z_squared_mid, 2.0, 10**(-6), 20, args = (9.0,))
+    [3.0, 5]
+    >>> slow_map = lambda x: 0.99*x + 1
+    >>> [fixed_pt_accel(slow_map, 0.0, 10**(-6), 5000, method)[1] \
+         for method in ['plain', 'aitken', 'anderson']]
+    [1376, 3, 3]
+    >>> market_map = lambda p: p + 0.1*(np.array([10.0, 5.0])/p - p)
+    >>> x, num_evals = fixed_pt_accel(market_map, np.array([1.0, 1.0]), \
+                                      10**(-8), 500, 'anderson')
+    >>> (x**2).round(6).tolist(), num_evals < 20
+    ([10.0, 5.0], True)
+    >>> fixed_pt_accel(z_squared_mid, 2.0, 10**(-6), 20, 'Aitken', args = (9.0,))
+    Error: method must be 'plain', 'aitken' or 'anderson'.
+    [None, 0]
+    """
+    
+    # First verify that the method is one of the above. 
+    if method not in ['plain', 'aitken', 'anderson']:
+        print("Error: method must be 'plain', 'aitken' or 'anderson'.")
+        return [None, 0]
+    
+    # Initialize at the starting value.
+    x_i = np.array(x0, dtype = float)
+    num_evals = 0
+    
+    # The history of differences for Anderson mixing. 
+    d_g_list = []
+    d_f_list = []
+    g_old = None
+    f_old = None
+    
+    while num_evals < num_iter:
+        
+        # Calculate the recurrence relation. 
+        g_i = np.array(g(x_i, *args), dtype = float)
+        num_evals = num_evals + 1
+        f_i = g_i - x_i
+        
+        # Terminate if it is within tolerance.
+        if np.max(abs(f_i)) < tol:
+            if g_i.ndim == 0:
+                g_i = float(g_i)
+            return [g_i, num_evals]
+        
+        if method == 'aitken':
+            
+            g_2 = np.array(g(g_i, *args), dtype = float)
+            num_evals = num_evals + 1
+            
+            # Extrapolate from the three values, 
+            # unless the second difference is zero. 
+            d_2 = g_2 - 2*g_i + x_i
+            d_2_safe = np.where(d_2 == 0, 1.0, d_2)
+            x_i = np.where(d_2 == 0, g_2, x_i - f_i**2/d_2_safe)
+        
+        elif method == 'anderson':
+            
+            if g_old is not None:
+                d_g_list.append((g_i - g_old).ravel())
+                d_f_list.append((f_i - f_old).ravel())
+                if len(d_g_list) > memory:
+                    d_g_list.pop(0)
+                    d_f_list.pop(0)
+            g_old = g_i
+            f_old = f_i
+            
+            if len(d_f_list) > 0:
+                # Weights that best cancel the latest difference f_i.
+                gamma = np.linalg.lstsq(np.column_stack(d_f_list), 
+                                        f_i.ravel(), rcond = None)[0]
+                x_i = g_i - np.column_stack(d_g_list).dot(gamma).reshape(g_i.shape)
+            else:
+                x_i = g_i
+        
+        elif method == 'plain':
+            x_i = g_i
+        
+    # If it reaches the end of the loop, it has
+    # exceeded the maximum number of iterations.
+    print("Exceeded allowed number of iterations")
+    return [None, num_evals]
+
+
+
+
 # Only function definitions above this point. 
 
 
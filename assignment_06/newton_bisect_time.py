@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Counting Function Evaluations in the Root-Finding Methods
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the number of evaluations of
+# z_squared_diff and z_squared_diff_prime, and the time,
+# needed to calculate square roots to the same tolerance
+# with sqrt_z_bisect(), sqrt_z_newton() and newton_bisect().
+# Each method is given the same interval [0.1, z + 1]
+# and Newton's method starts at the lower end,
+# which is all that is known about the root in advance.
+#
+##################################################
+"""
+
+import math
+import time
+
+import my_A6_module_soln as A6
+
+
+# Keep the original functions, since the module versions
+# are replaced with versions that count their evaluations.
+z_squared_diff = A6.z_squared_diff
+z_squared_diff_prime = A6.z_squared_diff_prime
+
+
+def make_counter(fun):
+    """ (function) -> list
+
+    Return a list [fun_counted, counter], where fun_counted
+    calls fun with the same arguments and adds one
+    to counter['count'] each time.
+    """
+
+    counter = {'count': 0}
+
+    def fun_counted(*args, **kwargs):
+        counter['count'] = counter['count'] + 1
+        return fun(*args, **kwargs)
+
+    return [fun_counted, counter]
+
+
+def count_evals(method, z, tol):
+    """ (str, float, float) -> list
+
+    Return the list [root, evaluations, milliseconds]
+    for calculating the square root of z with the method
+    'bisect', 'newton' or 'hybrid', where evaluations
+    is the total number of calls to
+    z_squared_diff and z_squared_diff_prime.
+    """
+
+    A6.z_squared_diff, f_counter = make_counter(z_squared_diff)
+    A6.z_squared_diff_prime, f_prime_counter = make_counter(z_squared_diff_prime)
+
+    a_0 = 0.1
+    b_0 = z + 1.0
+    t1 = time.perf_counter()
+    if method == 'bisect':
+        # Enough iterations to shrink the interval below tol.
+        num_iter = math.ceil(math.log2((b_0 - a_0)/tol))
+        root = A6.sqrt_z_bisect(z, a_0, b_0, num_iter)
+    elif method == 'newton':
+        root = A6.sqrt_z_newton(z, a_0, tol, 1000)
+    else:
+        root = A6.newton_bisect(A6.z_squared_diff, A6.z_squared_diff_prime,
+                                a_0, b_0, tol, 1000, args = (z,))
+    t2 = time.perf_counter()
+
+    A6.z_squared_diff = z_squared_diff
+    A6.z_squared_diff_prime = z_squared_diff_prime
+
+    return [root, f_counter['count'] + f_prime_counter['count'],
+            (t2 - t1) * 1000.0]
+
+
+if __name__ == '__main__':
+
+    tol = 10**(-8)
+    methods = ['bisect', 'newton', 'hybrid']
+
+    print("Function evaluations (and milliseconds) for tolerance", tol)
+    print('z', *methods, sep='\t\t')
+    for z in [2.0, 25.0, 1000.0, 10.0**6, 10.0**12]:
+        print(z, end='\t')
+        for method in methods:
+            root, evals, ms = count_evals(method, z, tol)
+            print("{0:6d} ({1:6.3f})".format(evals, ms), end='\t')
+        print()
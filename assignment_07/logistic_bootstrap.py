@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Bootstrap Standard Errors for Logistic Regression
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script calculates bootstrap standard errors
+# for the logistic regression in logistic_calculation_soln.py,
+# with bootstrap_logit() in logistic_module.py,
+# and compares them with the standard errors from statsmodels.
+# bootstrap_logit() resamples the rows of the data B times
+# and refits the model, starting each fit from the
+# full-sample estimate, in n_jobs processes.
+# The seed makes the results reproducible,
+# whatever the number of processes.
+#
+# On Windows, each worker process starts by importing this script,
+# so all of the calculations are under if __name__ == "__main__":
+# and the workers only import the modules below.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import os # To set working directory
+import time
+
+import pandas as pd # To read data
+import statsmodels.api as sm # To compare the standard errors
+import numpy as np
+
+import logistic_module as lm
+
+
+
+if __name__ == "__main__":
+
+
+    ##################################################
+    # Set Working Directory.
+    ##################################################
+
+    drive_path = 'C:\\Users\\le279259\\OneDrive - University of Central Florida\\Documents\\'
+    git_path = 'Teaching\\ECP3004_Spring_2021\\GitRepo\\ECP3004S21\\'
+
+    os.chdir(drive_path + git_path + 'demo_19_Classification')
+
+
+    ##################################################
+    # Load Data.
+    ##################################################
+
+    credit = pd.read_csv('credit_data.csv')
+
+    # The same variables as in logistic_calculation_soln.py, 
+    # with a column of 1s for the constant. 
+    y = credit['default']
+    credit['Intercept'] = 1
+    X_cols = credit.columns[[10, 4, 5, 6, 7, 8]]
+    X = credit[X_cols]
+
+    y_arr = np.array(y, dtype = float)
+    X_arr = np.array(X, dtype = float)
+
+
+    ##################################################
+    # Full-sample estimates.
+    ##################################################
+
+    logit_model_fit_sm = sm.Logit(y, X).fit()
+
+    t1 = time.perf_counter()
+    beta_hat = lm.logit_newton(y_arr, X_arr, np.zeros(X_arr.shape[1]),
+                               10**(-8), 100)
+    t2 = time.perf_counter()
+    print("One fit: %f milliseconds" % ((t2 - t1) * 1000.0))
+
+
+    ##################################################
+    # Bootstrap standard errors.
+    ##################################################
+
+    t1 = time.perf_counter()
+    beta_boot = lm.bootstrap_logit(y_arr, X_arr, B = 1000,
+                                   n_jobs = os.cpu_count(), seed = 3004,
+                                   beta_hat = beta_hat)
+    t2 = time.perf_counter()
+    print("Bootstrap: %f milliseconds" % ((t2 - t1) * 1000.0))
+
+    # The bootstrap standard errors:
+    print(np.std(beta_boot, axis = 0, ddof = 1))
+    # Compare with the standard errors from logit_model_fit_sm:
+    print(logit_model_fit_sm.bse)
+
+
+
+##################################################
+# End
+##################################################
@@ -69,6 +69,15 @@ os.getcwd()
 # Change to a new directory.
 drive_path = 'C:\\Users\\le279259\\OneDrive - University of Central Florida\\Documents\\'
 git_path = 'Teaching\\ECP3004_Spring_2021\\GitRepo\\ECP3004S21\\'
+
+# The functions in logistic_module.py are in the assignment_07 folder.
+os.chdir(drive_path + git_path + 'assignment_07')
+import logistic_module as lm
+
+# The function memoize() in memo_objective.py is in the demo_20 folder.
+os.chdir(drive_path + git_path + 'demo_20_Optimization')
+import memo_objective as mo
+
 os.chdir(drive_path + git_path + 'demo_19_Classification')
 # Check that the change was successful.
 os.getcwd()
@@ -301,6 +310,161 @@ print(logit_likelihood(soln_bfgs_jac.x, y, X))
 
 
 
+#--------------------------------------------------
+# BFGS with the likelihood and gradient 
+# calculated together
+#--------------------------------------------------
+
+# Each call to logit_likelihood and logit_gradient
+# calculates X.dot(beta) and np.exp() from scratch.
+# The function logit_like_grad in logistic_module.py 
+# calculates both from the same X.dot(beta), 
+# using log1p(exp(-|z|)) so that np.exp() never overflows.
+
+# Convert the data to np.arrays once, 
+# rather than on every function evaluation.
+y_arr = np.array(y, dtype = float)
+X_arr = np.array(X, dtype = float)
+
+# Check that the objective and gradient match.
+print(lm.logit_like_grad(beta, y_arr, X_arr))
+print(logit_likelihood(beta, y, X))
+print(logit_gradient(beta, y, X))
+
+
+beta_0 = np.zeros(len(logit_model_fit_sm.params))
+
+# With jac = True, the function returns both the
+# objective and the gradient.
+soln_bfgs_fused = minimize(fun = lm.logit_like_grad, x0 = beta_0, 
+                           args = (y_arr, X_arr), 
+                           method = 'BFGS', jac = True,
+                           options = {'maxiter': 1000, 'disp': True})
+
+
+# The parameters:
+print(soln_bfgs_fused.x)
+# Compare with the estimates from logit_model_fit_sm:
+print(logit_model_fit_sm.params)
+
+# The objective function:
+print(soln_bfgs_fused.fun)
+print(logit_likelihood(soln_bfgs_fused.x, y, X))
+
+
+#--------------------------------------------------
+# Remembering the likelihood and gradient values
+#--------------------------------------------------
+
+# memoize() in memo_objective.py returns versions of the 
+# likelihood and the gradient that remember their values
+# at the most recent values of beta.
+# With jac = True, one call to logit_like_grad gives both, 
+# so they can be passed separately to methods that
+# evaluate the function and the gradient at different times. 
+
+like_memo, grad_memo, like_stats = mo.memoize(lm.logit_like_grad, True)
+
+beta_0 = np.zeros(len(logit_model_fit_sm.params))
+
+soln_bfgs_memo = minimize(fun = like_memo, x0 = beta_0, 
+                          args = (y_arr, X_arr), 
+                          method = 'BFGS', jac = grad_memo,
+                          options = {'maxiter': 1000, 'disp': True})
+
+# The parameters:
+print(soln_bfgs_memo.x)
+# The number of passes over the data, 
+# and the fraction of calls that were found in memory:
+print(like_stats)
+print(mo.hit_rate(like_stats))
+
+
+# The Powell method returns to some of the same points, 
+# which are found in memory. 
+like_memo, grad_memo, like_stats = mo.memoize(logit_likelihood)
+
+soln_dfp_memo = minimize(fun = like_memo, x0 = beta_0, args = (y, X), 
+                         method = 'powell',
+                         options = {'xtol': 1e-8, 'maxiter': 1000, 'disp': True})
+
+print(soln_dfp_memo.x)
+print(like_stats)
+print(mo.hit_rate(like_stats))
+
+
+#--------------------------------------------------
+# Newton's method with the likelihood, gradient 
+# and Hessian calculated together
+#--------------------------------------------------
+
+# logit_like_grad_hess returns all three from one X.dot(beta), 
+# so each Newton step costs about one pass over the data.
+
+beta_0 = np.zeros(len(logit_model_fit_sm.params))
+beta_newton = lm.logit_newton(y_arr, X_arr, beta_0, 10**(-8), 100)
+
+# The parameters:
+print(beta_newton)
+# Compare with the estimates from logit_model_fit_sm:
+print(logit_model_fit_sm.params)
+
+# The objective function:
+print(lm.logit_like_grad_hess(beta_newton, y_arr, X_arr)[0])
+
+
+
+
+#--------------------------------------------------
+# Stochastic optimization over chunks of the data
+# (for data files too large to fit in memory)
+#--------------------------------------------------
+
+# The minimize() calls above need the whole matrix X in memory.
+# logit_adam() takes one step of the Adam algorithm 
+# for each chunk of rows read from the csv file, 
+# so only one chunk is in memory at a time.
+
+# The chunks are read again from the file for each pass through the data.
+X_cols_no_int = ['AA', 'A', 'B', 'C', 'D']
+credit_chunks = lambda: lm.logit_csv_chunks('credit_data.csv', 'default', 
+                                            X_cols_no_int, 500)
+
+beta_0 = np.zeros(len(logit_model_fit_sm.params))
+beta_adam = lm.logit_adam(credit_chunks, beta_0, num_epochs = 5000, 
+                          learning_rate = 0.05, tol = 10**(-7))
+
+# The parameters:
+print(beta_adam)
+# Compare with the estimates from logit_model_fit_sm:
+print(logit_model_fit_sm.params)
+
+# The objective function:
+print(logit_likelihood(beta_adam, y, X))
+
+
+# The same function works with arrays saved to disk
+# and memory-mapped with np.load(file_name, mmap_mode = 'r'):
+# array_chunks = lambda: lm.logit_array_chunks(y_mmap, X_mmap, 500)
+
+
+
+
+#--------------------------------------------------
+# Bootstrap standard errors
+#--------------------------------------------------
+
+# The statsmodels output is the only source of standard errors so far.
+# The script logistic_bootstrap.py calculates bootstrap standard errors
+# with bootstrap_logit() in logistic_module.py, 
+# which refits the model on resampled data in several processes. 
+# It is a separate script because, on Windows, each worker process 
+# imports the script that started it, 
+# which would repeat all of the calculations in this script. 
+
+
+
+
 ##################################################
 
 ##################################################
@@ -314,25 +478,24 @@ def logit_hessian(beta, y, X):
     X_beta = X.dot(beta)
     exp_X_beta = np.exp(X_beta)
     probs = exp_X_beta/(1 + exp_X_beta)
-    error = y - probs
-    diag = probs*error
-    # grad = error.dot(X)
+    # The weights are the variances of the Bernoulli outcomes, 
+    # probs*(1 - probs), which do not depend on y.
+    diag = np.array(probs*(1 - probs))
     
-    # X_diag = X*np.repeat(diag, len(X.columns), 1)
     # Don't multiply with a diagonal matrix.
-    # Create a matrix with repeating rows. 
-    rep_diag = pd.concat([diag] * len(X.columns), 
-                         axis = 1, ignore_index = True)
-    rep_diag.columns = X.columns
-    X_diag = X.multiply(rep_diag)
+    # Don't create a matrix with repeating rows, either:
+    # np arrays broadcast the column of weights across the rows of X.
+    X_arr = np.array(X)
+    X_diag = X_arr*diag[:, None]
     
     # The definition of the Hessian for the logistic regression.
     # X^T * D * X, 
     # where D is a diagonal matrix with values diag on the diagonal.
-    hess = X_diag.transpose().dot(X)
+    # This is the Hessian of the negative likelihood, 
+    # so it is positive definite. 
+    hess = X_diag.T.dot(X_arr)
     
-    neg_hess = - hess
-    return neg_hess
+    return hess
 
 
 
@@ -357,6 +520,41 @@ print(logit_likelihood(soln_bfgs_jac.x, y, X))
 
 
 
+#--------------------------------------------------
+# Newton-CG with the Hessian-vector product
+# NCG needs only the product of the Hessian
+# with an arbitrary vector. 
+#--------------------------------------------------
+
+# With many explanatory variables, forming the k x k 
+# Hessian is wasteful. 
+# logit_hess_p in logistic_module.py calculates
+# X^T * D * (X * p) with two matrix-vector products.
+
+print(lm.logit_hessian(beta, y_arr, X_arr).dot(np.ones(len(beta))))
+print(lm.logit_hess_p(beta, np.ones(len(beta)), y_arr, X_arr))
+
+
+beta_0 = np.zeros(len(logit_model_fit_sm.params))
+
+soln_ncg_hp = minimize(fun = lm.logit_like_grad, x0 = beta_0, 
+                       args = (y_arr, X_arr), 
+                       method = 'Newton-CG', jac = True, 
+                       hessp = lm.logit_hess_p,
+                       options = {'xtol': 1e-8, 'disp': True})
+
+
+# The parameters:
+print(soln_ncg_hp.x)
+# Compare with the estimates from logit_model_fit_sm:
+print(logit_model_fit_sm.params)
+
+# The objective function:
+print(soln_ncg_hp.fun)
+print(logit_likelihood(soln_ncg_hp.x, y, X))
+
+
+
 
 ##################################################
 # End
@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Logistic Regression: Function Definitions
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This module collects the functions used to estimate
+# logistic regression in logistic_calculation_soln.py
+# so that they can be imported into other scripts.
+# The likelihood, gradient and Hessian are calculated
+# together from one pass over the data,
+# in a form that does not overflow for large values of X*beta.
+#
+##################################################
+"""
+
+
+
+"""
+##################################################
+##################################################
+# Note: there should be no printing or calculations
+# in this script, aside from function definitions.
+# Save those for the script logistic_calculation_soln.py.
+##################################################
+##################################################
+"""
+
+
+
+
+
+
+##################################################
+# Import Required Modules
+##################################################
+
+import numpy as np
+# To read large data files in chunks.
+import pandas as pd
+# The logistic function 1/(1 + exp(-z)), without overflow.
+from scipy.special import expit
+from scipy.optimize import minimize
+# To run the bootstrap replications in parallel.
+from concurrent.futures import ProcessPoolExecutor
+
+
+
+##################################################
+# Function Definitions
+##################################################
+
+# Only function definitions here - no other calculations.
+
+
+#--------------------------------------------------
+# The terms of the likelihood function
+#--------------------------------------------------
+
+def logit_terms(beta: np.ndarray, y: np.ndarray,
+                X: np.ndarray) -> list:
+    """Calculates the pieces shared by the likelihood function,
+    the gradient vector and the Hessian matrix
+    for the logistic regression model:
+    the negative of the log-likelihood and the vector of
+    predicted probabilities.
+
+    The log-likelihood is calculated as
+    y*z - log(1 + exp(z)), with z = X*beta,
+    and log(1 + exp(z)) = max(z, 0) + log1p(exp(-|z|)),
+    which never takes the exponential of a positive number.
+
+    >>> logit_terms(np.zeros(2), np.array([1, 0]),
+    ...             np.array([[1.0, 0.0], [1.0, 1.0]]))
+    [1.3862943611198906, array([0.5, 0.5])]
+    >>> logit_terms(np.array([1000.0, 0.0]), np.array([1, 0]),
+    ...             np.array([[1.0, 0.0], [1.0, 1.0]]))
+    [1000.0, array([1., 1.])]
+    >>> logit_terms(np.array([-1000.0, 0.0]), np.array([1, 0]),
+    ...             np.array([[1.0, 0.0], [1.0, 1.0]]))
+    [1000.0, array([0., 0.])]
+    """
+
+    # This is the only product with the full matrix X.
+    X_beta = X.dot(beta)
+
+    # log(1 + exp(X_beta)) without overflow.
+    log_1_exp = np.maximum(X_beta, 0) + np.log1p(np.exp(-np.abs(X_beta)))
+    neg_like = np.sum(log_1_exp) - y.dot(X_beta)
+
+    probs = expit(X_beta)
+
+    return [float(neg_like), probs]
+
+
+#--------------------------------------------------
+# The likelihood function and the gradient vector
+#--------------------------------------------------
+
+def logit_like_grad(beta: np.ndarray, y: np.ndarray,
+                    X: np.ndarray) -> tuple:
+    """Calculates the negative of the log-likelihood function
+    and its gradient vector for the logistic regression model,
+    from a single calculation of X*beta.
+
+    y and X should be np.arrays, rather than pandas objects,
+    so that they are not converted on every call.
+
+    The output is in the form required for
+    minimize(fun = logit_like_grad, jac = True).
+
+    >>> logit_like_grad(np.zeros(2), np.array([1, 0]),
+    ...                 np.array([[1.0, 0.0], [1.0, 1.0]]))
+    (1.3862943611198906, array([0. , 0.5]))
+    >>> logit_like_grad(np.array([0.0, 1.0]), np.array([1, 1]),
+    ...                 np.array([[1.0, 0.0], [1.0, 0.0]]))
+    (1.3862943611198906, array([-1.,  0.]))
+    >>> logit_like_grad(np.array([1000.0, 0.0]), np.array([1, 0]),
+    ...                 np.array([[1.0, 0.0], [1.0, 1.0]]))
+    (1000.0, array([1., 1.]))
+    """
+
+    neg_like, probs = logit_terms(beta, y, X)
+
+    # The gradient is X^T * (probs - y) for the negative likelihood.
+    neg_grad = X.T.dot(probs - y)
+
+    return neg_like, neg_grad
+
+
+#--------------------------------------------------
+# The likelihood, gradient vector and Hessian matrix
+#--------------------------------------------------
+
+def logit_like_grad_hess(beta: np.ndarray, y: np.ndarray,
+                         X: np.ndarray) -> tuple:
+    """Calculates the negative of the log-likelihood function,
+    its gradient vector and its Hessian matrix
+    for the logistic regression model,
+    from a single calculation of X*beta.
+
+    The Hessian is X^T * D * X, where D is a diagonal matrix
+    with probs*(1 - probs) on the diagonal.
+
+    >>> neg_like, neg_grad, neg_hess = logit_like_grad_hess(np.zeros(2),
+    ...     np.array([1, 0]), np.array([[1.0, 0.0], [1.0, 1.0]]))
+    >>> neg_like
+    1.3862943611198906
+    >>> neg_grad
+    array([0. , 0.5])
+    >>> neg_hess
+    array([[0.5 , 0.25],
+           [0.25, 0.25]])
+    """
+
+    neg_like, probs = logit_terms(beta, y, X)
+
+    neg_grad = X.T.dot(probs - y)
+
+    # Weight the rows of X instead of forming the diagonal matrix.
+    weights = probs*(1 - probs)
+    neg_hess = (X*weights[:, None]).T.dot(X)
+
+    return neg_like, neg_grad, neg_hess
+
+
+#--------------------------------------------------
+# The Hessian matrix and the Hessian-vector product
+#--------------------------------------------------
+
+def logit_hessian(beta: np.ndarray, y: np.ndarray,
+                  X: np.ndarray) -> np.ndarray:
+    """Calculates the Hessian matrix of the negative of the
+    log-likelihood function for the logistic regression model.
+
+    The Hessian is X^T * D * X, where D is a diagonal matrix
+    with probs*(1 - probs) on the diagonal.
+    The rows of X are weighted by broadcasting,
+    without forming D or a repeated matrix of weights.
+
+    >>> logit_hessian(np.zeros(2), np.array([1, 0]),
+    ...               np.array([[1.0, 0.0], [1.0, 1.0]]))
+    array([[0.5 , 0.25],
+           [0.25, 0.25]])
+    >>> logit_hessian(np.array([1000.0, 0.0]), np.array([1, 0]),
+    ...               np.array([[1.0, 0.0], [1.0, 1.0]]))
+    array([[0., 0.],
+           [0., 0.]])
+    >>> logit_hessian(np.zeros(2), np.array([1, 1]),
+    ...               np.array([[2.0, 0.0], [0.0, 2.0]]))
+    array([[1., 0.],
+           [0., 1.]])
+    """
+
+    probs = expit(X.dot(beta))
+    weights = probs*(1 - probs)
+
+    return (X*weights[:, None]).T.dot(X)
+
+
+def logit_hess_p(beta: np.ndarray, p: np.ndarray, y: np.ndarray,
+                 X: np.ndarray) -> np.ndarray:
+    """Calculates the product of the Hessian matrix of the negative
+    log-likelihood function with the vector p,
+    for the logistic regression model.
+
+    It is calculated as X^T * (D * (X * p)),
+    with two matrix-vector products,
+    so the k x k Hessian is never formed.
+    The arguments are in the order required for
+    minimize(method = 'Newton-CG', hessp = logit_hess_p).
+
+    >>> logit_hess_p(np.zeros(2), np.array([1.0, 0.0]), np.array([1, 0]),
+    ...              np.array([[1.0, 0.0], [1.0, 1.0]]))
+    array([0.5 , 0.25])
+    >>> logit_hess_p(np.zeros(2), np.array([1.0, 1.0]), np.array([1, 0]),
+    ...              np.array([[1.0, 0.0], [1.0, 1.0]]))
+    array([0.75, 0.5 ])
+    >>> logit_hess_p(np.zeros(2), np.array([0.0, 0.0]), np.array([1, 0]),
+    ...              np.array([[1.0, 0.0], [1.0, 1.0]]))
+    array([0., 0.])
+    """
+
+    probs = expit(X.dot(beta))
+    weights = probs*(1 - probs)
+
+    return X.T.dot(weights*X.dot(p))
+
+
+#--------------------------------------------------
+# Newton's method with the combined calculation
+#--------------------------------------------------
+
+def logit_newton(y: np.ndarray, X: np.ndarray, beta_0: np.ndarray,
+                 tol: float, maxiter: int) -> np.ndarray:
+    """Calculates the maximum likelihood estimates
+    of the coefficients of the logistic regression model
+    using Newton's method.
+    Each iteration makes one call to logit_like_grad_hess().
+
+    Returns None if the step size does not fall below tol
+    within maxiter iterations.
+
+    >>> logit_newton(np.array([1, 0, 1, 0]),
+    ...              np.array([[1.0, 0.0], [1.0, 0.0],
+    ...                        [1.0, 1.0], [1.0, 1.0]]),
+    ...              np.zeros(2), 10**(-8), 20)
+    array([0., 0.])
+    >>> beta_hat = logit_newton(np.array([1, 0, 0, 1, 1, 0]),
+    ...              np.array([[1.0, 0.0], [1.0, 0.0], [1.0, 0.0],
+    ...                        [1.0, 1.0], [1.0, 1.0], [1.0, 1.0]]),
+    ...              np.zeros(2), 10**(-8), 20)
+    >>> np.round(beta_hat, 6)
+    array([-0.693147,  1.386294])
+    """
+
+    beta = np.array(beta_0, dtype = float)
+    for i in range(maxiter):
+
+        neg_like, neg_grad, neg_hess = logit_like_grad_hess(beta, y, X)
+
+        # Solve for the step rather than inverting the Hessian.
+        step = np.linalg.solve(neg_hess, neg_grad)
+        beta = beta - step
+
+        if np.max(np.abs(step)) < tol:
+            return beta
+
+    # If it reaches the end of the loop, it has
+    # exceeded the maximum number of iterations.
+    return None
+
+
+
+#--------------------------------------------------
+# Reading the data in chunks
+#--------------------------------------------------
+
+def logit_csv_chunks(path: str, y_col: str, X_cols: list,
+                     chunksize: int, intercept: bool = True):
+    """Reads the target variable y_col and the explanatory
+    variables X_cols from the csv file at path,
+    chunksize rows at a time,
+    and yields each chunk as a list [y, X] of np.arrays.
+    If intercept is True, a column of ones is placed
+    before the columns X_cols.
+
+    Only one chunk is held in memory at a time.
+    """
+
+    for chunk in pd.read_csv(path, usecols = [y_col] + list(X_cols),
+                             chunksize = chunksize):
+        y = chunk[y_col].to_numpy(dtype = float)
+        X = chunk[list(X_cols)].to_numpy(dtype = float)
+        if intercept:
+            X = np.column_stack([np.ones(len(y)), X])
+        yield [y, X]
+
+
+def logit_array_chunks(y: np.ndarray, X: np.ndarray, chunksize: int):
+    """Yields the rows of y and X as a list [y, X],
+    chunksize rows at a time.
+
+    y and X can be memory-mapped arrays, as from
+    np.load(file_name, mmap_mode = 'r'),
+    so that only one chunk is read into memory at a time.
+
+    >>> [len(y_i) for y_i, X_i in logit_array_chunks(np.zeros(5),
+    ...                                              np.zeros((5, 2)), 2)]
+    [2, 2, 1]
+    >>> [X_i.shape for y_i, X_i in logit_array_chunks(np.zeros(4),
+    ...                                               np.zeros((4, 3)), 4)]
+    [(4, 3)]
+    >>> [len(y_i) for y_i, X_i in logit_array_chunks(np.zeros(0),
+    ...                                              np.zeros((0, 2)), 2)]
+    []
+    """
+
+    for start in range(0, len(y), chunksize):
+        yield [np.asarray(y[start:start + chunksize], dtype = float),
+               np.asarray(X[start:start + chunksize], dtype = float)]
+
+
+#--------------------------------------------------
+# Stochastic optimization over chunks of data
+#--------------------------------------------------
+
+def logit_adam(chunks, beta_0: np.ndarray, num_epochs: int,
+               learning_rate: float = 0.05, tol: float = 10**(-6),
+               decay_1: float = 0.9, decay_2: float = 0.999) -> np.ndarray:
+    """Calculates the maximum likelihood estimates
+    of the coefficients of the logistic regression model
+    with the Adam algorithm, taking one step
+    for each chunk of data.
+
+    chunks is a function with no arguments that returns
+    an iterator over chunks [y, X], such as
+    lambda: logit_csv_chunks('credit_data.csv', 'default', X_cols, 1000).
+    It is called once for each pass (epoch) through the data,
+    so the memory required does not depend on the number of rows.
+
+    Each step uses the gradient summed over the rows in the chunk,
+    divided by the number of rows in the first chunk,
+    so that a short last chunk does not get extra weight per row.
+    The learning rate is reduced by the square root of the number
+    of the epoch. The estimate from each epoch is the average of
+    the coefficients over its steps, and the algorithm stops when
+    no coefficient changes by more than tol from one epoch to the next.
+    decay_1 and decay_2 are the decay rates of the moving averages
+    of the gradient and of the squared gradient.
+
+    Returns None if it does not converge within num_epochs epochs.
+
+    >>> X = np.column_stack([np.ones(6), [0, 0, 0, 1, 1, 1]])
+    >>> y = np.array([1, 0, 0, 1, 1, 0])
+    >>> beta_hat = logit_adam(lambda: logit_array_chunks(y, X, 2),
+    ...                       np.zeros(2), 5000)
+    >>> np.round(beta_hat, 1)
+    array([-0.7,  1.4])
+    >>> logit_adam(lambda: logit_array_chunks(y, X, 2), np.zeros(2), 1)
+    """
+
+    beta = np.array(beta_0, dtype = float)
+    # Moving averages of the gradient and the squared gradient.
+    m = np.zeros(len(beta))
+    v = np.zeros(len(beta))
+    t = 0
+    chunk_rows = None
+    beta_avg_prev = None
+    for epoch in range(num_epochs):
+
+        step_size = learning_rate/np.sqrt(epoch + 1)
+        beta_sum = np.zeros(len(beta))
+        num_steps = 0
+        for y_i, X_i in chunks():
+
+            if chunk_rows is None:
+                chunk_rows = len(y_i)
+
+            probs = expit(X_i.dot(beta))
+            grad = X_i.T.dot(probs - y_i)/chunk_rows
+
+            t = t + 1
+            m = decay_1*m + (1 - decay_1)*grad
+            v = decay_2*v + (1 - decay_2)*grad**2
+            # Correct the bias from starting the averages at zero.
+            m_hat = m/(1 - decay_1**t)
+            v_hat = v/(1 - decay_2**t)
+
+            beta = beta - step_size*m_hat/(np.sqrt(v_hat) + 10**(-8))
+            beta_sum = beta_sum + beta
+            num_steps = num_steps + 1
+
+        beta_avg = beta_sum/num_steps
+        if (beta_avg_prev is not None and
+            np.max(np.abs(beta_avg - beta_avg_prev)) < tol):
+            return beta_avg
+        beta_avg_prev = beta_avg
+
+    # If it reaches the end of the loop, it has
+    # exceeded the maximum number of epochs.
+    return None
+
+
+
+#--------------------------------------------------
+# Bootstrap standard errors
+#--------------------------------------------------
+
+def logit_bootstrap_block(y: np.ndarray, X: np.ndarray,
+                          beta_hat: np.ndarray, seeds: list) -> np.ndarray:
+    """Calculates the bootstrap estimates for one block of
+    replications: for each seed in seeds, it resamples the rows
+    of y and X with replacement and minimizes the negative
+    log-likelihood with BFGS, starting from beta_hat.
+
+    Each seed is an np.random.SeedSequence, so each replication
+    draws the same sample no matter which process runs it.
+
+    >>> X = np.column_stack([np.ones(6), [0, 0, 0, 1, 1, 1]])
+    >>> y = np.array([1, 0, 0, 1, 1, 0])
+    >>> seeds = np.random.SeedSequence(42).spawn(3)
+    >>> logit_bootstrap_block(y, X, np.zeros(2), seeds).shape
+    (3, 2)
+    >>> logit_bootstrap_block(y, X, np.zeros(2), []).shape
+    (0, 2)
+    """
+
+    n = len(y)
+    beta_boot = np.zeros((len(seeds), len(beta_hat)))
+    for b in range(len(seeds)):
+
+        rng = np.random.default_rng(seeds[b])
+        rows = rng.integers(0, n, size = n)
+
+        soln = minimize(fun = logit_like_grad, x0 = beta_hat,
+                        args = (y[rows], X[rows]),
+                        method = 'BFGS', jac = True)
+        beta_boot[b] = soln.x
+
+    return beta_boot
+
+
+def bootstrap_logit(y: np.ndarray, X: np.ndarray, B: int, n_jobs: int,
+                    seed: int = None,
+                    beta_hat: np.ndarray = None) -> np.ndarray:
+    """Calculates B bootstrap estimates of the coefficients
+    of the logistic regression model, running the replications
+    in n_jobs processes.
+    The standard errors are the standard deviations
+    of the columns of the output:
+    np.std(beta_boot, axis = 0, ddof = 1).
+
+    Each refit starts from beta_hat, the full-sample estimate,
+    which is calculated with logit_newton() if it is not supplied,
+    or with BFGS if Newton's method does not converge
+    or meets a singular Hessian matrix.
+    Each replication gets its own seed, spawned from seed,
+    so the results are the same for any value of n_jobs.
+
+    On Windows, a script that calls this with n_jobs > 1 must do so
+    under if __name__ == "__main__": so that the worker processes
+    do not run the script again.
+
+    >>> X = np.column_stack([np.ones(6), [0, 0, 0, 1, 1, 1]])
+    >>> y = np.array([1, 0, 0, 1, 1, 0])
+    >>> beta_boot = bootstrap_logit(y, X, 20, 1, seed = 42)
+    >>> beta_boot.shape
+    (20, 2)
+    >>> np.array_equal(beta_boot, bootstrap_logit(y, X, 20, 1, seed = 42))
+    True
+    >>> np.array_equal(beta_boot, bootstrap_logit(y, X, 20, 2, seed = 42))
+    True
+    >>> X_sep = np.column_stack([np.ones(4), [0, 0, 1, 1]])
+    >>> bootstrap_logit(np.array([0, 0, 1, 1]), X_sep, 5, 1, seed = 1).shape
+    (5, 2)
+    """
+
+    y = np.asarray(y, dtype = float)
+    X = np.asarray(X, dtype = float)
+    if beta_hat is None:
+        try:
+            beta_hat = logit_newton(y, X, np.zeros(X.shape[1]), 10**(-8), 100)
+        except np.linalg.LinAlgError:
+            beta_hat = None
+        if beta_hat is None:
+            soln = minimize(fun = logit_like_grad, x0 = np.zeros(X.shape[1]),
+                            args = (y, X), method = 'BFGS', jac = True)
+            beta_hat = soln.x
+
+    # One seed for each replication, split into one block per process.
+    seeds = np.random.SeedSequence(seed).spawn(B)
+    blocks = [seeds[j::n_jobs] for j in range(n_jobs)]
+
+    if n_jobs == 1:
+        block_results = [logit_bootstrap_block(y, X, beta_hat, blocks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers = n_jobs) as executor:
+            futures = [executor.submit(logit_bootstrap_block,
+                                       y, X, beta_hat, block)
+                       for block in blocks]
+            block_results = [future.result() for future in futures]
+
+    # Put the replications back in the order of the seeds.
+    beta_boot = np.zeros((B, len(beta_hat)))
+    for j in range(n_jobs):
+        beta_boot[j::n_jobs] = block_results[j]
+
+    return beta_boot
+
+
+
+# Only function definitions above this point.
+
+
+##################################################
+# Test the examples in your docstrings
+##################################################
+
+
+# The tests are implemented below -- but only
+# when the script is run, not when it is imported.
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+
+
+
+
+
+##################################################
+# End
+##################################################
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Comparing Optimization Methods for Logistic Regression
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the numerical methods used in
+# logistic_calculation_soln.py on simulated data
+# with a growing number of observations n and variables k.
+# For each method, it records the time, the number of
+# evaluations of the likelihood, gradient and Hessian,
+# the peak memory and the gap from the likelihood
+# maximized by statsmodels,
+# and saves the results in a csv or json file.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import time
+# To measure the memory allocated during each optimization.
+import tracemalloc
+# To save the report.
+import csv
+import json
+
+import numpy as np
+from scipy.optimize import minimize
+import statsmodels.api as sm
+
+import logistic_module as lm
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def simulate_logit(n: int, k: int, seed: int) -> list:
+    """Simulates a dataset [y, X, beta] for the logistic
+    regression model with n observations and k variables,
+    including a column of ones for the intercept.
+    The other variables are standard normal and the
+    coefficients are drawn from a normal distribution
+    with standard deviation 1/sqrt(k).
+
+    >>> y, X, beta = simulate_logit(100, 3, 42)
+    >>> X.shape
+    (100, 3)
+    >>> bool(np.all(X[:, 0] == 1))
+    True
+    >>> sorted(set(y.tolist()))
+    [0.0, 1.0]
+    """
+
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([np.ones(n), rng.standard_normal((n, k - 1))])
+    beta = rng.standard_normal(k)/np.sqrt(k)
+    probs = 1/(1 + np.exp(-X.dot(beta)))
+    y = (rng.random(n) < probs).astype(float)
+
+    return [y, X, beta]
+
+
+def make_counter(fun) -> list:
+    """Returns a list [fun_counted, counter], where fun_counted
+    calls fun with the same arguments and adds one
+    to counter['count'] each time.
+
+    >>> counted_abs, counter = make_counter(abs)
+    >>> counted_abs(-2)
+    2
+    >>> counted_abs(3)
+    3
+    >>> counter['count']
+    2
+    """
+
+    counter = {'count': 0}
+
+    def fun_counted(*args, **kwargs):
+        counter['count'] = counter['count'] + 1
+        return fun(*args, **kwargs)
+
+    return [fun_counted, counter]
+
+
+def time_logit_method(method: str, y: np.ndarray, X: np.ndarray,
+                      neg_like_sm: float) -> dict:
+    """Minimizes the negative log-likelihood for the logistic
+    regression model with one of the methods
+    'nelder-mead', 'powell', 'BFGS' (without the gradient),
+    'BFGS-jac' (with the gradient) or 'Newton-CG'
+    (with the gradient and Hessian)
+    and returns a dictionary recording the time in seconds,
+    the number of evaluations of the likelihood (nfev),
+    gradient (njev) and Hessian (nhev),
+    the peak memory allocated, in megabytes,
+    and the gap between the minimized negative log-likelihood
+    and neg_like_sm, the value from statsmodels.
+
+    The memory is tracked with tracemalloc, which adds
+    a little to the time of every method.
+
+    >>> y, X, beta = simulate_logit(500, 3, 42)
+    >>> neg_like = lm.logit_terms(np.zeros(3), y, X)[0]
+    >>> record = time_logit_method('BFGS-jac', y, X, neg_like)
+    >>> record['method'], record['n'], record['k']
+    ('BFGS-jac', 500, 3)
+    >>> record['nfev'] == record['njev'] and record['nhev'] == 0
+    True
+    >>> record['like_gap'] < 0
+    True
+    """
+
+    fun, fun_counter = make_counter(lambda beta: lm.logit_terms(beta, y, X)[0])
+    jac, jac_counter = make_counter(lambda beta: lm.logit_like_grad(beta, y, X)[1])
+    hess, hess_counter = make_counter(lambda beta: lm.logit_hessian(beta, y, X))
+
+    beta_0 = np.zeros(X.shape[1])
+    if method == 'nelder-mead':
+        kwargs = {'method': method,
+                  'options': {'xatol': 1e-8, 'fatol': 1e-8, 'maxiter': 20000}}
+    elif method == 'powell':
+        kwargs = {'method': method, 'options': {'xtol': 1e-8, 'maxiter': 20000}}
+    elif method == 'BFGS':
+        kwargs = {'method': 'BFGS'}
+    elif method == 'BFGS-jac':
+        kwargs = {'method': 'BFGS', 'jac': jac}
+    elif method == 'Newton-CG':
+        kwargs = {'method': 'Newton-CG', 'jac': jac, 'hess': hess,
+                  'options': {'xtol': 1e-8}}
+    else:
+        raise ValueError('Unknown method: ' + str(method))
+
+    tracemalloc.start()
+    t1 = time.perf_counter()
+    soln = minimize(fun, beta_0, **kwargs)
+    t2 = time.perf_counter()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'method': method,
+            'n': X.shape[0],
+            'k': X.shape[1],
+            'seconds': t2 - t1,
+            'nfev': fun_counter['count'],
+            'njev': jac_counter['count'],
+            'nhev': hess_counter['count'],
+            'peak_memory_mb': peak_memory/2**20,
+            'like_gap': float(soln.fun - neg_like_sm),
+            'success': bool(soln.success)}
+
+
+def benchmark_logit(sizes: list, methods: list, seed: int) -> list:
+    """Runs time_logit_method() for each method in methods
+    on simulated datasets of each size [n, k] in sizes
+    and returns the list of records.
+
+    >>> records = benchmark_logit([[200, 2], [400, 3]],
+    ...                           ['BFGS', 'Newton-CG'], 42)
+    >>> [(r['method'], r['n'], r['k']) for r in records]
+    [('BFGS', 200, 2), ('Newton-CG', 200, 2), ('BFGS', 400, 3), ('Newton-CG', 400, 3)]
+    """
+
+    records = []
+    for n, k in sizes:
+
+        y, X, beta = simulate_logit(n, k, seed)
+        neg_like_sm = - sm.Logit(y, X).fit(disp = 0).llf
+
+        for method in methods:
+            records.append(time_logit_method(method, y, X, neg_like_sm))
+
+    return records
+
+
+def write_report(records: list, file_name: str) -> None:
+    """Saves the list of records from benchmark_logit()
+    in the file file_name, in json format if the name
+    ends in .json and in csv format otherwise.
+    """
+
+    if file_name.endswith('.json'):
+        with open(file_name, 'w') as report_file:
+            json.dump(records, report_file, indent = 2)
+    else:
+        with open(file_name, 'w', newline = '') as report_file:
+            writer = csv.DictWriter(report_file, fieldnames = list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+
+
+def print_report(records: list) -> None:
+    """Prints the list of records from benchmark_logit()
+    as a table.
+    """
+
+    print("{0:>12}{1:>9}{2:>5}{3:>10}{4:>7}{5:>7}{6:>7}{7:>10}{8:>12}".format(
+          'method', 'n', 'k', 'ms', 'nfev', 'njev', 'nhev', 'MB', 'like_gap'))
+    for r in records:
+        print("{0:>12}{1:>9}{2:>5}{3:>10.1f}{4:>7}{5:>7}{6:>7}{7:>10.2f}{8:>12.2e}".format(
+              r['method'], r['n'], r['k'], r['seconds']*1000.0,
+              r['nfev'], r['njev'], r['nhev'],
+              r['peak_memory_mb'], r['like_gap']))
+
+
+
+if __name__ == '__main__':
+
+    # The same methods as in logistic_calculation_soln.py.
+    methods = ['nelder-mead', 'powell', 'BFGS', 'BFGS-jac', 'Newton-CG']
+    sizes = [[1000, 5], [10000, 5], [100000, 5],
+             [10000, 20], [100000, 20]]
+
+    records = benchmark_logit(sizes, methods, seed = 3004)
+
+    print_report(records)
+    write_report(records, 'logistic_time.csv')
+    write_report(records, 'logistic_time.json')
+
+
+
+##################################################
+# End
+##################################################
@@ -158,9 +158,13 @@ plt.show()
 
 # Exercise 2
 
-def newton_g_opt(x_0: float, maxiter: int, tol: float) -> float:
+def newton_g_opt(x_0: float, maxiter: int, tol: float, 
+                 callback = None) -> float:
     """Calculates optimal value of function g(x)
     using Newton's method.
+    If callback is a function, it is called as 
+    callback(x, g_prime(x), x_next - x) in each iteration, 
+    as described in iteration_trace.py in demo_16.
 
     >>> newton_g_opt(-2, 100, 0.001)
     -2
@@ -168,11 +172,22 @@ def newton_g_opt(x_0: float, maxiter: int, tol: float) -> float:
     -0.7807763785162698
     >>> newton_g_opt(2, 100, 0.001)
     1.2814640376674955
+    >>> x_list = []
+    >>> x_star = newton_g_opt(-2, 100, 0.001, \
+                              callback = lambda x, g_p, step: x_list.append(x))
+    Optimization terminated successfully.
+    Current parameter value: -2
+    Iterations: 0
+    >>> x_list
+    [-2]
     """
     
     x = x_0
     for i in range(maxiter):
-        x_next = x - g_prime(x)/g_2prime(x)
+        g_prime_x = g_prime(x)
+        x_next = x - g_prime_x/g_2prime(x)
+        if callback is not None:
+            callback(x, g_prime_x, x_next - x)
         if abs(x_next - x) < tol:
             print('Optimization terminated successfully.')
             print('Current parameter value: ' + str(x))
@@ -189,6 +204,73 @@ def newton_g_opt(x_0: float, maxiter: int, tol: float) -> float:
 
 
 
+# Newton's method from many starting points
+
+def newton_g_multistart(x_0: np.ndarray, maxiter: int, tol: float, 
+                        merge_tol: float = None) -> list:
+    """Calculates the optimal values of function g(x)
+    using Newton's method from every starting value 
+    in the array x_0 at once.
+    
+    Each starting value is iterated until the step is smaller 
+    than tol, after which it is no longer updated. 
+    The converged values are sorted, and neighbours closer 
+    than merge_tol, which is 10*tol by default, 
+    are combined as the same optimum, reported as their mean. 
+    Returns the list [optima, basin_sizes] of arrays, 
+    where basin_sizes counts the starting values 
+    that converge to each optimum. 
+    Starting values that do not converge in maxiter iterations
+    are not counted. 
+    Both minima and maxima are included: 
+    the minima are the optima with g_2prime(optima) > 0.
+    
+    >>> optima, basin_sizes = newton_g_multistart(np.linspace(-5, 5, 101), 100, 10**(-8))
+    >>> optima.round(6).tolist(), basin_sizes.tolist()
+    ([-2.0, -0.780776, 1.280776], [39, 15, 47])
+    >>> (g_2prime(optima) > 0).tolist()
+    [True, False, True]
+    >>> newton_g_multistart(np.linspace(-5, 5, 101), 100, 10**(-3))[1].tolist()
+    [39, 15, 47]
+    >>> newton_g_multistart(np.array([0.0, 0.0]), 2, 10**(-8))[1].tolist()
+    []
+    """
+    
+    x = np.array(x_0, dtype = float)
+    active = np.ones(x.shape, dtype = bool)
+    
+    for i in range(maxiter):
+        # Update only the values that have not converged. 
+        x_active = x[active]
+        step = - g_prime(x_active)/g_2prime(x_active)
+        x[active] = x_active + step
+        
+        # Stop updating the values that have converged, 
+        # and those that can no longer be updated. 
+        converged = (abs(step) < tol) | ~np.isfinite(step)
+        active[np.flatnonzero(active)[converged]] = False
+        if not np.any(active):
+            break
+    
+    if merge_tol is None:
+        merge_tol = 10*tol
+    
+    # Keep only the values that converged to finite optima.
+    keep = ~active & np.isfinite(x)
+    x_sorted = np.sort(x[keep])
+    
+    # Start a new optimum wherever the gap to the previous value 
+    # is at least merge_tol, and average the values in each one. 
+    labels = np.cumsum(np.diff(x_sorted, prepend = - np.inf) >= merge_tol) - 1
+    basin_sizes = np.bincount(labels)
+    optima = np.bincount(labels, weights = x_sorted)/np.maximum(basin_sizes, 1)
+    # Avoid reporting an optimum at zero as -0.0.
+    optima = optima + 0.0
+    
+    return [optima, basin_sizes]
+
+
+
 # Only function definitions above this point. 
 
 
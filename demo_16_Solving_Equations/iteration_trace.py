@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Recording the Iterations of Numerical Methods
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This module records the progress of the iterative solvers
+# in the course, such as secant_root_f() and newton_root_f()
+# in scipy_solving.py, newton_f_opt() in demo_20,
+# sqrt_z_newton() and sqrt_z_fixed_pt() in assignment_06
+# and newton_g_opt() in assignment_07.
+# Each of these takes an optional argument callback,
+# a function that is called as callback(x, f_x, step)
+# once in every iteration, with the same meaning in all of them:
+#   x is the point at the start of the iteration,
+#     before the step is taken,
+#   f_x is the value at x of the function with a root
+#     at the solution: f(x) for the root-finding methods,
+#     the first derivative for the optimization methods
+#     and g(x) - x for the fixed point method with recurrence g(x),
+#   step is the step taken from x in that iteration,
+#     so the next point is x + step.
+# The values are those already calculated by the solver,
+# so recording them takes no extra function evaluations.
+# With the default callback = None, nothing is recorded.
+#
+# The function make_trace() returns a callback
+# that saves these values, and the elapsed time,
+# in arrays that are created before the solver starts,
+# so that recording takes little time.
+# The function make_counter() counts the number of times
+# a function is evaluated.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import time
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def make_trace(size: int = 1000) -> list:
+    """Returns a list [record, trace], where record is a function
+    to pass as the callback argument of a solver and trace is a
+    dictionary holding the arrays 'x', 'f_x', 'step' and 'time',
+    with room for size iterations, and the number of iterations
+    recorded, 'count'.
+    The time is measured in seconds from the call to make_trace(),
+    so the trace should be made just before calling the solver.
+    Iterations beyond size are counted but not recorded.
+
+    >>> record, trace = make_trace(2)
+    >>> record(1.0, 0.5, -0.25)
+    >>> record(0.75, 0.1, -0.05)
+    >>> record(0.7, 0.01, -0.001)
+    >>> trace['count'], trace['x'].tolist(), trace['step'].tolist()
+    (3, [1.0, 0.75], [-0.25, -0.05])
+    >>> bool(trace['time'][1] >= trace['time'][0] >= 0)
+    True
+    """
+
+    trace = {'count': 0,
+             'x': np.full(size, np.nan),
+             'f_x': np.full(size, np.nan),
+             'step': np.full(size, np.nan),
+             'time': np.full(size, np.nan)}
+    t_start = time.perf_counter()
+
+    def record(x, f_x, step):
+        i = trace['count']
+        if i < size:
+            trace['time'][i] = time.perf_counter() - t_start
+            trace['x'][i] = x
+            trace['f_x'][i] = f_x
+            trace['step'][i] = step
+        trace['count'] = i + 1
+
+    return [record, trace]
+
+
+def trace_table(trace: dict) -> np.ndarray:
+    """Returns the recorded iterations in trace as an array
+    with one row per iteration and columns
+    x, f_x, step and time.
+
+    >>> record, trace = make_trace(5)
+    >>> record(2.0, 4.0, -1.0)
+    >>> record(1.0, 1.0, -0.5)
+    >>> trace_table(trace)[:, 0:3].tolist()
+    [[2.0, 4.0, -1.0], [1.0, 1.0, -0.5]]
+    >>> trace_table(make_trace(5)[1]).shape
+    (0, 4)
+    """
+
+    num_rows = min(trace['count'], len(trace['x']))
+
+    return np.column_stack([trace['x'][0:num_rows],
+                            trace['f_x'][0:num_rows],
+                            trace['step'][0:num_rows],
+                            trace['time'][0:num_rows]])
+
+
+def print_trace(trace: dict) -> None:
+    """Prints the recorded iterations in trace as a table,
+    with the time in milliseconds.
+
+    >>> record, trace = make_trace(5)
+    >>> record(2.0, 4.0, -1.0)
+    >>> print_trace(trace) # doctest: +ELLIPSIS
+       iter                 x               f_x              step        ms
+          0    2.00000000e+00    4.00000000e+00   -1.00000000e+00 ...
+    """
+
+    print("{0:>7}{1:>18}{2:>18}{3:>18}{4:>10}".format(
+          'iter', 'x', 'f_x', 'step', 'ms'))
+    for i, row in enumerate(trace_table(trace)):
+        print("{0:>7}{1:>18.8e}{2:>18.8e}{3:>18.8e}{4:>10.4f}".format(
+              i, row[0], row[1], row[2], row[3]*1000.0))
+    if trace['count'] > len(trace['x']):
+        print("{0} more iterations were not recorded.".format(
+              trace['count'] - len(trace['x'])))
+
+
+def make_counter(fun) -> list:
+    """Returns a list [fun_counted, counter], where fun_counted
+    is a function that calls fun with the same arguments
+    and counter is a dictionary holding the number of calls,
+    'count', so that the number of function evaluations
+    taken by a solver can be checked.
+
+    >>> fun_counted, counter = make_counter(lambda x, a: a*x**2)
+    >>> fun_counted(3.0, 2.0)
+    18.0
+    >>> fun_counted(1.0, a = 0.5)
+    0.5
+    >>> counter['count']
+    2
+    """
+
+    counter = {'count': 0}
+
+    def fun_counted(*args, **kwargs):
+        counter['count'] = counter['count'] + 1
+        return fun(*args, **kwargs)
+
+    return [fun_counted, counter]
+
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Solving Many Systems of Equations at Once
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This module solves a stack of small systems of equations,
+# such as my_eqns_33_p() in scipy_solving.py
+# for many sets of parameters, with Newton's method.
+# Each step solves all of the linear systems
+# J(x) * step = - F(x) in one call to np.linalg.solve()
+# on an array of Jacobian matrices with shape (B, n, n),
+# where B is the number of systems and n the number of equations.
+# The Jacobian is calculated from a function, if one is supplied,
+# and by finite differences otherwise.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def my_eqns_33_batch(x: np.ndarray, parms: np.ndarray) -> np.ndarray:
+    """Evaluates the system of equations in my_eqns_33_p()
+    for each row of x and parms, which have shape (B, 3),
+    and returns the values in an array of shape (B, 3).
+
+    >>> my_eqns_33_batch(np.array([[1.0, 1.0, 1.0]]), np.array([[12, 2, 1]]))
+    array([[-9., -1.,  1.]])
+    >>> my_eqns_33_batch(np.zeros((2, 3)), np.array([[12, 2, 1], [24, 4, 2]]))
+    array([[-12.,  -2.,  -1.],
+           [-24.,  -4.,  -2.]])
+    >>> my_eqns_33_batch(np.ones((4, 3)), np.ones((4, 3))).shape
+    (4, 3)
+    """
+
+    F1 = x[:, 0] + x[:, 1] + x[:, 2]**2 - parms[:, 0]
+    F2 = x[:, 0]**2 - x[:, 1] + x[:, 2] - parms[:, 1]
+    F3 = 2 * x[:, 0] - x[:, 1]**2 + x[:, 2] - parms[:, 2]
+
+    return np.column_stack([F1, F2, F3])
+
+
+def my_eqns_33_jac_batch(x: np.ndarray, parms: np.ndarray) -> np.ndarray:
+    """Calculates the Jacobian matrix of my_eqns_33_batch()
+    with respect to x for each row of x,
+    and returns the matrices in an array of shape (B, 3, 3).
+
+    >>> my_eqns_33_jac_batch(np.array([[1.0, 2.0, 3.0]]), np.zeros((1, 3)))
+    array([[[ 1.,  1.,  6.],
+            [ 2., -1.,  1.],
+            [ 2., -4.,  1.]]])
+    >>> my_eqns_33_jac_batch(np.zeros((5, 3)), np.zeros((5, 3))).shape
+    (5, 3, 3)
+    >>> jac_x = my_eqns_33_jac_batch(np.array([[0.5, -1.0, 2.0]]), np.zeros((1, 3)))
+    >>> bool(np.allclose(jac_x, fd_jacobian_batch(my_eqns_33_batch,
+    ...      np.array([[0.5, -1.0, 2.0]]), (np.zeros((1, 3)),))))
+    True
+    """
+
+    jac = np.zeros((x.shape[0], 3, 3))
+    jac[:, 0, 0] = 1
+    jac[:, 0, 1] = 1
+    jac[:, 0, 2] = 2 * x[:, 2]
+    jac[:, 1, 0] = 2 * x[:, 0]
+    jac[:, 1, 1] = -1
+    jac[:, 1, 2] = 1
+    jac[:, 2, 0] = 2
+    jac[:, 2, 1] = -2 * x[:, 1]
+    jac[:, 2, 2] = 1
+
+    return jac
+
+
+def fd_jacobian_batch(fun, x: np.ndarray, args: tuple = ()) -> np.ndarray:
+    """Calculates the Jacobian matrices of fun(x, *args),
+    a function that returns an array of shape (B, n)
+    for an array x of shape (B, n),
+    by forward differences, one column at a time for all B systems.
+
+    >>> fd_jacobian_batch(lambda x: x**2, np.array([[1.0, 2.0]])).round(6)
+    array([[[2., 0.],
+            [0., 4.]]])
+    >>> fd_jacobian_batch(lambda x, a: a*x, np.ones((2, 2)),
+    ...                   (np.array([[1.0], [3.0]]),)).round(6)
+    array([[[1., 0.],
+            [0., 1.]],
+    <BLANKLINE>
+           [[3., 0.],
+            [0., 3.]]])
+    >>> fd_jacobian_batch(lambda x: x, np.zeros((3, 1))).shape
+    (3, 1, 1)
+    """
+
+    F_x = fun(x, *args)
+    # A step that balances truncation and rounding errors.
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(abs(x), 1.0)
+
+    jac = np.zeros((x.shape[0], F_x.shape[1], x.shape[1]))
+    for j in range(x.shape[1]):
+        x_h = x.copy()
+        x_h[:, j] = x[:, j] + h[:, j]
+        jac[:, :, j] = (fun(x_h, *args) - F_x)/(x_h[:, j] - x[:, j])[:, None]
+
+    return jac
+
+
+def subset_args(args: tuple, rows: np.ndarray) -> tuple:
+    """Selects the rows of the arguments in args that are arrays,
+    leaving the numbers unchanged.
+
+    >>> subset_args((np.array([[1, 2], [3, 4]]), 5.0), np.array([False, True]))
+    (array([[3, 4]]), 5.0)
+    >>> subset_args((), np.array([True]))
+    ()
+    >>> subset_args((np.arange(3),), np.array([0, 2]))
+    (array([0, 2]),)
+    """
+
+    return tuple(arg[rows] if np.ndim(arg) > 0 else arg for arg in args)
+
+
+def newton_batch(fun, x0: np.ndarray, args: tuple = (), jac = None,
+                 tol: float = 10**(-10), maxiter: int = 50) -> list:
+    """Solves the systems of equations fun(x, *args) = 0
+    for each row of x, starting from the rows of x0,
+    with Newton's method.
+
+    The function fun(x, *args) returns an array of shape (B, n)
+    for an array x of shape (B, n), and the arguments in args
+    are numbers or arrays with one row for each system.
+    The function jac(x, *args) returns the Jacobian matrices
+    in an array of shape (B, n, n); if jac is None,
+    they are calculated with fd_jacobian_batch().
+    Each system stops changing once every equation is within tol
+    of zero.
+
+    Returns the list [x, converged, num_iter], where converged
+    indicates the systems that were solved in maxiter iterations
+    and num_iter is the number of iterations taken.
+
+    >>> x, converged, num_iter = newton_batch(my_eqns_33_batch,
+    ...     np.ones((2, 3)), (np.array([[12, 2, 1], [24, 4, 2]]),),
+    ...     jac = my_eqns_33_jac_batch)
+    >>> x.round(6).tolist(), converged.tolist()
+    ([[1.0, 2.0, 3.0], [-0.640666, 1.247138, 4.836686]], [True, True])
+    >>> x_fd = newton_batch(my_eqns_33_batch, np.ones((2, 3)),
+    ...     (np.array([[12, 2, 1], [24, 4, 2]]),))[0]
+    >>> bool(np.allclose(x, x_fd))
+    True
+    >>> newton_batch(lambda x: x**2 + 1, np.ones((1, 1)), maxiter = 5)[1]
+    array([False])
+    """
+
+    x = np.array(x0, dtype = float)
+    active = np.ones(x.shape[0], dtype = bool)
+
+    for num_iter in range(maxiter + 1):
+
+        args_active = subset_args(args, active)
+        F_x = fun(x[active], *args_active)
+
+        # Stop updating the systems that are solved.
+        solved = np.max(abs(F_x), axis = 1) < tol
+        active[np.flatnonzero(active)[solved]] = False
+        if not np.any(active) or num_iter == maxiter:
+            break
+        F_x = F_x[~solved]
+        args_active = subset_args(args, active)
+
+        if jac is None:
+            jac_x = fd_jacobian_batch(fun, x[active], args_active)
+        else:
+            jac_x = jac(x[active], *args_active)
+
+        # Solve all of the linear systems at once.
+        try:
+            step = np.linalg.solve(jac_x, - F_x[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # At least one Jacobian is singular,
+            # so use the pseudo-inverse for all of them.
+            step = np.matmul(np.linalg.pinv(jac_x), - F_x[:, :, None])[:, :, 0]
+
+        x[active] = x[active] + step
+
+    return [x, ~active, num_iter]
+
+
+def newton_sweep(fun, x0: np.ndarray, parms: np.ndarray, jac = None,
+                 num_segments: int = 100, tol: float = 10**(-10),
+                 maxiter: int = 50) -> list:
+    """Solves the systems of equations fun(x, parms) = 0
+    for each row of parms, an array of shape (B, p) with
+    parameters that change gradually from one row to the next.
+
+    The rows are divided into num_segments segments of
+    consecutive rows. The first rows of the segments are solved
+    one at a time, the first one starting from x0 and each of
+    the others from the solution for the previous segment.
+    Then each of the other rows starts from the solution for the
+    previous row, which is usually close to its own solution.
+    The segments are solved in lockstep, one row of every segment
+    at a time, with newton_batch().
+
+    Returns the list [x, converged] for all rows.
+
+    >>> parms = np.column_stack([np.linspace(12, 24, 1001),
+    ...                          np.linspace(2, 4, 1001),
+    ...                          np.linspace(1, 2, 1001)])
+    >>> x, converged = newton_sweep(my_eqns_33_batch, np.ones(3), parms,
+    ...                             jac = my_eqns_33_jac_batch,
+    ...                             num_segments = 10)
+    >>> x[[0, -1]].round(6).tolist(), bool(np.all(converged))
+    ([[1.0, 2.0, 3.0], [1.325285, 2.273186, 4.516805]], True)
+    >>> bool(np.max(abs(my_eqns_33_batch(x, parms))) < 10**(-10))
+    True
+    """
+
+    num_rows = parms.shape[0]
+    num_segments = min(num_segments, num_rows)
+    seg_length = int(np.ceil(num_rows/num_segments))
+    starts = np.arange(0, num_rows, seg_length)
+
+    x = np.zeros((num_rows, np.size(x0)))
+    converged = np.zeros(num_rows, dtype = bool)
+
+    # Solve for the first row of each segment along the whole path,
+    # starting each one from the solution for the previous segment.
+    x_prev = np.zeros((len(starts), np.size(x0)))
+    x_start = np.asarray(x0, dtype = float).reshape(1, -1)
+    for i in range(len(starts)):
+        x_start = newton_batch(fun, x_start, (parms[starts[i:i + 1]],), jac,
+                               tol, maxiter)[0]
+        x_prev[i] = x_start[0]
+
+    for k in range(seg_length):
+
+        rows = starts + k
+        in_segment = rows < np.append(starts[1:], num_rows)
+        rows = rows[in_segment]
+
+        x_k, converged_k, num_iter = newton_batch(fun, x_prev[in_segment],
+                                                  (parms[rows],), jac,
+                                                  tol, maxiter)
+        x[rows] = x_k
+        converged[rows] = converged_k
+
+        # Warm start the next row of each segment from this solution.
+        x_prev[in_segment] = x_k
+
+    return [x, converged]
+
+
+
+def extended_jacobian(fun, x: np.ndarray, lam: float, parms_0: np.ndarray,
+                      d_parms: np.ndarray, jac = None) -> list:
+    """Returns the list [F_x, jac_ext] for the system of equations
+    fun(x, parms_0 + lam*d_parms) = 0 with one solution x,
+    an array of shape (n,), where the parameters move along
+    the line from parms_0 in the direction d_parms.
+    F_x is the array of n function values and jac_ext
+    is the n by (n + 1) Jacobian matrix with respect to x and lam.
+    The derivative with respect to lam is calculated
+    by a forward difference.
+
+    >>> F_x, jac_ext = extended_jacobian(my_eqns_33_batch,
+    ...     np.array([1.0, 2.0, 3.0]), 0.0, np.array([12.0, 2.0, 1.0]),
+    ...     np.array([12.0, 2.0, 1.0]), my_eqns_33_jac_batch)
+    >>> F_x.tolist()
+    [0.0, 0.0, 0.0]
+    >>> jac_ext.round(6).tolist()
+    [[1.0, 1.0, 6.0, -12.0], [2.0, -1.0, 1.0, -2.0], [2.0, -4.0, 1.0, -1.0]]
+    >>> extended_jacobian(lambda x, p: x**2 - p, np.array([1.0]), 0.5,
+    ...     np.array([[1.0]]), np.array([[-2.0]]))[1].round(6).tolist()
+    [[2.0, 2.0]]
+    """
+
+    x_row = x.reshape(1, -1)
+    parms_row = (parms_0 + lam*d_parms).reshape(1, -1)
+    F_x = fun(x_row, parms_row)
+
+    if jac is None:
+        jac_x = fd_jacobian_batch(fun, x_row, (parms_row,))
+    else:
+        jac_x = jac(x_row, parms_row)
+
+    h = np.sqrt(np.finfo(float).eps) * max(abs(lam), 1.0)
+    F_h = fun(x_row, (parms_0 + (lam + h)*d_parms).reshape(1, -1))
+    jac_lam = (F_h - F_x)/h
+
+    return [F_x[0], np.column_stack([jac_x[0], jac_lam[0]])]
+
+
+def continuation(fun, x0: np.ndarray, parms_0: np.ndarray,
+                 parms_1: np.ndarray, jac = None, ds: float = 0.01,
+                 ds_min: float = 10**(-6), ds_max: float = 0.1,
+                 tol: float = 10**(-10), maxiter: int = 10,
+                 max_points: int = 10000) -> list:
+    """Traces the solutions x of fun(x, parms) = 0 as the parameters
+    move along the line from parms_0 (lam = 0) to parms_1 (lam = 1),
+    with pseudo-arclength continuation.
+
+    The curve of solutions (x, lam) is followed by its arclength s,
+    rather than by lam, so that it can be followed around
+    turning points, where the curve folds back and lam decreases.
+    Each point is predicted from the previous one
+    with a step of length ds along the tangent to the curve,
+    and corrected by Newton's method on the n equations and the
+    condition that the point lies on the plane
+    a distance ds along the tangent.
+    The step ds doubles, up to ds_max, when the corrector
+    converges in a few iterations, and is cut in half
+    when it does not converge in maxiter iterations,
+    and the continuation stops if ds falls below ds_min.
+    The turning points are the points where the
+    component of the tangent in the direction of lam,
+    dlam/ds, changes sign.
+
+    The first point is found by newton_batch(), starting from x0.
+    The continuation stops when lam leaves the interval [0, 1],
+    after solving for x at the end of the interval that it left,
+    or after max_points points.
+    If Newton's method does not converge at the end of the interval,
+    it prints a warning and the path ends at the last point found.
+    The arguments are as in newton_batch(), with the parameters
+    parms_0 and parms_1 as arrays of shape (p,).
+
+    Returns the list [x_path, lam_path, turning_points, num_iter],
+    with the solutions in the rows of x_path, the values of lam
+    in lam_path, the indexes of the first points past each turning
+    point and the total number of Newton iterations.
+
+    >>> x_path, lam_path, turning_points, num_iter = continuation(
+    ...     my_eqns_33_batch, np.ones(3), np.array([12, 2, 1]),
+    ...     np.array([24, 4, 2]), jac = my_eqns_33_jac_batch)
+    >>> x_path[[0, -1]].round(6).tolist(), float(lam_path[-1])
+    ([[1.0, 2.0, 3.0], [1.325285, 2.273186, 4.516805]], 1.0)
+    >>> turning_points, bool(num_iter < 3*len(lam_path))
+    ([], True)
+    >>> x_path, lam_path, turning_points, num_iter = continuation(
+    ...     lambda x, p: x**2 - p, np.ones(1), np.array([1.0]),
+    ...     np.array([-1.0]))
+    >>> k = turning_points[0]
+    >>> float(lam_path[k].round(2)), bool(-0.1 < x_path[k, 0] < 0)
+    (0.5, True)
+    >>> float(x_path[-1, 0].round(6)), float(lam_path[-1])
+    (-1.0, 0.0)
+    >>> no_root_at_end = lambda x, p: np.where(p == 1.0, x**2 + 1.0, x - p)
+    >>> x_path, lam_path, turning_points, num_iter = continuation(
+    ...     no_root_at_end, np.zeros(1), np.array([0.0]), np.array([1.0]))
+    Warning: Newton's method did not converge at lam = 1.0.
+    >>> bool(lam_path[-1] < 1.0)
+    True
+    """
+
+    parms_0 = np.asarray(parms_0, dtype = float)
+    d_parms = np.asarray(parms_1, dtype = float) - parms_0
+    n = np.size(x0)
+
+    # Solve for the first point at lam = 0.
+    x_start, converged, num_iter = newton_batch(fun,
+        np.asarray(x0, dtype = float).reshape(1, -1),
+        (parms_0.reshape(1, -1),), jac, tol, maxiter)
+    if not converged[0]:
+        print("Error: No solution found at parms_0.")
+        return None
+
+    z_path = [np.append(x_start[0], 0.0)]
+    turning_points = []
+    # Start off in the direction of increasing lam.
+    tangent = np.zeros(n + 1)
+    tangent[n] = 1.0
+
+    while len(z_path) < max_points:
+
+        z = z_path[-1]
+
+        # The tangent is orthogonal to the rows of the
+        # extended Jacobian, and continues in the same direction.
+        F_z, jac_ext = extended_jacobian(fun, z[0:n], z[n], parms_0,
+                                         d_parms, jac)
+        tangent_new = np.linalg.solve(np.vstack([jac_ext, tangent]),
+                                      np.append(np.zeros(n), 1.0))
+        tangent_new = tangent_new/np.linalg.norm(tangent_new)
+
+        if tangent_new[n]*tangent[n] < 0:
+            turning_points.append(len(z_path) - 1)
+        tangent = tangent_new
+
+        # Predict, then correct on the plane orthogonal to the tangent.
+        converged = False
+        while not converged and ds >= ds_min:
+            z_new = z + ds*tangent
+            for num_corr in range(maxiter):
+                F_z, jac_ext = extended_jacobian(fun, z_new[0:n], z_new[n],
+                                                 parms_0, d_parms, jac)
+                G_z = np.append(F_z, np.dot(tangent, z_new - z) - ds)
+                if np.max(abs(G_z)) < tol:
+                    converged = True
+                    break
+                num_iter = num_iter + 1
+                z_new = z_new - np.linalg.solve(np.vstack([jac_ext, tangent]),
+                                                G_z)
+            if not converged:
+                ds = ds/2
+
+        if not converged:
+            print("Warning: Step size fell below ds_min at lam = " +
+                  str(z[n]) + ".")
+            break
+
+        # Take longer steps when the corrector converges quickly.
+        if num_corr <= 3:
+            ds = min(2*ds, ds_max)
+
+        if z_new[n] > 1 or z_new[n] < 0:
+            # Solve at the end of the interval that the path left,
+            # starting from the point on the line between the last two
+            # points.
+            lam_end = float(z_new[n] > 1)
+            z_end = z + (lam_end - z[n])/(z_new[n] - z[n])*(z_new - z)
+            x_end, converged, num_end = newton_batch(fun,
+                z_end[0:n].reshape(1, -1),
+                ((parms_0 + lam_end*d_parms).reshape(1, -1),), jac,
+                tol, maxiter)
+            num_iter = num_iter + num_end
+            if not converged[0]:
+                print("Warning: Newton's method did not converge at lam = " +
+                      str(lam_end) + ".")
+                break
+            z_path.append(np.append(x_end[0], lam_end))
+            break
+
+        z_path.append(z_new)
+
+    z_path = np.array(z_path)
+
+    return [z_path[:, 0:n], z_path[:, n], turning_points, num_iter]
+
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
@@ -267,18 +267,28 @@ print(f(m_6))
 
 # The following function solves for the root of the function ```f(x)``` above. 
 
-def secant_root_f(x0, x1, tol, num_iter):
+def secant_root_f(x0, x1, tol, num_iter, callback = None):
     """Solves for the root of the function f(x) 
     using the secant method.
+    If callback is a function, it is called as 
+    callback(x1, f(x1), x2 - x1) in each iteration, 
+    as described in iteration_trace.py.
     """
     
+    # Keep the function values from one iteration to the next,
+    # so that f is evaluated only once per iteration.
+    f_x0 = f(x0)
+    f_x1 = f(x1)
     for i in range(num_iter):
         
-        x2 = x1 - f(x1)*(x1-x0)/(f(x1)-f(x0))
-        if (abs(f(x2)) < tol):
+        x2 = x1 - f_x1*(x1-x0)/(f_x1-f_x0)
+        if callback is not None:
+            callback(x1, f_x1, x2 - x1)
+        f_x2 = f(x2)
+        if (abs(f_x2) < tol):
             return x2
-        x0 = x1
-        x1 = x2
+        x0, f_x0 = x1, f_x1
+        x1, f_x1 = x2, f_x2
         
     # If it reaches the end of the loop, it has
     # exceeded the maximum number of iterations.
@@ -346,15 +356,23 @@ def f_prime(x):
 
 # The following function solves for the root of the function ```f(x)``` above. 
 
-def newton_root_f(x0, tol, num_iter):
+def newton_root_f(x0, tol, num_iter, callback = None):
     """Solves for the root of the function f(x)
     using Newton's method.
+    If callback is a function, it is called as 
+    callback(x_i, f(x_i), x_next - x_i) in each iteration, 
+    as described in iteration_trace.py.
     """
     x_i = x0
+    f_x_i = f(x_i)
     for i in range(num_iter):
         
-        x_i = x_i - f(x_i)/f_prime(x_i)
-        if (abs(f(x_i)) < tol):
+        x_next = x_i - f_x_i/f_prime(x_i)
+        if callback is not None:
+            callback(x_i, f_x_i, x_next - x_i)
+        f_x_next = f(x_next)
+        x_i, f_x_i = x_next, f_x_next
+        if (abs(f_x_next) < tol):
             return x_i
         
     # If it reaches the end of the loop, it has
@@ -375,6 +393,141 @@ print(x_root)
 # (and that the derivative exists!). 
 
 
+#--------------------------------------------------
+#### Tracing the iterations
+#--------------------------------------------------
+
+# Both functions above take an optional argument callback, 
+# a function that is called in every iteration
+# with the current value of x, the value of f(x) and the step
+# taken from x. 
+# The module iteration_trace.py provides a callback that records
+# these values, with the elapsed time, in arrays
+# that are allocated before the iterations start. 
+
+import iteration_trace as it
+
+record, trace = it.make_trace(100)
+x_root = secant_root_f(1, 2, 10**(-7), 100, callback = record)
+it.print_trace(trace)
+
+record, trace = it.make_trace(100)
+x_root = newton_root_f(1, 10**(-7), 100, callback = record)
+it.print_trace(trace)
+
+# Compare the number of iterations and the size of the steps.
+# Newton's method takes fewer, larger steps toward the root. 
+# The same callback works with sqrt_z_newton() and sqrt_z_fixed_pt()
+# in assignment 6, newton_g_opt() in assignment 7 
+# and newton_f_opt() in demo 20. 
+
+
+#--------------------------------------------------
+#### Counting the function evaluations
+#--------------------------------------------------
+
+# The functions above find the root of the function f(x)
+# defined in this script. 
+# The versions below take the function as an argument, 
+# along with any other arguments args for the function, 
+# so they can be used with any function. 
+# Each iteration evaluates the function only once, 
+# at the new point, and keeps the values from the 
+# previous iterations, which matters when the function
+# takes a long time to evaluate. 
+
+def secant_root(fun, x0, x1, tol, num_iter, args = (), callback = None):
+    """Solves for the root of the function fun(x, *args) 
+    using the secant method, evaluating fun 
+    once in each iteration.
+    If callback is a function, it is called as 
+    callback(x1, fun(x1, *args), x2 - x1) in each iteration, 
+    as described in iteration_trace.py.
+    """
+    
+    f_x0 = fun(x0, *args)
+    f_x1 = fun(x1, *args)
+    for i in range(num_iter):
+        
+        x2 = x1 - f_x1*(x1 - x0)/(f_x1 - f_x0)
+        if callback is not None:
+            callback(x1, f_x1, x2 - x1)
+        f_x2 = fun(x2, *args)
+        if (abs(f_x2) < tol):
+            return x2
+        x0, f_x0 = x1, f_x1
+        x1, f_x1 = x2, f_x2
+        
+    print("Exceeded allowed number of iterations")
+    return None
+
+
+def newton_root(fun, fun_prime, x0, tol, num_iter, args = (), callback = None):
+    """Solves for the root of the function fun(x, *args)
+    using Newton's method, evaluating fun and its 
+    derivative fun_prime once in each iteration.
+    If callback is a function, it is called as 
+    callback(x_i, fun(x_i, *args), x_next - x_i) in each iteration, 
+    as described in iteration_trace.py.
+    """
+    
+    x_i = x0
+    f_x_i = fun(x_i, *args)
+    for i in range(num_iter):
+        
+        x_next = x_i - f_x_i/fun_prime(x_i, *args)
+        if callback is not None:
+            callback(x_i, f_x_i, x_next - x_i)
+        f_x_next = fun(x_next, *args)
+        x_i, f_x_i = x_next, f_x_next
+        if (abs(f_x_next) < tol):
+            return x_i
+        
+    print("Exceeded allowed number of iterations")
+    return None
+
+
+# The function make_counter() in iteration_trace.py 
+# wraps a function so that it counts the number of times
+# it is called. 
+
+f_counted, f_count = it.make_counter(f)
+record, trace = it.make_trace(100)
+x_root = secant_root(f_counted, 1, 2, 10**(-7), 100, callback = record)
+print(x_root)
+print(f_count['count'])
+print(trace['count'])
+# The number of evaluations is two more than the number of iterations, 
+# for the two starting values. 
+
+f_counted, f_count = it.make_counter(f)
+f_prime_counted, f_prime_count = it.make_counter(f_prime)
+record, trace = it.make_trace(100)
+x_root = newton_root(f_counted, f_prime_counted, 1, 10**(-7), 100, 
+                     callback = record)
+print(x_root)
+print(f_count['count'])
+print(f_prime_count['count'])
+print(trace['count'])
+# Newton's method evaluates f once more than the number of iterations, 
+# for the starting value, and f_prime once per iteration. 
+
+
+# The same functions work with other functions and arguments, 
+# such as quad_fn() above, with roots at 1 and 2. 
+
+def quad_fn_prime(x, a, b, c):
+    return 2*a*x + b
+
+x_root = secant_root(quad_fn, 0, 0.5, 10**(-10), 100, args = (1, -3, 2))
+print(x_root)
+
+x_root = newton_root(quad_fn, quad_fn_prime, 3, 10**(-10), 100, 
+                     args = (1, -3, 2))
+print(x_root)
+
+
+
 
 ################################################################################
 # Solving Nonlinear equations with Python Modules
@@ -572,6 +725,121 @@ print(soln_m33_p.fun)
 print(my_eqns_33_p(soln_m33_p.x, parms))
 
 
+
+#--------------------------------------------------
+### Solving many systems at once
+#--------------------------------------------------
+
+# When the same system must be solved for many sets of parameters, 
+# calling optimize.root() in a loop repeats the same small calculations
+# one at a time. 
+# The module newton_systems.py solves a stack of systems at once
+# with Newton's method, using a function for the Jacobian matrix, 
+# if one is available. 
+
+import time
+import newton_systems as ns
+
+# The two sets of parameters above, one in each row.
+parms_batch = np.array([[12, 2, 1], 
+                        [24, 4, 2]])
+x0_batch = np.array([[1.0, 1.0, 1.0], 
+                     [0.0, 0.0, 0.0]])
+
+x_batch, converged, num_iter = ns.newton_batch(ns.my_eqns_33_batch, x0_batch, 
+                                               (parms_batch,), 
+                                               jac = ns.my_eqns_33_jac_batch)
+print(x_batch)
+print(converged)
+print(ns.my_eqns_33_batch(x_batch, parms_batch))
+
+
+# Now trace the solution as the parameters move gradually
+# from [12, 2, 1] to [24, 4, 2] over 100,000 steps. 
+# Each solution starts from the solution for the previous parameters, 
+# which is close by, so it takes only a few Newton steps. 
+parms_path = np.column_stack([np.linspace(12, 24, 100000), 
+                              np.linspace(2, 4, 100000), 
+                              np.linspace(1, 2, 100000)])
+
+t1 = time.perf_counter()
+x_path, converged = ns.newton_sweep(ns.my_eqns_33_batch, [1, 1, 1], parms_path, 
+                                    jac = ns.my_eqns_33_jac_batch, 
+                                    num_segments = 1000)
+t2 = time.perf_counter()
+print("Seconds for newton_sweep(): " + str(t2 - t1))
+print(np.all(converged))
+
+# Compare with the time for optimize.root() on the first 1,000 parameters, 
+# each starting from the same initial guess.
+x0 = [1, 1, 1]
+t1 = time.perf_counter()
+for i in range(1000):
+    soln_i = optimize.root(my_eqns_33_p, x0, parms_path[i])
+t2 = time.perf_counter()
+print("Seconds for optimize.root(), 100 times as many: " + str(100*(t2 - t1)))
+
+
+# Plot the solution along the path.
+plt.figure()
+plt.plot(parms_path[:, 0], x_path[:, 0], label = 'x[0]')
+plt.plot(parms_path[:, 0], x_path[:, 1], label = 'x[1]')
+plt.plot(parms_path[:, 0], x_path[:, 2], label = 'x[2]')
+plt.xlabel('parms[0]')
+plt.ylabel('Solution')
+plt.legend()
+plt.show()
+
+
+
+#--------------------------------------------------
+### Following a curve of solutions
+#--------------------------------------------------
+
+# Instead of solving on a fixed grid of parameters, 
+# the function continuation() follows the curve of solutions
+# as the parameters move along the line from parms_0 to parms_1, 
+# predicting each solution from the previous one
+# and correcting it with Newton's method. 
+# It takes long steps where the curve is straight 
+# and short steps where it bends. 
+
+x_path, lam_path, turning_points, num_iter = \
+    ns.continuation(ns.my_eqns_33_batch, [1, 1, 1], 
+                    np.array([12, 2, 1]), np.array([24, 4, 2]), 
+                    jac = ns.my_eqns_33_jac_batch)
+print(len(lam_path))
+print(num_iter)
+print(x_path[-1])
+
+
+# Along some paths, the solution disappears where the curve
+# of solutions folds back, at a turning point. 
+x_path, lam_path, turning_points, num_iter = \
+    ns.continuation(ns.my_eqns_33_batch, [1, 1, 1], 
+                    np.array([12, 2, 1]), np.array([12, 2, 20]), 
+                    jac = ns.my_eqns_33_jac_batch)
+print(turning_points)
+print(lam_path[turning_points])
+
+# The curve returns to lam = 0 at another solution
+# for the original parameters [12, 2, 1].
+print(x_path[-1])
+print(my_eqns_33_p(x_path[-1], [12, 2, 1]))
+
+
+# Plot the solution against lam. 
+plt.figure()
+plt.plot(lam_path, x_path[:, 0], label = 'x[0]')
+plt.plot(lam_path, x_path[:, 1], label = 'x[1]')
+plt.plot(lam_path, x_path[:, 2], label = 'x[2]')
+plt.plot(lam_path[turning_points], x_path[turning_points, 0], 'ko')
+plt.xlabel('lam')
+plt.ylabel('Solution')
+plt.legend()
+plt.show()
+
+
 ##################################################
 # End
 ##################################################
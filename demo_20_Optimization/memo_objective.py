@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Remembering the Values of an Objective Function
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# The optimization functions in scipy.optimize often evaluate
+# the objective function and its gradient at the same
+# parameter values more than once, for example,
+# when the line search evaluates the function at a point
+# and the gradient is evaluated separately at the same point.
+# The function memoize() returns versions of the objective
+# and gradient that remember the values for the most recently
+# used parameter vectors, up to maxsize of them,
+# and count how often a value was found in memory.
+# The parameter vectors are identified by their bytes,
+# x.tobytes(), so only the exact same vector counts as a match.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def memoize(fun, jac = None, maxsize: int = 128) -> list:
+    """Returns a list [fun_memo, jac_memo, stats] with versions
+    of the objective function fun(x, *args) and its gradient
+    that store their values for the last maxsize
+    parameter vectors x, in order of their last use,
+    dropping the least recently used vector when the memory is full.
+
+    If jac is a function, jac(x, *args) returns the gradient,
+    and fun_memo and jac_memo call fun and jac
+    only for vectors x for which that value is not stored.
+    If jac is True, fun(x, *args) returns both the objective
+    and the gradient, as for the argument jac = True in minimize(),
+    and one call provides both values.
+    If jac is None, jac_memo is None.
+    If maxsize is less than 1, it prints an error message
+    and returns None.
+
+    The values are stored for each x and for the objects in args,
+    identified by id(). Each stored value keeps a reference to
+    its args, so that those objects are not freed and their ids
+    are not reused by new objects while the value is in memory.
+    The arrays in args should not be changed in place.
+    The dictionary stats counts the 'hits', when a value is found
+    in memory, and the 'misses', when it is calculated,
+    with the number of evaluations of fun and jac in 'fun_evals'
+    and 'jac_evals'.
+
+    >>> fun_memo, jac_memo, stats = memoize(lambda x: sum(x**2),
+    ...                                     lambda x: 2*x)
+    >>> float(fun_memo(np.array([1.0, 2.0])))
+    5.0
+    >>> jac_memo(np.array([1.0, 2.0])).tolist()
+    [2.0, 4.0]
+    >>> float(fun_memo(np.array([1.0, 2.0])))
+    5.0
+    >>> stats
+    {'hits': 1, 'misses': 2, 'fun_evals': 1, 'jac_evals': 1}
+    >>> fun_memo, jac_memo, stats = memoize(lambda x, a: (a*sum(x**2), 2*a*x),
+    ...                                     True, maxsize = 1)
+    >>> jac_memo(np.array([3.0]), 0.5).tolist(), float(fun_memo(np.array([3.0]), 0.5))
+    ([3.0], 4.5)
+    >>> float(fun_memo(np.array([1.0]), 0.5)), jac_memo(np.array([3.0]), 0.5).tolist()
+    (0.5, [3.0])
+    >>> stats, round(hit_rate(stats), 4)
+    ({'hits': 1, 'misses': 3, 'fun_evals': 3, 'jac_evals': 3}, 0.25)
+    >>> fun_memo, jac_memo, stats = memoize(lambda x, a: float(a[0]))
+    >>> [fun_memo(np.zeros(1), np.array([k*1.0])) for k in range(1, 5)]
+    [1.0, 2.0, 3.0, 4.0]
+    >>> stats['hits']
+    0
+    >>> memoize(lambda x: sum(x**2), maxsize = 0)
+    Error: maxsize must be at least 1.
+    """
+
+    if maxsize < 1:
+        print("Error: maxsize must be at least 1.")
+        return None
+
+    memory = OrderedDict()
+    stats = {'hits': 0, 'misses': 0, 'fun_evals': 0, 'jac_evals': 0}
+
+    def lookup(x, args):
+        x = np.asarray(x, dtype = float)
+        key = (x.shape, x.tobytes(), tuple(id(arg) for arg in args))
+        if key in memory:
+            memory.move_to_end(key)
+        else:
+            # Keep args with the values, so that the ids in the key
+            # cannot belong to other objects.
+            memory[key] = [None, None, args]
+            if len(memory) > maxsize:
+                memory.popitem(last = False)
+        return [x, memory[key]]
+
+    def evaluate(x, args, i):
+        x, values = lookup(x, args)
+        if values[i] is not None:
+            stats['hits'] = stats['hits'] + 1
+        else:
+            stats['misses'] = stats['misses'] + 1
+            if jac is True:
+                f_x, grad_x = fun(x, *args)
+                values[0], values[1] = f_x, np.array(grad_x, dtype = float)
+                stats['fun_evals'] = stats['fun_evals'] + 1
+                stats['jac_evals'] = stats['jac_evals'] + 1
+            elif i == 0:
+                values[0] = fun(x, *args)
+                stats['fun_evals'] = stats['fun_evals'] + 1
+            else:
+                values[1] = np.array(jac(x, *args), dtype = float)
+                stats['jac_evals'] = stats['jac_evals'] + 1
+        return values[i]
+
+    def fun_memo(x, *args):
+        return evaluate(x, args, 0)
+
+    if jac is None:
+        return [fun_memo, None, stats]
+
+    def jac_memo(x, *args):
+        # Return a copy, in case the optimizer changes it in place.
+        return evaluate(x, args, 1).copy()
+
+    return [fun_memo, jac_memo, stats]
+
+
+def hit_rate(stats: dict) -> float:
+    """Returns the fraction of the calls to the functions
+    returned by memoize() that were found in memory.
+
+    >>> hit_rate({'hits': 3, 'misses': 1})
+    0.75
+    >>> hit_rate({'hits': 0, 'misses': 0})
+    0.0
+    >>> hit_rate({'hits': 0, 'misses': 5})
+    0.0
+    """
+
+    num_calls = stats['hits'] + stats['misses']
+    if num_calls == 0:
+        return 0.0
+
+    return stats['hits']/num_calls
+
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
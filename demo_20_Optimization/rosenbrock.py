@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# The Rosenbrock Function in Many Dimensions
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This module defines the Rosenbrock function, its gradient,
+# its Hessian matrix and the product of the Hessian with a vector,
+# as in scipy_optimization.py, for vectors x of any length n.
+# The function, the gradient and the Hessian-vector product
+# also accept an array with one point in each row,
+# with shape (B, n), and evaluate all B points at once.
+# Each term of the function depends only on x[i] and x[i + 1],
+# so the Hessian is tridiagonal: it is returned as a sparse matrix,
+# which stores about 3*n numbers instead of n**2.
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import numpy as np
+from scipy import sparse
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def rosen(x: np.ndarray) -> np.ndarray:
+    """The Rosenbrock function, for a point x with shape (n,)
+    or for each row of an array x with shape (B, n).
+
+    >>> float(rosen(np.ones(5)))
+    0.0
+    >>> float(rosen(np.array([1.3, 0.7, 0.8, 1.9, 1.2])).round(6))
+    848.22
+    >>> rosen(np.array([[1.0, 1.0], [0.0, 0.0], [1.0, 0.0]])).tolist()
+    [0.0, 1.0, 100.0]
+    """
+
+    x = np.asarray(x, dtype = float)
+
+    return np.sum(100.0*(x[..., 1:] - x[..., :-1]**2)**2
+                  + (1 - x[..., :-1])**2, axis = -1)
+
+
+def rosen_der(x: np.ndarray) -> np.ndarray:
+    """The gradient of the Rosenbrock function, for a point x
+    with shape (n,) or for each row of an array x with shape (B, n).
+
+    >>> bool(np.all(rosen_der(np.ones(4)) == 0))
+    True
+    >>> rosen_der(np.array([1.3, 0.7, 0.8, 1.9, 1.2])).round(6).tolist()
+    [515.4, -285.4, -341.6, 2085.4, -482.0]
+    >>> rosen_der(np.array([[0.0, 0.0], [1.0, 0.0]])).tolist()
+    [[-2.0, 0.0], [400.0, -200.0]]
+    """
+
+    x = np.asarray(x, dtype = float)
+    diff = x[..., 1:] - x[..., :-1]**2
+
+    der = np.zeros_like(x)
+    der[..., :-1] = -400*x[..., :-1]*diff - 2*(1 - x[..., :-1])
+    der[..., 1:] = der[..., 1:] + 200*diff
+
+    return der
+
+
+def rosen_hess_diags(x: np.ndarray) -> list:
+    """Returns the list [diagonal, off_diagonal] with the nonzero
+    diagonals of the Hessian matrix of the Rosenbrock function,
+    for a point x with shape (n,) or for each row of an array x
+    with shape (B, n). The Hessian is symmetric,
+    so the same off-diagonal is above and below the diagonal.
+
+    >>> [d.tolist() for d in rosen_hess_diags(np.ones(3))]
+    [[802.0, 1002.0, 200.0], [-400.0, -400.0]]
+    >>> [d.tolist() for d in rosen_hess_diags(np.array([[0.5, 0.0]]))]
+    [[[302.0, 200.0]], [[-200.0]]]
+    >>> rosen_hess_diags(np.zeros((7, 5)))[1].shape
+    (7, 4)
+    """
+
+    x = np.asarray(x, dtype = float)
+
+    diagonal = np.zeros_like(x)
+    diagonal[..., :-1] = 1200*x[..., :-1]**2 - 400*x[..., 1:] + 2
+    diagonal[..., 1:] = diagonal[..., 1:] + 200
+    off_diagonal = -400*x[..., :-1]
+
+    return [diagonal, off_diagonal]
+
+
+def rosen_hess(x: np.ndarray) -> sparse.csr_matrix:
+    """The Hessian matrix of the Rosenbrock function at a point x
+    with shape (n,), as a sparse matrix with three diagonals.
+
+    >>> rosen_hess(np.ones(3)).toarray().tolist()
+    [[802.0, -400.0, 0.0], [-400.0, 1002.0, -400.0], [0.0, -400.0, 200.0]]
+    >>> rosen_hess(np.ones(10**5)).nnz
+    299998
+    >>> x = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+    >>> p = np.array([1.0, -1.0, 2.0, 0.0, 0.5])
+    >>> bool(np.allclose(rosen_hess(x).dot(p), rosen_hess_p(x, p)))
+    True
+    """
+
+    diagonal, off_diagonal = rosen_hess_diags(x)
+
+    return sparse.diags([off_diagonal, diagonal, off_diagonal], [-1, 0, 1],
+                        format = 'csr')
+
+
+def rosen_hess_p(x: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """The product of the Hessian matrix of the Rosenbrock function
+    at x with the vector p, for a point x with shape (n,)
+    or for each row of x and p, arrays with shape (B, n).
+
+    >>> rosen_hess_p(np.ones(3), np.array([1.0, 0.0, 0.0])).tolist()
+    [802.0, -400.0, 0.0]
+    >>> rosen_hess_p(np.ones(3), np.ones(3)).tolist()
+    [402.0, 202.0, -200.0]
+    >>> rosen_hess_p(np.ones((2, 3)), np.array([[1.0, 0.0, 0.0],
+    ...                                         [1.0, 1.0, 1.0]])).tolist()
+    [[802.0, -400.0, 0.0], [402.0, 202.0, -200.0]]
+    """
+
+    diagonal, off_diagonal = rosen_hess_diags(x)
+    p = np.asarray(p, dtype = float)
+
+    Hp = diagonal*p
+    Hp[..., :-1] = Hp[..., :-1] + off_diagonal*p[..., 1:]
+    Hp[..., 1:] = Hp[..., 1:] + off_diagonal*p[..., :-1]
+
+    return Hp
+
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+
+##################################################
+# End
+##################################################
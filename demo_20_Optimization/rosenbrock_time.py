@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Timing the Optimization Methods on the Rosenbrock Function
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the time and the memory it takes
+# to minimize the Rosenbrock function in n dimensions,
+# for n from 10 to 10,000, with the Nelder-Mead, Powell,
+# BFGS and Newton-CG methods in scipy.optimize.minimize(),
+# using the functions in rosenbrock.py.
+# Newton-CG uses the sparse Hessian matrix.
+# The memory is the peak memory allocated during the optimization,
+# measured with tracemalloc in a second run,
+# since tracemalloc slows down the calculations.
+# Each run is stopped after time_budget seconds,
+# by a callback that raises StopIteration, and a method is not run
+# for larger values of n once it has been stopped,
+# or if it would be expected to need more than mem_budget megabytes,
+# assuming that the memory grows with n**2, as it does for the
+# dense matrices in Nelder-Mead, Powell and BFGS.
+# The report records res.success and res.nit from the result,
+# and a method is reported as converged only if it reports success
+# and the value is within fun_tol of the minimum value of zero,
+# since Nelder-Mead, for example, can stop at a value near 0.08
+# for n = 10 and still report success.
+#
+##################################################
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.optimize import minimize
+
+import rosenbrock as rb
+
+
+def start_point(n):
+    """ (int) -> numpy.ndarray
+
+    Return the starting point for n dimensions, repeating
+    the starting point in scipy_optimization.py.
+    """
+
+    return np.resize(np.array([1.3, 0.7, 0.8, 1.9, 1.2]), n)
+
+
+def run_method(method, n, time_budget):
+    """ (str, int, float) -> scipy.optimize.OptimizeResult
+
+    Return the result of minimizing the Rosenbrock function
+    in n dimensions with the method, stopping after
+    time_budget seconds.
+    """
+
+    t_start = time.perf_counter()
+
+    def stop_at_budget(xk):
+        if time.perf_counter() - t_start > time_budget:
+            raise StopIteration
+
+    if method == 'BFGS':
+        return minimize(rb.rosen, start_point(n), method = method,
+                        jac = rb.rosen_der, callback = stop_at_budget)
+    elif method == 'Newton-CG':
+        return minimize(rb.rosen, start_point(n), method = method,
+                        jac = rb.rosen_der, hess = rb.rosen_hess,
+                        options = {'xtol': 1e-8}, callback = stop_at_budget)
+    else:
+        return minimize(rb.rosen, start_point(n), method = method,
+                        callback = stop_at_budget)
+
+
+def time_method(method, n, time_budget):
+    """ (str, int, float) -> list
+
+    Return the list [result, milliseconds] for minimizing
+    the Rosenbrock function in n dimensions with the method.
+    """
+
+    t1 = time.perf_counter()
+    result = run_method(method, n, time_budget)
+    t2 = time.perf_counter()
+
+    return [result, (t2 - t1) * 1000.0]
+
+
+def run_status(result, ms, time_budget, fun_tol):
+    """ (scipy.optimize.OptimizeResult, float, float, float) -> str
+
+    Return 'stopped' if the method was stopped by the time budget,
+    'converged' if it reports success and the value of the
+    function is within fun_tol of the minimum value of zero,
+    and 'not converged' otherwise.
+    """
+
+    if not result.success and ms > time_budget * 1000.0:
+        return 'stopped'
+    elif result.success and abs(result.fun) < fun_tol:
+        return 'converged'
+    else:
+        return 'not converged'
+
+
+def peak_memory(method, n, time_budget):
+    """ (str, int, float) -> float
+
+    Return the peak memory, in megabytes, allocated while
+    minimizing the Rosenbrock function in n dimensions
+    with the method.
+    """
+
+    tracemalloc.start()
+    run_method(method, n, time_budget)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak/10**6
+
+
+def print_times(methods, n_list, time_budget, mem_budget, fun_tol = 10**(-6)):
+    """ (list, list, float, float, float) -> dict
+
+    Print the time in milliseconds, the peak memory in megabytes,
+    the number of function evaluations and iterations, the value of the
+    function at the minimum, whether the method reported success
+    and the status from run_status(), for each method and each n in n_list,
+    skipping the larger values of n for each method once it
+    is stopped or the expected memory exceeds the budget.
+    Return a dictionary with a list of the rows printed
+    [n, milliseconds, megabytes, evaluations, iterations, value,
+    success, status] for each method.
+    """
+
+    results = {}
+    for method in methods:
+        results[method] = []
+
+    print('method', 'n', 'ms', 'MB', 'evals', 'iters', 'value', 'success',
+          'status', sep='\t\t')
+    for method in methods:
+        n_prev = None
+        for n in n_list:
+
+            if n_prev is not None:
+                # Skip this n if the method was stopped for the last n
+                # or the memory would exceed the budget, growing with n**2.
+                last_mem, last_status = [results[method][-1][i]
+                                         for i in [2, 7]]
+                if (last_status == 'stopped' or
+                        last_mem * (n/n_prev)**2 > mem_budget):
+                    print("{0:<16}{1:<16}{2:>10}".format(method, n, 'skipped'))
+                    continue
+
+            result, ms = time_method(method, n, time_budget)
+            mb = peak_memory(method, n, time_budget)
+            status = run_status(result, ms, time_budget, fun_tol)
+            results[method].append([n, ms, mb, result.nfev, result.nit,
+                                    result.fun, result.success, status])
+            n_prev = n
+
+            print("{0:<16}{1:<16}{2:10.1f}\t{3:10.3f}\t{4:10d}\t{5:10d}\t{6:10.3e}\t{7}\t\t{8}".format(
+                    method, n, ms, mb, result.nfev, result.nit, result.fun,
+                    result.success, status))
+
+    return results
+
+
+if __name__ == '__main__':
+
+    methods = ['Nelder-Mead', 'Powell', 'BFGS', 'Newton-CG']
+    n_list = [10, 100, 1000, 10000]
+    print_times(methods, n_list, time_budget = 10.0, mem_budget = 1000.0)
@@ -81,10 +81,16 @@ def f_2prime(x):
 # and to stop when the step size is less than ```tol = 0.0001```.
 
 def newton_f_opt(x0, f_prime, f_2prime, 
-                 maxiter = 100, tol = 0.0001):
+                 maxiter = 100, tol = 0.0001, callback = None):
     x = x0
     for i in range(maxiter):
-        x_next = x - f_prime(x)/f_2prime(x)
+        f_prime_x = f_prime(x)
+        x_next = x - f_prime_x/f_2prime(x)
+        # Record the iteration, if requested, as described in 
+        # iteration_trace.py in demo_16: 
+        # the first derivative is the function with a root at the optimum.
+        if callback is not None:
+            callback(x, f_prime_x, x_next - x)
         if x_next - x < tol:
             print('Optimization terminated successfully.')
             print('Current parameter value: ' + str(x))
@@ -318,6 +324,91 @@ print(rosen(res_hp.x))
 
 
 
+
+#--------------------------------------------------
+# Remembering the function values
+#--------------------------------------------------
+
+# The algorithms sometimes evaluate the function at the same point
+# more than once. 
+# The module memo_objective.py remembers the values of the function
+# and the gradient at the most recent points, 
+# and counts how often a value was found in memory. 
+
+import memo_objective as mo
+
+rosen_memo, rosen_der_memo, rosen_stats = mo.memoize(rosen, rosen_der)
+
+x0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+res_dfp_memo = minimize(rosen_memo, x0, method='powell',
+               options={'xtol': 1e-8, 'disp': True})
+
+print(res_dfp_memo.x)
+print(rosen_stats)
+print(mo.hit_rate(rosen_stats))
+# The Powell method returns to some of the same points 
+# when it searches along each direction. 
+
+
+# The function and the derivative share the differences 
+# x[1:] - x[:-1]**2, so it saves time to calculate them together. 
+def rosen_and_der(x):
+    diff = x[1:] - x[:-1]**2
+    f_x = sum(100.0*diff**2 + (1 - x[:-1])**2)
+    der = np.zeros_like(x)
+    der[:-1] = -400*x[:-1]*diff - 2*(1 - x[:-1])
+    der[1:] = der[1:] + 200*diff
+    return f_x, der
+
+print(rosen_and_der(x0))
+print(rosen(x0), rosen_der(x0))
+
+
+# With jac = True, one call to rosen_and_der gives both values,
+# so the derivative is always found in memory. 
+rosen_memo, rosen_der_memo, rosen_stats = mo.memoize(rosen_and_der, True)
+
+res_bfgs_memo = minimize(rosen_memo, x0, method='BFGS', jac=rosen_der_memo,
+                    options={'disp': True})
+
+print(res_bfgs_memo.x)
+print(rosen_stats)
+print(mo.hit_rate(rosen_stats))
+
+
+#--------------------------------------------------
+# The Rosenbrock function in many dimensions
+#--------------------------------------------------
+
+# The function rosen_hess() above builds the n x n Hessian matrix
+# with np.diag(), although only three of its diagonals are nonzero. 
+# The module rosenbrock.py stores the Hessian as a sparse matrix
+# and evaluates the function and the gradient
+# at many points at once, one in each row of an array. 
+
+import rosenbrock as rb
+
+x_rows = np.array([[1.0, 1.0, 1.0, 1.0, 1.0], 
+                   [1.3, 0.7, 0.8, 1.9, 1.2]])
+print(rb.rosen(x_rows))
+print(rb.rosen_der(x_rows))
+
+print(rb.rosen_hess(x0))
+print(rb.rosen_hess(x0).toarray() - rosen_hess(x0))
+
+x0_big = np.resize(x0, 10000)
+res_ncg_big = minimize(rb.rosen, x0_big, method='Newton-CG',
+                       jac=rb.rosen_der, hess=rb.rosen_hess,
+                       options={'xtol': 1e-8, 'disp': True})
+
+print(res_ncg_big.x)
+print(res_ncg_big.fun)
+
+# The script rosenbrock_time.py compares the time and memory
+# for each method as the number of dimensions grows, 
+# and whether each one actually reached the minimum: 
+# Nelder-Mead reports success for n = 10 at a value near 0.08. 
+
 # ... and many more ...
 
 
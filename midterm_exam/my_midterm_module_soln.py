@@ -49,6 +49,80 @@ import numpy as np
 
 # Only function definitions here - no other calculations. 
 
+# Validation
+
+# The functions below check their arguments in every call
+# and print error messages. 
+# When they are called many times with the same arguments, 
+# such as in a loop, the arguments can instead be checked
+# once with validate_consumer(), which raises an exception, 
+# and the functions can be called with check = False, 
+# which skips the checks. 
+# two_loop_bundle() does this itself with validate = 'upfront'. 
+
+
+class ConsumerError(ValueError):
+    """The arguments of the consumer functions are not valid."""
+
+
+class PriceError(ConsumerError):
+    """The prices are not positive."""
+
+
+class WealthError(ConsumerError):
+    """The wealth is negative."""
+
+
+class AlphaError(ConsumerError):
+    """The exponent alpha is not between zero and one."""
+
+
+class BundleError(ConsumerError):
+    """The quantities of goods are negative."""
+
+
+def validate_consumer(p_x: np.ndarray = None, p_y: np.ndarray = None, 
+                      w: np.ndarray = None, alpha: np.ndarray = None, 
+                      x: np.ndarray = None, y: np.ndarray = None) -> None:
+    """
+    Checks all of the elements of the arguments 
+    that are numbers or arrays, 
+    skipping the arguments that are None, 
+    and raises an exception for the first invalid argument: 
+    PriceError, WealthError, AlphaError or BundleError, 
+    which are all subclasses of ConsumerError and ValueError.
+    
+    >>> validate_consumer(p_x = np.array([10, 5]), p_y = 25, w = 100, alpha = 0.5)
+    >>> validate_consumer(p_x = np.array([10, -5, 0]), p_y = 25) # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    PriceError: 2 of 3 values of p_x are not positive.
+    >>> try:
+    ...     validate_consumer(w = 100, alpha = np.array([0.5, 1.5]))
+    ... except ConsumerError as err:
+    ...     print(type(err).__name__ + ': ' + str(err))
+    AlphaError: 1 of 2 values of alpha are not between zero and one.
+    
+    """
+    
+    checks = [['p_x', p_x, PriceError, lambda a: a > 0, 'positive'], 
+              ['p_y', p_y, PriceError, lambda a: a > 0, 'positive'], 
+              ['w', w, WealthError, lambda a: a >= 0, 'non-negative'], 
+              ['alpha', alpha, AlphaError, lambda a: (a >= 0) & (a <= 1), 
+               'between zero and one'], 
+              ['x', x, BundleError, lambda a: a >= 0, 'non-negative'], 
+              ['y', y, BundleError, lambda a: a >= 0, 'non-negative']]
+    
+    for name, value, error, is_valid, description in checks:
+        if value is not None:
+            value = np.asarray(value, dtype = float)
+            num_invalid = np.sum(~is_valid(value))
+            if num_invalid > 0:
+                raise error("{0} of {1} values of {2} are not {3}.".format(
+                    num_invalid, value.size, name, description))
+
+
+
 # Exercise 1
 
 # Sample function for sample script.
@@ -64,13 +138,15 @@ import numpy as np
 #     return None
 
 
-def in_budget(x: float, y: float, p_x: float, p_y: float, w: float) -> bool:
+def in_budget(x: float, y: float, p_x: float, p_y: float, w: float, 
+              check: bool = True) -> bool:
     """
     Preconditions: x, y, w >= 0 and p_x, p_y > 0
     
     Calculates returns a boolean indicator 
     of whether the consumer's expenditure 
     is less than or equal to wealth.
+    With check = False, the preconditions are not checked.
     
     >>> in_budget(3, 1, 10, 25, 100)
     True
@@ -78,10 +154,12 @@ def in_budget(x: float, y: float, p_x: float, p_y: float, w: float) -> bool:
     False
     >>> in_budget(5.0, 7.5, 5, 10, 100)
     True
+    >>> in_budget(5.0, 7.5, 5, 10, 100, check = False)
+    True
     
     """
     
-    if x < 0 or y < 0 or p_x <= 0 or p_y <= 0 or w < 0:
+    if check and (x < 0 or y < 0 or p_x <= 0 or p_y <= 0 or w < 0):
         print("Error: all arguments must be non-negative")
         print("and prices must be positive.")
         return None
@@ -92,12 +170,14 @@ def in_budget(x: float, y: float, p_x: float, p_y: float, w: float) -> bool:
 
 # Exercise 2
 
-def calc_bundle(p_x: float, p_y: float, w: float, alpha: float) -> float:
+def calc_bundle(p_x: float, p_y: float, w: float, alpha: float, 
+                check: bool = True) -> float:
     """
     Preconditions: w >= 0 and p_x, p_y > 0 and 0 <= alpha <= 1
     
     Calculates calculates the consumer's optimal bundle of goods
     for a consumer with Cobb-Douglass utility function.
+    With check = False, the preconditions are not checked.
     
     >>> calc_bundle(10, 25, 100, 0.5)
     [5.0, 2.0]
@@ -105,9 +185,11 @@ def calc_bundle(p_x: float, p_y: float, w: float, alpha: float) -> float:
     [4.0, 4.0]
     >>> calc_bundle(5, 10, 100, 0.25)
     [5.0, 7.5]
+    >>> calc_bundle(10, 25, 100, 0.5, check = False)
+    [5.0, 2.0]
     
     """
-    if p_x <= 0 or p_y <= 0 or w < 0 or alpha < 0 or alpha > 1:
+    if check and (p_x <= 0 or p_y <= 0 or w < 0 or alpha < 0 or alpha > 1):
         print("Error: all arguments must be non-negative")
         print("and prices must be positive")
         print("and alpha must be between zero and one.")
@@ -122,12 +204,14 @@ def calc_bundle(p_x: float, p_y: float, w: float, alpha: float) -> float:
 
 # Exercise 3
 
-def y_solve(x_star: type, p_x: float, p_y: float, w: float) -> float:
+def y_solve(x_star: type, p_x: float, p_y: float, w: float, 
+            check: bool = True) -> float:
     """
     Preconditions: w >= 0 and p_x, p_y > 0 and 0 <= x_star <= w/p_x
     
     Calculates the remaining expenditure on good y, 
     given an expenditure x_star in good x.
+    With check = False, the preconditions are not checked.
     
     >>> y_solve(5, 10, 25, 100)
     2.0
@@ -135,9 +219,11 @@ def y_solve(x_star: type, p_x: float, p_y: float, w: float) -> float:
     4.0
     >>> y_solve(5, 5, 10, 100)
     7.5
+    >>> y_solve(4, 10, 20, 120, check = False)
+    4.0
     
     """
-    if p_x <= 0 or p_y <= 0 or w < 0 or x_star < 0 or x_star > w/p_x:
+    if check and (p_x <= 0 or p_y <= 0 or w < 0 or x_star < 0 or x_star > w/p_x):
         print("Error: all arguments must be non-negative")
         print("and prices must be positive")
         print("and x_star must be less than w/p_x.")
@@ -151,8 +237,78 @@ def y_solve(x_star: type, p_x: float, p_y: float, w: float) -> float:
 # Exercise 4
 
 
+def golden_bundle(p_x: float, p_y: float, w: float, alpha: float, 
+                  tol: float = 10**(-10)) -> float:
+    """
+    Preconditions: w >= 0 and p_x, p_y > 0 and 0 <= alpha <= 1
+    
+    Calculates the consumer's optimal bundle of goods
+    for a consumer with Cobb-Douglass utility function.
+    It searches for x_star along the budget line
+    with the golden-section search, 
+    assigning the remaining wealth to y using y_solve, 
+    until the interval for x_star is narrower than tol*w/p_x. 
+    Each step keeps the part of the interval 
+    that must contain the optimum, since the utility 
+    rises and then falls along the budget line. 
+    
+    Since the utility is flat near the optimum, 
+    comparisons of utility cannot locate x_star 
+    more precisely than about 10**(-8)*w/p_x, 
+    which takes about 40 evaluations of the utility function. 
+    
+    >>> [round(v, 6) for v in golden_bundle(10, 25, 100, 0.5)]
+    [5.0, 2.0]
+    >>> [round(v, 6) for v in golden_bundle(10, 20, 120, 1.0/3.0)]
+    [4.0, 4.0]
+    >>> [round(v, 6) for v in golden_bundle(5, 10, 100, 0.25)]
+    [5.0, 7.5]
+    
+    """
+    if p_x <= 0 or p_y <= 0 or w < 0 or alpha < 0 or alpha > 1:
+        print("Error: all arguments must be non-negative")
+        print("and prices must be positive")
+        print("and alpha must be between zero and one.")
+        return None
+    
+    else:
+        # The arguments were checked above, so y_solve() can skip them.
+        # The golden ratio determines where to evaluate the utility
+        # so that one point can be reused in the next step. 
+        ratio = (5**0.5 - 1)/2
+        
+        a_i = 0.0
+        b_i = w/p_x
+        x_1 = b_i - ratio*(b_i - a_i)
+        x_2 = a_i + ratio*(b_i - a_i)
+        util_1 = x_1**alpha * y_solve(x_1, p_x, p_y, w, False)**(1 - alpha)
+        util_2 = x_2**alpha * y_solve(x_2, p_x, p_y, w, False)**(1 - alpha)
+        
+        while b_i - a_i > tol*w/p_x:
+            
+            if util_1 < util_2:
+                # The optimum is in [x_1, b_i].
+                a_i = x_1
+                x_1 = x_2
+                util_1 = util_2
+                x_2 = a_i + ratio*(b_i - a_i)
+                util_2 = x_2**alpha * y_solve(x_2, p_x, p_y, w, False)**(1 - alpha)
+            else:
+                # The optimum is in [a_i, x_2].
+                b_i = x_2
+                x_2 = x_1
+                util_2 = util_1
+                x_1 = b_i - ratio*(b_i - a_i)
+                util_1 = x_1**alpha * y_solve(x_1, p_x, p_y, w, False)**(1 - alpha)
+        
+        x_star = (a_i + b_i)/2
+        y_star = y_solve(x_star, p_x, p_y, w, False)
+        
+        return [x_star, y_star]
+
+
 def one_loop_bundle(p_x: float, p_y: float, w: float, alpha: float, 
-                    step: float) -> float:
+                    step: float, method: str = 'grid') -> float:
     """
     Preconditions: w >= 0 and p_x, p_y > 0 and 0 <= alpha <= 1
     
@@ -161,12 +317,18 @@ def one_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
     It searches over a loop on x_star and assigns the remaining
     wealth to y using y_solve.
     
+    With method = 'golden', it searches along the budget line
+    with golden_bundle() instead, to a tolerance 
+    that does not depend on step. 
+    
     >>> one_loop_bundle(10, 25, 100, 0.5, 0.01)
     [5.0, 2.0]
     >>> one_loop_bundle(10, 20, 120, 1.0/3.0, 0.01)
     [4.0, 4.0]
     >>> one_loop_bundle(5, 10, 100, 0.25, 0.01)
     [5.0, 7.5]
+    >>> [round(v, 6) for v in one_loop_bundle(5, 10, 100, 0.25, 0.01, 'golden')]
+    [5.0, 7.5]
     
     """
     if p_x <= 0 or p_y <= 0 or w < 0 or alpha < 0 or alpha > 1:
@@ -175,6 +337,9 @@ def one_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
         print("and alpha must be between zero and one.")
         return None
     
+    elif method == 'golden':
+        return golden_bundle(p_x, p_y, w, alpha)
+    
     else:
         max_util = -1
         x_star = None
@@ -184,7 +349,8 @@ def one_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
         
         for i in range(len(x_star_list)):
             x_i = x_star_list[i]
-            y_i = y_solve(x_i, p_x, p_y, w)
+            # The arguments were checked above.
+            y_i = y_solve(x_i, p_x, p_y, w, False)
             util_i = x_i**alpha * y_i**(1 - alpha)
             
             if util_i > max_util:
@@ -199,12 +365,14 @@ def one_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
 # Exercise 5
 
 def util_in_budget(x: float, y: float, p_x: float, p_y: float, 
-                   w: float, alpha: float) -> float:
+                   w: float, alpha: float, check: bool = True) -> float:
     """Calculates the value of the Cobb-Douglass utility
     function for consumption goods x and y with exponent alpha.
     It restricts x and y to non-negative values and 
     alpha to the unit interval.
     It also restricts the calculation to bundles [x, y] within budget w.
+    With check = False, only the budget is checked, 
+    and the other arguments should be checked with validate_consumer().
     
     The following examples evaluate to:
     math.sqrt(5)*math.sqrt(2)
@@ -217,7 +385,15 @@ def util_in_budget(x: float, y: float, p_x: float, p_y: float,
     4.0
     >>> util_in_budget(5.0, 7.5, 5, 10, 100, 0.25)
     6.777015027073836
+    >>> util_in_budget(5.0, 7.5, 5, 10, 90, 0.25, check = False)
+    0
     """
+    if not check:
+        if x*p_x + y*p_y <= w:
+            return x**(alpha)*y**(1 - alpha)
+        else:
+            return 0
+    
     # Several independent conditions for warning messages.
     if x < 0:
         print("Warning: x < 0. x should be non-negative.")
@@ -257,7 +433,7 @@ def util_in_budget(x: float, y: float, p_x: float, p_y: float,
 # Exercise 6
 
 def two_loop_bundle(p_x: float, p_y: float, w: float, alpha: float, 
-                    step: float) -> float:
+                    step: float, validate: str = 'loop') -> float:
     """
     Preconditions: w >= 0 and p_x, p_y > 0 and 0 <= alpha <= 1
     
@@ -267,6 +443,12 @@ def two_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
     
     Note that there is no error handling
     because that is taken care of in util_in_budget() and np.arange(). 
+    The validate argument determines how the arguments are checked: 
+        'loop' checks them in every call to util_in_budget() 
+            in the loops, which prints the error messages. 
+        'upfront' checks them once before the loops
+            with validate_consumer(), which raises a ConsumerError, 
+            and util_in_budget() skips the checks in the loops. 
     
     >>> two_loop_bundle(10, 25, 100, 0.5, 0.01)
     [5.0, 2.0]
@@ -274,9 +456,23 @@ def two_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
     [4.0, 4.0]
     >>> two_loop_bundle(5, 10, 100, 0.25, 0.01)
     [5.0, 7.5]
+    >>> two_loop_bundle(5, 10, 100, 1.25, 0.01, validate = 'upfront') # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    AlphaError: 1 of 1 values of alpha are not between zero and one.
+    >>> two_loop_bundle(10, 25, 100, 0.5, 0.01, validate = 'never')
+    Error: validate must be 'loop' or 'upfront'.
     
     """
     
+    if validate == 'upfront':
+        validate_consumer(p_x = p_x, p_y = p_y, w = w, alpha = alpha)
+    elif validate != 'loop':
+        print("Error: validate must be 'loop' or 'upfront'.")
+        return None
+    # Check the arguments in the loops only if they were not checked above.
+    check = validate == 'loop'
+    
     # Define grid of parameters for search.
     x_star_list = np.arange(0, w/p_x, step)
     y_star_list = np.arange(0, w/p_y, step)
@@ -297,7 +493,7 @@ def two_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
             y_j = y_star_list[j]
             
             # Calculate candidate value of utility function.
-            util_ij = util_in_budget(x_i, y_j, p_x, p_y, w, alpha)
+            util_ij = util_in_budget(x_i, y_j, p_x, p_y, w, alpha, check)
             
             # Replace values if SSR_ij is a new high.
             if util_ij > max_util:
@@ -318,6 +514,198 @@ def two_loop_bundle(p_x: float, p_y: float, w: float, alpha: float,
 
 
 
+# Demand for a market of consumers
+
+# The following functions calculate the optimal bundles
+# for arrays of prices, wealth and parameters at once, 
+# one element for each consumer. 
+# Instead of printing error messages, they return np.nan 
+# for the consumers with invalid arguments. 
+
+
+def calc_bundle_vec(p_x: np.ndarray, p_y: np.ndarray, w: np.ndarray, 
+                    alpha: np.ndarray) -> list:
+    """
+    Calculates the optimal bundles [x_star, y_star] 
+    for consumers with Cobb-Douglass utility functions,
+    as in calc_bundle(), for arrays of prices, 
+    wealth and alpha of the same shape, or numbers. 
+    
+    >>> calc_bundle_vec(np.array([10, 10, 5]), np.array([25, 20, 10]), \
+                        np.array([100, 120, 100]), np.array([0.5, 0.25, 0.25]))
+    [array([5., 3., 5.]), array([2. , 4.5, 7.5])]
+    >>> calc_bundle_vec(10, 25, np.array([100, 200]), 0.5)
+    [array([ 5., 10.]), array([2., 4.])]
+    >>> calc_bundle_vec(np.array([10, -10]), 25, 100, np.array([0.5, 2.0]))
+    [array([ 5., nan]), array([ 2., nan])]
+    
+    """
+    
+    p_x, p_y, w, alpha = np.broadcast_arrays(*[np.asarray(a, dtype = float) 
+                                               for a in [p_x, p_y, w, alpha]])
+    valid = (p_x > 0) & (p_y > 0) & (w >= 0) & (alpha >= 0) & (alpha <= 1)
+    
+    x_star = np.where(valid, alpha*w/np.where(valid, p_x, 1.0), np.nan)
+    y_star = np.where(valid, (1 - alpha)*w/np.where(valid, p_y, 1.0), np.nan)
+    
+    return [x_star, y_star]
+
+
+def cobb_douglas_util(x: np.ndarray, y: np.ndarray, 
+                      alpha: np.ndarray) -> np.ndarray:
+    """
+    Calculates the value of the Cobb-Douglass utility function
+    for arrays of goods x and y with exponents alpha, 
+    which are broadcast against each other. 
+    
+    >>> cobb_douglas_util(np.array([4.0, 5.0]), np.array([4.0, 7.5]), \
+                          np.array([1.0/3.0, 0.25])).round(6)
+    array([4.      , 6.777015])
+    >>> cobb_douglas_util(np.array([[1.0], [4.0]]), np.array([[1.0, 9.0]]), 0.5)
+    array([[1., 3.],
+           [2., 6.]])
+    >>> float(cobb_douglas_util(0.0, 2.0, 0.5))
+    0.0
+    
+    """
+    
+    return x**alpha * y**(1 - alpha)
+
+
+def grid_bundle_vec(p_x: np.ndarray, p_y: np.ndarray, w: np.ndarray, 
+                    step: float, utility = cobb_douglas_util, 
+                    args: tuple = (), max_cells: int = 10**7) -> list:
+    """
+    Calculates the optimal bundles [x_star, y_star] 
+    for consumers with utility functions utility(x, y, *args)
+    by grid search, as in two_loop_bundle(), 
+    for vectors of prices and wealth, 
+    and parameters in args that are numbers or vectors, 
+    with one element for each consumer. 
+    Numbers for p_x, p_y and w are treated as vectors 
+    for a single consumer. 
+    
+    The utility is calculated at once on a grid of x and y 
+    that covers the budgets of all consumers. 
+    Each consumer is restricted to the grid values in 
+    np.arange(0, w/p_x, step) and np.arange(0, w/p_y, step), 
+    bundles outside the budget have utility zero, 
+    as in util_in_budget(), 
+    and ties are broken in favor of the first bundle 
+    in the order of the loops in two_loop_bundle(). 
+    The consumers are divided into groups so that 
+    each grid of utility has at most about max_cells elements.
+    
+    >>> grid_bundle_vec(np.array([10, 10, 5]), np.array([25, 20, 10]), \
+                        np.array([100, 120, 100]), 0.01, \
+                        args = (np.array([0.5, 1.0/3.0, 0.25]),))
+    [array([5., 4., 5.]), array([2. , 4. , 7.5])]
+    >>> max_util = lambda x, y: np.maximum(x, y)
+    >>> grid_bundle_vec(np.array([10.0]), np.array([20.0]), np.array([100.0]), \
+                        1.0, utility = max_util)
+    [array([9.]), array([0.])]
+    >>> grid_bundle_vec(np.array([10.0, 10.0]), np.array([20.0, 20.0]), \
+                        np.array([100.0, 0.0]), 1.0, args = (0.5,))
+    [array([ 4., nan]), array([ 3., nan])]
+    
+    """
+    
+    p_x, p_y, w = np.broadcast_arrays(*[np.atleast_1d(np.asarray(a, dtype = float)) 
+                                        for a in [p_x, p_y, w]])
+    valid = (p_x > 0) & (p_y > 0) & (w >= 0)
+    
+    # The number of values in np.arange(0, w/p_x, step) for each consumer.
+    x_max = np.where(valid, w/np.where(valid, p_x, 1.0), 0.0)
+    y_max = np.where(valid, w/np.where(valid, p_y, 1.0), 0.0)
+    num_x = np.ceil(x_max/step).astype(int)
+    num_y = np.ceil(y_max/step).astype(int)
+    
+    # One grid that covers the budgets of all consumers. 
+    x_star_list = np.arange(0, np.max(x_max, initial = 0.0), step)
+    y_star_list = np.arange(0, np.max(y_max, initial = 0.0), step)
+    x_grid = x_star_list[None, :, None]
+    y_grid = y_star_list[None, None, :]
+    
+    x_star = np.full(w.shape, np.nan)
+    y_star = np.full(w.shape, np.nan)
+    
+    num_cells = max(1, len(x_star_list)*len(y_star_list))
+    chunk_size = max(1, max_cells//num_cells)
+    
+    for start in range(0, len(w), chunk_size):
+        
+        chunk = slice(start, start + chunk_size)
+        # Parameters for this group of consumers. 
+        args_chunk = [np.asarray(a)[chunk, None, None] if np.ndim(a) > 0 else a 
+                      for a in args]
+        
+        util = np.array(utility(x_grid, y_grid, *args_chunk), dtype = float)
+        util = np.broadcast_to(util, (len(w[chunk]), len(x_star_list), 
+                                      len(y_star_list))).copy()
+        
+        # Bundles outside the budget have zero utility.
+        in_budget_grid = (x_grid*p_x[chunk, None, None] + 
+                          y_grid*p_y[chunk, None, None] <= w[chunk, None, None])
+        util[~in_budget_grid] = 0
+        # Bundles outside each consumer's own grid are never chosen.
+        outside = ((np.arange(len(x_star_list))[None, :, None] >= 
+                    num_x[chunk, None, None]) | 
+                   (np.arange(len(y_star_list))[None, None, :] >= 
+                    num_y[chunk, None, None]))
+        util[outside] = -np.inf
+        
+        # The first highest value, in the order of the loops. 
+        k_max = np.argmax(util.reshape(len(w[chunk]), -1), axis = 1)
+        i_max, j_max = np.unravel_index(k_max, util.shape[1:])
+        
+        found = valid[chunk] & (num_x[chunk] > 0) & (num_y[chunk] > 0)
+        x_star[chunk] = np.where(found, x_star_list[i_max] if len(x_star_list) > 0 
+                                 else np.nan, np.nan)
+        y_star[chunk] = np.where(found, y_star_list[j_max] if len(y_star_list) > 0 
+                                 else np.nan, np.nan)
+    
+    return [x_star, y_star]
+
+
+def market_bundle(p_x: np.ndarray, p_y: np.ndarray, w: np.ndarray, 
+                  alpha: np.ndarray = None, utility = None, args: tuple = (), 
+                  step: float = 0.01, max_cells: int = 10**7) -> list:
+    """
+    Calculates the optimal bundles [x_star, y_star] 
+    for a market of consumers with prices p_x and p_y and wealth w.
+    If the utility function is not specified, the consumers have 
+    Cobb-Douglass utility functions with exponents alpha 
+    and the bundles are calculated with the formula in calc_bundle_vec(). 
+    Otherwise, the bundles are calculated with grid_bundle_vec(), 
+    for the utility function utility(x, y, *args), 
+    on grids with spacing step. 
+    
+    >>> market_bundle(np.array([10, 5]), np.array([25, 10]), \
+                      np.array([100, 100]), np.array([0.5, 0.25]))
+    [array([5., 5.]), array([2. , 7.5])]
+    >>> market_bundle(np.array([10, 5]), np.array([25, 10]), \
+                      np.array([100, 100]), utility = cobb_douglas_util, \
+                      args = (np.array([0.5, 0.25]),))
+    [array([5., 5.]), array([2. , 7.5])]
+    >>> market_bundle(10, 25, 100, utility = cobb_douglas_util, args = (0.5,))
+    [array([5.]), array([2.])]
+    >>> rng = np.random.default_rng(3004)
+    >>> x_star, y_star = market_bundle(rng.uniform(1, 10, 10**6), 
+    ...                                rng.uniform(1, 10, 10**6), 
+    ...                                rng.uniform(50, 150, 10**6), 
+    ...                                rng.uniform(0, 1, 10**6))
+    >>> x_star.shape
+    (1000000,)
+    
+    """
+    
+    if utility is None:
+        return calc_bundle_vec(p_x, p_y, w, alpha)
+    else:
+        return grid_bundle_vec(p_x, p_y, w, step, utility, args, max_cells)
+
+
+
 # Only function definitions above this point. 
 
 
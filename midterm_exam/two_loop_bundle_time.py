@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# ECP 3004: Python for Business Analytics
+#
+# Timing the Checks in the Grid Search for the Optimal Bundle
+#
+# Lealand Morin, Ph.D.
+# Assistant Professor
+# Department of Economics
+# College of Business Administration
+# University of Central Florida
+#
+# October 18, 2026
+#
+# This script compares the time to calculate the optimal bundle
+# with two_loop_bundle(), which calls util_in_budget()
+# for every bundle on the grid,
+# when the arguments are checked in every call (validate = 'loop')
+# and when they are checked once with validate_consumer()
+# (validate = 'upfront').
+#
+##################################################
+"""
+
+import time
+
+from my_midterm_module_soln import two_loop_bundle
+
+
+def time_bundle(p_x, p_y, w, alpha, step, validate):
+    """ (float, float, float, float, float, str) -> list
+
+    Return the list [bundle, milliseconds] for calculating
+    the optimal bundle with two_loop_bundle().
+    """
+
+    t1 = time.perf_counter()
+    bundle = two_loop_bundle(p_x, p_y, w, alpha, step, validate)
+    t2 = time.perf_counter()
+
+    return [bundle, (t2 - t1) * 1000.0]
+
+
+def print_times(step):
+    """ (float) -> NoneType
+
+    Print the number of milliseconds it takes to calculate
+    the optimal bundle on a grid with spacing step,
+    with and without the checks in every call,
+    and the ratio of the times.
+    """
+
+    bundle_check, check_time = time_bundle(10, 20, 120, 1.0/3.0, step, 'loop')
+    bundle_quiet, quiet_time = time_bundle(10, 20, 120, 1.0/3.0, step, 'upfront')
+
+    # The checks should not change the result.
+    assert bundle_check == bundle_quiet
+
+    print("{0:8.3f}\t{1:10.1f}\t{2:10.1f}\t{3:6.2f}".format(
+            step, check_time, quiet_time, check_time/quiet_time))
+
+
+if __name__ == '__main__':
+
+    print("Milliseconds to calculate the optimal bundle")
+    print('step', 'check', 'validated', 'ratio', sep='\t\t')
+    for step in [0.1, 0.05, 0.02, 0.01]:
+        print_times(step)